@@ -1,5 +1,7 @@
 """Persistence layer exports."""
 
+from .indexes import HashIndex, SortedIndex
+from .place_index import PlaceColumnIndex
 from .repository import InMemoryRepository
 
-__all__ = ["InMemoryRepository"]
+__all__ = ["HashIndex", "InMemoryRepository", "PlaceColumnIndex", "SortedIndex"]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_MISSING = object()
+_VALUE = itemgetter(0)
+
+
+class HashIndex:
+    """Equality index mapping a field value to the ids holding it."""
+
+    def __init__(self, field: str, unique: bool = False) -> None:
+        self.field = field
+        self.unique = unique
+        self._buckets: Dict[Any, Dict[str, None]] = {}
+        self._values: Dict[str, Any] = {}
+
+    def check(self, entity_id: str, value: Any) -> None:
+        """Raise if storing `value` for `entity_id` would break uniqueness."""
+
+        if not self.unique:
+            return
+        holders = self._buckets.get(value)
+        if holders and any(holder != entity_id for holder in holders):
+            raise ValueError(f"{self.field} must be unique")
+
+    def add(self, entity_id: str, value: Any) -> None:
+        self._values[entity_id] = value
+        self._buckets.setdefault(value, {})[entity_id] = None
+
+    def remove(self, entity_id: str) -> None:
+        value = self._values.pop(entity_id, _MISSING)
+        if value is _MISSING:
+            return
+        bucket = self._buckets.get(value)
+        if bucket is not None:
+            bucket.pop(entity_id, None)
+            if not bucket:
+                del self._buckets[value]
+
+    def lookup(self, value: Any) -> List[str]:
+        return list(self._buckets.get(value, ()))
+
+    def count(self, value: Any) -> int:
+        return len(self._buckets.get(value, ()))
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._values.clear()
+
+
+class SortedIndex:
+    """Ordered `(value, id)` list supporting equality and range lookups via bisect."""
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self.unique = False
+        self._entries: List[Tuple[Any, str]] = []
+        self._values: Dict[str, Any] = {}
+
+    def check(self, entity_id: str, value: Any) -> None:
+        return None
+
+    def add(self, entity_id: str, value: Any) -> None:
+        if value is None:
+            # None does not order against other values; keep it out of the list
+            self._values[entity_id] = None
+            return
+        self._values[entity_id] = value
+        insort(self._entries, (value, entity_id))
+
+    def remove(self, entity_id: str) -> None:
+        value = self._values.pop(entity_id, _MISSING)
+        if value is _MISSING or value is None:
+            return
+        position = bisect_left(self._entries, (value, entity_id))
+        if position < len(self._entries) and self._entries[position] == (value, entity_id):
+            del self._entries[position]
+
+    def lookup(self, value: Any) -> List[str]:
+        if value is None:
+            return [entity_id for entity_id, indexed in self._values.items() if indexed is None]
+        return self.range(value, value)
+
+    def count(self, value: Any) -> int:
+        return len(self.lookup(value))
+
+    def range(
+        self,
+        low: Optional[Any] = None,
+        high: Optional[Any] = None,
+    ) -> List[str]:
+        """Return ids whose value lies in `[low, high]`, ordered by value."""
+
+        if low is None and high is None:
+            return [entity_id for _, entity_id in self._entries]
+        start = 0 if low is None else bisect_left(self._entries, low, key=_VALUE)
+        end = len(self._entries) if high is None else bisect_right(self._entries, high, key=_VALUE)
+        return [entity_id for _, entity_id in self._entries[start:end]]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._values.clear()
+
+
+def build_indexes(indexes: Iterable[HashIndex | SortedIndex]) -> Dict[str, HashIndex | SortedIndex]:
+    """Key declared indexes by field, rejecting duplicates."""
+
+    by_field: Dict[str, HashIndex | SortedIndex] = {}
+    for index in indexes:
+        if index.field in by_field:
+            raise ValueError(f"Duplicate index on {index.field}")
+        by_field[index.field] = index
+    return by_field
+
+
+__all__ = ["HashIndex", "SortedIndex", "build_indexes"]
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.models import Place
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+class PlaceColumnIndex:
+    """Columnar snapshot of places for vectorized filtering.
+
+    Prices and coordinates live in NumPy arrays. Amenities are an inverted
+    index of posting sets (amenity id -> rows), so "has all these amenities"
+    is a set intersection starting from the shortest list and the remaining
+    filters only look at its survivors. Rows keep insertion order so results
+    match the repository's listing order. Deleted rows are tombstoned and
+    compacted once they make up half of the arrays.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._ids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0
+        self._dead = 0
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._lat = np.empty(capacity, dtype=np.float64)
+        self._lng = np.empty(capacity, dtype=np.float64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._postings: Dict[str, Set[int]] = {}
+        self._row_amenities: Dict[int, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # Maintenance
+    def upsert(self, place: Place) -> None:
+        """Insert a place or refresh its row in place."""
+
+        row = self._rows.get(place.id)
+        if row is None:
+            row = self._append(place.id)
+        self._price[row] = place.price
+        self._lat[row] = place.latitude
+        self._lng[row] = place.longitude
+        self._unpost(row)
+        amenity_ids = tuple(dict.fromkeys(amenity.id for amenity in place.amenities))
+        for amenity_id in amenity_ids:
+            self._postings.setdefault(amenity_id, set()).add(row)
+        if amenity_ids:
+            self._row_amenities[row] = amenity_ids
+
+    def remove(self, place_id: str) -> bool:
+        """Tombstone a place's row."""
+
+        row = self._rows.pop(place_id, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        self._ids[row] = None
+        self._unpost(row)
+        self._dead += 1
+        if self._dead * 2 >= self._size:
+            self._compact()
+        return True
+
+    def remove_amenity(self, amenity_id: str) -> None:
+        """Drop an amenity's posting list."""
+
+        for row in self._postings.pop(amenity_id, ()):
+            remaining = tuple(other for other in self._row_amenities[row] if other != amenity_id)
+            if remaining:
+                self._row_amenities[row] = remaining
+            else:
+                del self._row_amenities[row]
+
+    # Queries
+    def query(
+        self,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        lat: float | None = None,
+        lng: float | None = None,
+        radius: float | None = None,
+        amenity_ids: Iterable[str] | None = None,
+    ) -> List[str]:
+        """Return ids of places matching every provided filter, in insertion order.
+
+        `radius` is a great-circle distance in kilometres around `lat`/`lng`.
+        """
+
+        size = self._size
+        if amenity_ids:
+            rows = self._intersect_postings(amenity_ids)
+            if rows.size == 0:
+                return []
+            mask = np.ones(rows.size, dtype=bool)
+        else:
+            rows = None
+            mask = self._alive[:size].copy()
+
+        prices = self._price[:size] if rows is None else self._price[rows]
+        latitudes = self._lat[:size] if rows is None else self._lat[rows]
+        if min_price is not None:
+            mask &= prices >= min_price
+        if max_price is not None:
+            mask &= prices <= max_price
+        by_distance = lat is not None and lng is not None and radius is not None
+        if by_distance:
+            # Cheap latitude band first, exact haversine only on survivors
+            band = float(np.degrees(radius / EARTH_RADIUS_KM))
+            mask &= latitudes >= lat - band
+            mask &= latitudes <= lat + band
+        rows = np.flatnonzero(mask) if rows is None else rows[mask]
+        if by_distance:
+            rows = rows[self._distances_km(lat, lng, rows) <= radius]
+        return [self._ids[row] for row in rows]
+
+    # Internals
+    def _distances_km(self, lat: float, lng: float, rows: np.ndarray) -> np.ndarray:
+        phi1 = np.radians(lat)
+        phi2 = np.radians(self._lat[rows])
+        d_phi = phi2 - phi1
+        d_lambda = np.radians(self._lng[rows] - lng)
+        a = np.sin(d_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    def _intersect_postings(self, amenity_ids: Iterable[str]) -> np.ndarray:
+        postings = [self._postings.get(amenity_id) for amenity_id in set(amenity_ids)]
+        if any(not posting for posting in postings):
+            return np.empty(0, dtype=np.intp)
+        postings.sort(key=len)
+        rows = set(postings[0])
+        for posting in postings[1:]:
+            rows.intersection_update(posting)
+            if not rows:
+                break
+        return np.sort(np.fromiter(rows, dtype=np.intp, count=len(rows)))
+
+    def _unpost(self, row: int) -> None:
+        for amenity_id in self._row_amenities.pop(row, ()):
+            posting = self._postings.get(amenity_id)
+            if posting is not None:
+                posting.discard(row)
+                if not posting:
+                    del self._postings[amenity_id]
+
+    def _append(self, place_id: str) -> int:
+        if self._size == len(self._price):
+            self._resize(max(1024, self._size * 2))
+        row = self._size
+        self._size += 1
+        self._ids.append(place_id)
+        self._rows[place_id] = row
+        self._alive[row] = True
+        return row
+
+    def _resize(self, capacity: int) -> None:
+        size = self._size
+        for name in ("_price", "_lat", "_lng", "_alive"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:size] = old[:size]
+            setattr(self, name, new)
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive[: self._size])
+        count = len(keep)
+        self._price[:count] = self._price[keep]
+        self._lat[:count] = self._lat[keep]
+        self._lng[:count] = self._lng[keep]
+        self._alive[:count] = True
+        self._alive[count:] = False
+        self._ids = [self._ids[row] for row in keep]
+        self._rows = {place_id: row for row, place_id in enumerate(self._ids)}
+        renumbered = {int(old): new for new, old in enumerate(keep)}
+        self._row_amenities = {
+            renumbered[row]: amenity_ids for row, amenity_ids in self._row_amenities.items()
+        }
+        self._postings = {
+            amenity_id: {renumbered[row] for row in rows}
+            for amenity_id, rows in self._postings.items()
+        }
+        self._size = count
+        self._dead = 0
+
+
+__all__ = ["EARTH_RADIUS_KM", "PlaceColumnIndex"]
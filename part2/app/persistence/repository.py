@@ -1,20 +1,33 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar
 
 from app.models import BaseModel
 
+from .indexes import HashIndex, SortedIndex, build_indexes
+
 T = TypeVar("T", bound=BaseModel)
 
 
 class InMemoryRepository(Generic[T]):
-    """Simple in-memory repository for entities with string IDs."""
+    """Simple in-memory repository for entities with string IDs.
+
+    Declared `HashIndex`/`SortedIndex` secondary indexes are refreshed on every
+    `save` and `delete`; call `save` again after mutating an indexed field.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, indexes: Iterable[HashIndex | SortedIndex] = ()) -> None:
         self._items: Dict[str, T] = {}
+        self._indexes = build_indexes(indexes)
 
     # CRUD
     def save(self, entity: T) -> T:
+        values = {field: getattr(entity, field, None) for field in self._indexes}
+        for field, index in self._indexes.items():
+            index.check(entity.id, values[field])
+        for field, index in self._indexes.items():
+            index.remove(entity.id)
+            index.add(entity.id, values[field])
         self._items[entity.id] = entity
         return entity
 
@@ -22,6 +35,8 @@ class InMemoryRepository(Generic[T]):
         return self._items.get(entity_id)
 
     def delete(self, entity_id: str) -> bool:
+        for index in self._indexes.values():
+            index.remove(entity_id)
         return self._items.pop(entity_id, None) is not None
 
     def list(self) -> List[T]:
@@ -29,6 +44,8 @@ class InMemoryRepository(Generic[T]):
 
     def clear(self) -> None:
         self._items.clear()
+        for index in self._indexes.values():
+            index.clear()
 
     # Queries
     def find_first(self, predicate: Callable[[T], bool]) -> Optional[T]:
@@ -40,16 +57,46 @@ class InMemoryRepository(Generic[T]):
     def find_by_fields(self, **kwargs) -> Optional[T]:
         """Find first entity whose attributes match all provided kwargs."""
 
-        def matches(item: T) -> bool:
-            return all(getattr(item, key, None) == value for key, value in kwargs.items())
-
-        return self.find_first(matches)
+        candidates = self._indexed_candidates(kwargs)
+        if candidates is None:
+            return self.find_first(lambda item: self._matches(item, kwargs))
+        return next((item for item in candidates if self._matches(item, kwargs)), None)
 
     def filter_by_fields(self, **kwargs) -> List[T]:
-        def matches(item: T) -> bool:
-            return all(getattr(item, key, None) == value for key, value in kwargs.items())
-
-        return self.filter(matches)
+        candidates = self._indexed_candidates(kwargs)
+        if candidates is None:
+            return self.filter(lambda item: self._matches(item, kwargs))
+        return [item for item in candidates if self._matches(item, kwargs)]
+
+    def filter_by_range(self, field: str, low: Any = None, high: Any = None) -> List[T]:
+        """Return entities whose `field` lies in `[low, high]`, ordered by that field."""
+
+        index = self._indexes.get(field)
+        if isinstance(index, SortedIndex):
+            return [self._items[entity_id] for entity_id in index.range(low, high)]
+
+        def in_range(item: T) -> bool:
+            value = getattr(item, field, None)
+            if value is None:
+                return False
+            return (low is None or value >= low) and (high is None or value <= high)
+
+        return sorted(self.filter(in_range), key=lambda item: getattr(item, field))
+
+    # Internals
+    @staticmethod
+    def _matches(item: T, criteria: Dict[str, Any]) -> bool:
+        return all(getattr(item, key, None) == value for key, value in criteria.items())
+
+    def _indexed_candidates(self, criteria: Dict[str, Any]) -> Optional[List[T]]:
+        """Resolve candidates through the most selective index, or `None` to scan."""
+
+        indexed = [field for field in criteria if field in self._indexes]
+        if not indexed:
+            return None
+        field = min(indexed, key=lambda name: self._indexes[name].count(criteria[name]))
+        entity_ids = self._indexes[field].lookup(criteria[field])
+        return [self._items[entity_id] for entity_id in entity_ids]
 
 
 __all__ = ["InMemoryRepository"]
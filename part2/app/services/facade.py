@@ -1,26 +1,29 @@
 from __future__ import annotations
 
-from math import sqrt
 from typing import Any, Dict, List, Optional
 
 from app.models import Amenity, Place, Review, User
-from app.persistence import InMemoryRepository
-
-
-def _haversine_like(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Very rough Euclidean distance for demo (not real haversine)."""
-
-    return sqrt((lat1 - lat2) ** 2 + (lng1 - lng2) ** 2)
+from app.persistence import HashIndex, InMemoryRepository, PlaceColumnIndex, SortedIndex
 
 
 class HBnBFacade:
     """Facade coordinating domain logic and repositories."""
 
     def __init__(self) -> None:
-        self.users = InMemoryRepository[User]()
-        self.places = InMemoryRepository[Place]()
-        self.reviews = InMemoryRepository[Review]()
-        self.amenities = InMemoryRepository[Amenity]()
+        self.users = InMemoryRepository[User](indexes=[HashIndex("email", unique=True)])
+        self.places = InMemoryRepository[Place](
+            indexes=[
+                HashIndex("owner_id"),
+                SortedIndex("price"),
+                SortedIndex("created_at"),
+            ]
+        )
+        self.reviews = InMemoryRepository[Review](
+            indexes=[HashIndex("place_id"), HashIndex("user_id")]
+        )
+        self.amenities = InMemoryRepository[Amenity](indexes=[HashIndex("name")])
+        # Columnar copy of place price/location/amenities for list filters
+        self.place_index = PlaceColumnIndex()
 
     # Users
     def register_user(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -41,6 +44,9 @@ class HBnBFacade:
         user = self.users.get(user_id)
         if not user:
             return None
+        email = data.get("email")
+        if email is not None and email != user.email and self.users.find_by_fields(email=email):
+            raise ValueError("Email already registered")
         user.update_profile(
             first_name=data.get("first_name"),
             last_name=data.get("last_name"),
@@ -49,6 +55,7 @@ class HBnBFacade:
         )
         if "is_admin" in data:
             user.is_admin = data["is_admin"]
+        self.users.save(user)
         return user.to_dict()
 
     def delete_user(self, user_id: str) -> bool:
@@ -85,6 +92,7 @@ class HBnBFacade:
             return None
         if "name" in data:
             amenity.rename(data["name"])
+            self.amenities.save(amenity)
         return amenity.to_dict()
 
     def delete_amenity(self, amenity_id: str) -> bool:
@@ -96,6 +104,7 @@ class HBnBFacade:
             if amenity in place.amenities:
                 place.amenities.remove(amenity)
                 place.touch()
+        self.place_index.remove_amenity(amenity_id)
         return self.amenities.delete(amenity_id)
 
     # Places
@@ -121,31 +130,27 @@ class HBnBFacade:
             amenities=amenity_objs,
         )
         self.places.save(place)
+        self.place_index.upsert(place)
         owner.add_place(place)
         return self._place_to_dict(place)
 
     def list_places(self, filters: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
-        filters = filters or {}
+        """List places matching price, radius (km) and amenity filters.
 
-        def matches(place: Place) -> bool:
-            if (min_price := filters.get("min_price")) is not None and place.price < min_price:
-                return False
-            if (max_price := filters.get("max_price")) is not None and place.price > max_price:
-                return False
-            lat = filters.get("lat")
-            lng = filters.get("lng")
-            radius = filters.get("radius")
-            if lat is not None and lng is not None and radius is not None:
-                if _haversine_like(lat, lng, place.latitude, place.longitude) > radius:
-                    return False
-            amenity_ids = filters.get("amenity_ids")
-            if amenity_ids:
-                place_ids = {a.id for a in place.amenities}
-                if not set(amenity_ids).issubset(place_ids):
-                    return False
-            return True
-
-        return [self._place_to_dict(p) for p in self.places.filter(matches)]
+        Filtering runs as one vectorized mask over the columnar place index;
+        only the matching places are serialized.
+        """
+
+        filters = filters or {}
+        place_ids = self.place_index.query(
+            min_price=filters.get("min_price"),
+            max_price=filters.get("max_price"),
+            lat=filters.get("lat"),
+            lng=filters.get("lng"),
+            radius=filters.get("radius"),
+            amenity_ids=filters.get("amenity_ids"),
+        )
+        return [self._place_to_dict(self.places.get(place_id)) for place_id in place_ids]
 
     def get_place(self, place_id: str) -> Optional[Dict[str, Any]]:
         place = self.places.get(place_id)
@@ -170,6 +175,8 @@ class HBnBFacade:
             if field in data and data[field] is not None:
                 updates[field] = data[field]
         place.update_place(**updates)
+        self.places.save(place)
+        self.place_index.upsert(place)
         return self._place_to_dict(place)
 
     def delete_place(self, place_id: str) -> bool:
@@ -186,6 +193,7 @@ class HBnBFacade:
         for review in list(place.reviews):
             self.delete_review(review.id)
 
+        self.place_index.remove(place_id)
         return self.places.delete(place_id)
 
     # Reviews
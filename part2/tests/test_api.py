@@ -162,3 +162,62 @@ def test_review_validation(client):
     # bad rating
     resp = _create_review(client, user_id=user["id"], place_id=place["id"], rating=0, comment="bad")
     assert resp.status_code == 400
+
+
+def test_place_list_filters_use_price_radius_and_amenities(client):
+    user = _create_user(client, email="dana@example.com")
+    wifi = _create_amenity(client, name="Wifi")
+    pool = _create_amenity(client, name="Pool")
+    near = _create_place(client, owner_id=user["id"], amenity_ids=[wifi["id"], pool["id"]])
+    far = client.post(
+        "/api/v1/places",
+        json={
+            "name": "Cabin",
+            "price": 300.0,
+            "latitude": 12.0,
+            "longitude": 20.0,
+            "owner_id": user["id"],
+            "amenity_ids": [wifi["id"]],
+        },
+    )
+    near_id = near.get_json()["id"]
+    far_id = far.get_json()["id"]
+
+    def ids(query):
+        resp = client.get(f"/api/v1/places?{query}")
+        assert resp.status_code == 200
+        return [place["id"] for place in resp.get_json()]
+
+    assert ids("") == [near_id, far_id]
+    assert ids("max_price=150") == [near_id]
+    # 2 degrees of latitude is roughly 222 km
+    assert ids("lat=10&lng=20&radius=50") == [near_id]
+    assert ids("lat=10&lng=20&radius=250") == [near_id, far_id]
+    assert ids(f"amenity_id={wifi['id']}&amenity_id={pool['id']}") == [near_id]
+    assert ids("amenity_id=missing") == []
+
+    # updates are reflected in the index
+    resp = client.put(f"/api/v1/places/{far_id}", json={"price": 90.0})
+    assert resp.status_code == 200
+    assert ids("max_price=150") == [near_id, far_id]
+
+
+def test_user_update_rejects_taken_email(client):
+    _create_user(client, email="erin@example.com")
+    frank = _create_user(client, email="frank@example.com")
+
+    resp = client.put(f"/api/v1/users/{frank['id']}", json={"email": "erin@example.com"})
+    assert resp.status_code == 400
+
+    resp = client.put(f"/api/v1/users/{frank['id']}", json={"email": "frankie@example.com"})
+    assert resp.status_code == 200
+    resp = client.post(
+        "/api/v1/users",
+        json={
+            "first_name": "Frank",
+            "last_name": "Doe",
+            "email": "frank@example.com",
+            "password": "secret",
+        },
+    )
+    assert resp.status_code == 201
@@ -0,0 +1,70 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.models import Place, User
+from app.persistence import HashIndex, InMemoryRepository, SortedIndex
+
+
+def _user(email):
+    return User(first_name="Test", last_name="User", email=email, password="secret")
+
+
+def _place(price, owner_id="owner-1", created_at=None):
+    return Place(
+        name="Place",
+        description=None,
+        price=price,
+        latitude=0.0,
+        longitude=0.0,
+        owner_id=owner_id,
+        created_at=created_at,
+    )
+
+
+def test_hash_index_tracks_save_update_and_delete():
+    repo = InMemoryRepository[User](indexes=[HashIndex("email", unique=True)])
+    alice = repo.save(_user("alice@example.com"))
+    repo.save(_user("bob@example.com"))
+
+    assert repo.find_by_fields(email="alice@example.com") is alice
+
+    alice.update_profile(email="alicia@example.com")
+    repo.save(alice)
+    assert repo.find_by_fields(email="alice@example.com") is None
+    assert repo.find_by_fields(email="alicia@example.com") is alice
+
+    with pytest.raises(ValueError):
+        repo.save(_user("bob@example.com"))
+
+    repo.delete(alice.id)
+    assert repo.find_by_fields(email="alicia@example.com") is None
+
+
+def test_non_unique_and_sorted_indexes():
+    base = datetime(2024, 1, 1)
+    repo = InMemoryRepository[Place](
+        indexes=[HashIndex("owner_id"), SortedIndex("price"), SortedIndex("created_at")]
+    )
+    cheap = repo.save(_place(50.0, created_at=base))
+    mid = repo.save(_place(100.0, owner_id="owner-2", created_at=base + timedelta(days=1)))
+    pricey = repo.save(_place(200.0, created_at=base + timedelta(days=2)))
+
+    assert repo.filter_by_fields(owner_id="owner-1") == [cheap, pricey]
+    assert repo.filter_by_fields(owner_id="owner-1", price=200.0) == [pricey]
+    assert repo.filter_by_range("price", 60.0, 200.0) == [mid, pricey]
+    assert repo.filter_by_range("created_at", high=base + timedelta(days=1)) == [cheap, mid]
+
+    pricey.update_place(price=10.0)
+    repo.save(pricey)
+    assert repo.filter_by_range("price", high=60.0) == [pricey, cheap]
+
+    repo.delete(cheap.id)
+    assert repo.filter_by_fields(owner_id="owner-1") == [pricey]
+    assert repo.filter_by_range("price") == [pricey, mid]
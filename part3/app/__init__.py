@@ -6,13 +6,15 @@ from pathlib import Path
 
 from config import config as config_map
 from flask import Flask
-from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from flask_sqlalchemy import SQLAlchemy
 
-bcrypt = Bcrypt()
+from app.passwords import PasswordHasher
+from app.replication import ReplicaRouter, RoutingSession
+
 jwt = JWTManager()
-db = SQLAlchemy()
+passwords = PasswordHasher()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 
 
 def _resolve_config(config_object: str | type | None) -> str | type:
@@ -29,23 +31,48 @@ def _resolve_config(config_object: str | type | None) -> str | type:
 def create_app(config_object: str | type | None = None) -> Flask:
     """Create and configure the Flask application instance."""
     from app.api import register_api
+    from app.commands import register_commands
+    from app.persistence import install_search_indexes, upgrade_schema
+    from app.persistence.versions import install_collection_versions
+    from app.persistence.engine import SQLiteProfile, engine_options, install_sqlite_profile
     from app.services import HBnBFacade
+    from app.services.cache import build_cache
 
     app = Flask(__name__, instance_relative_config=True)
     Path(app.instance_path).mkdir(parents=True, exist_ok=True)
     app.config.from_object(_resolve_config(config_object))
     app.url_map.strict_slashes = False
-
-    bcrypt.init_app(app)
+    profile = SQLiteProfile.from_config(app.config)
+    router = ReplicaRouter.from_config(app.config)
+    if router is not None:
+        binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+        for key, url in router.urls.items():
+            binds[key] = {"url": url, **engine_options(app.config, url)}
+        app.config["SQLALCHEMY_BINDS"] = binds
+        app.extensions["replica_router"] = router
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config)
+
+    passwords.init_app(app)
     jwt.init_app(app)
     db.init_app(app)
-    app.extensions["facade"] = HBnBFacade()
+    app.extensions["facade"] = HBnBFacade(
+        cache=build_cache(app.config),
+        replica_lag=app.config["DATABASE_REPLICA_LAG"] if router is not None else 0.0,
+    )
     register_api(app)
+    register_commands(app)
 
     with app.app_context():
-        db.create_all()
+        for engine in db.engines.values():
+            if install_sqlite_profile(engine, profile):
+                app.extensions["sqlite_profile"] = profile
+        db.create_all(bind_key=None)
+        with db.engine.begin() as connection:
+            upgrade_schema(connection)
+            install_search_indexes(connection)
+            install_collection_versions(connection)
 
     return app
 
 
-__all__ = ["bcrypt", "create_app", "db", "jwt"]
+__all__ = ["create_app", "db", "jwt", "passwords"]
@@ -2,6 +2,8 @@
 
 from flask_restx import Api
 
+from app.passwords import PasswordHasherBusy
+
 from .v1 import namespaces
 
 
@@ -19,6 +21,10 @@ def register_api(app):
     for namespace in namespaces:
         api.add_namespace(namespace)
 
+    @api.errorhandler(PasswordHasherBusy)
+    def handle_password_hasher_busy(error: PasswordHasherBusy):
+        return {"message": str(error)}, 503, {"Retry-After": str(error.retry_after)}
+
     return api
 
 
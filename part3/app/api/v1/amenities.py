@@ -6,6 +6,12 @@ from flask import current_app
 from flask_jwt_extended import get_jwt, jwt_required
 from flask_restx import Namespace, Resource, fields
 
+from app.persistence import Page
+
+from .batch import ids_parser, parse_ids
+from .conditional import conditional_headers
+from .pagination import pagination_headers, pagination_parser, parse_pagination
+
 api = Namespace("amenities", description="Amenity operations")
 
 amenity_model = api.model(
@@ -21,6 +27,10 @@ amenity_create_model = api.model(
     {"name": fields.String(required=True)},
 )
 
+amenity_list_parser = pagination_parser.copy()
+for argument in ids_parser.args:
+    amenity_list_parser.add_argument(argument)
+
 
 def _require_admin() -> None:
     if not get_jwt().get("is_admin", False):
@@ -43,10 +53,28 @@ def _get_amenity_or_404(amenity_id: str):
 
 @api.route("/")
 class AmenityList(Resource):
+    @api.expect(amenity_list_parser)
     @api.marshal_list_with(amenity_model)
     def get(self):
-        """List amenities. Public endpoint."""
-        return [amenity.to_dict() for amenity in _get_facade().list_amenities()]
+        """List amenities ordered by name. Public endpoint.
+
+        `ids` returns just the listed amenities, in the order given, with one query.
+        """
+        ids = parse_ids(api)
+        facade = _get_facade()
+        if ids is not None:
+            headers = conditional_headers(facade.get_version("amenities"))
+            amenities = facade.get_amenities_by_ids(ids)
+            return [amenity.to_dict() for amenity in amenities], 200, headers
+        limit, cursor = parse_pagination(api)
+        version = facade.get_version("amenities")
+        headers = conditional_headers(version)
+        try:
+            document = facade.get_amenity_page_document(limit, cursor, version)
+        except ValueError as exc:
+            api.abort(400, str(exc))
+        page = Page(items=document["items"], next_cursor=document["next_cursor"])
+        return page.items, 200, {**headers, **pagination_headers(page, limit)}
 
     @jwt_required()
     @api.expect(amenity_create_model, validate=True)
@@ -69,7 +97,15 @@ class AmenityItem(Resource):
     @api.marshal_with(amenity_model)
     def get(self, amenity_id: str):
         """Fetch a single amenity. Public endpoint."""
-        return _get_amenity_or_404(amenity_id).to_dict()
+        facade = _get_facade()
+        version = facade.get_version("amenities", amenity_id)
+        if version is None:
+            api.abort(404, "Amenity not found")
+        headers = conditional_headers(version)
+        document = facade.get_amenity_document(amenity_id, version)
+        if document is None:
+            api.abort(404, "Amenity not found")
+        return document, 200, headers
 
     @jwt_required()
     @api.expect(amenity_create_model, validate=True)
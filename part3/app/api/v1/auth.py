@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from flask import current_app
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import (
     create_access_token,
@@ -11,6 +12,7 @@ from flask_jwt_extended import (
 )
 
 from app.models import User
+from app.passwords import PasswordHasherBusy
 
 api = Namespace("auth", description="Authentication operations")
 
@@ -39,10 +41,18 @@ protected_model = api.model(
 )
 
 
+def _get_facade():
+    facade = current_app.extensions.get("facade") or current_app.config.get("FACADE")
+    if facade is None:
+        api.abort(500, "Facade not configured on application")
+    return facade
+
+
 @api.route("/login")
 class Login(Resource):
     @api.expect(login_model, validate=True)
     @api.marshal_with(token_model)
+    @api.response(503, "Password hashing is saturated")
     def post(self):
         """Authenticate a user and return a JWT access token."""
         payload = api.payload or {}
@@ -56,6 +66,15 @@ class Login(Resource):
         if user is None or not user.verify_password(password):
             api.abort(401, "Invalid email or password")
 
+        if user.password_needs_rehash():
+            # Upgrade the stored hash while the plain password is at hand
+            try:
+                user.password = password
+            except PasswordHasherBusy:
+                pass
+            else:
+                _get_facade().users.save(user)
+
         access_token = create_access_token(
             identity=user.id,
             additional_claims={"is_admin": user.is_admin},
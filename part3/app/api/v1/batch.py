@@ -0,0 +1,32 @@
+"""Shared `?ids=` multi-get helpers for the v1 list endpoints."""
+
+from __future__ import annotations
+
+from flask import current_app
+from flask_restx import reqparse
+
+ids_parser = reqparse.RequestParser()
+ids_parser.add_argument(
+    "ids",
+    type=str,
+    required=False,
+    location="args",
+    help="Comma-separated ids to fetch in one request instead of paging",
+)
+
+
+def parse_ids(api) -> list[str] | None:
+    """Return the requested ids, deduplicated in order, or `None` without `ids`."""
+    raw = ids_parser.parse_args().get("ids")
+    if raw is None:
+        return None
+    ids = list(dict.fromkeys(part.strip() for part in raw.split(",") if part.strip()))
+    max_ids = int(current_app.config.get("API_MAX_BATCH_IDS", 100))
+    if not ids:
+        api.abort(400, "ids must list at least one id")
+    if len(ids) > max_ids:
+        api.abort(400, f"ids accepts at most {max_ids} ids")
+    return ids
+
+
+__all__ = ["ids_parser", "parse_ids"]
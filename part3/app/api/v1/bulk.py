@@ -0,0 +1,50 @@
+"""Bulk NDJSON ingestion endpoints for HBnB Part 3."""
+
+from __future__ import annotations
+
+import json
+
+from flask import Response, current_app, request, stream_with_context
+from flask_jwt_extended import get_jwt, jwt_required
+from flask_restx import Namespace, Resource
+
+from app.services.bulk_import import BULK_KINDS
+
+api = Namespace("bulk", description="Bulk ingestion operations")
+
+
+def _require_admin() -> None:
+    if not get_jwt().get("is_admin", False):
+        api.abort(403, "Administrator access required")
+
+
+def _get_facade():
+    facade = current_app.extensions.get("facade") or current_app.config.get("FACADE")
+    if facade is None:
+        api.abort(500, "Facade not configured on application")
+    return facade
+
+
+@api.route("/<string:kind>")
+@api.doc(params={"kind": f"One of: {', '.join(BULK_KINDS)}"})
+@api.response(404, "Unsupported bulk kind")
+class BulkImport(Resource):
+    @jwt_required()
+    @api.response(200, "Per-line NDJSON results followed by a summary line")
+    def post(self, kind: str):
+        """Import newline-delimited JSON records. Administrator only."""
+        _require_admin()
+        if kind not in BULK_KINDS:
+            api.abort(404, f"Unsupported bulk kind: {kind}")
+
+        facade = _get_facade()
+        chunk_size = int(current_app.config.get("BULK_IMPORT_CHUNK_SIZE", 500))
+
+        def generate():
+            for result in facade.bulk_import(kind, request.stream, chunk_size=chunk_size):
+                yield json.dumps(result, separators=(",", ":")) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+__all__ = ["api"]
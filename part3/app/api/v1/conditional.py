@@ -0,0 +1,51 @@
+"""Conditional GET helpers (ETag / Last-Modified) for the v1 API."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Sequence
+
+from flask import Response, request
+from werkzeug.exceptions import abort
+from werkzeug.http import http_date
+
+
+def _last_modified(version: Sequence[object]) -> datetime | None:
+    timestamps = [value for value in version if isinstance(value, datetime)]
+    if not timestamps:
+        return None
+    return max(timestamps).replace(tzinfo=timezone.utc, microsecond=0)
+
+
+def _etag(version: Sequence[object]) -> str:
+    raw = "|".join("" if value is None else str(value) for value in version)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def conditional_headers(version: Sequence[object]) -> dict[str, str]:
+    """Return validator headers, aborting with 304 when the client copy is fresh.
+
+    Call this before loading or serializing the resource so unchanged
+    resources cost only the version query.
+    """
+    etag = _etag(version)
+    last_modified = _last_modified(version)
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains(etag)
+    else:
+        since = request.if_modified_since
+        not_modified = (
+            since is not None and last_modified is not None and last_modified <= since
+        )
+
+    if not_modified:
+        abort(Response(status=304, headers=headers))
+    return headers
+
+
+__all__ = ["conditional_headers"]
@@ -0,0 +1,49 @@
+"""Operational diagnostics endpoints for HBnB Part 3."""
+
+from __future__ import annotations
+
+from flask import current_app
+from flask_jwt_extended import get_jwt, jwt_required
+from flask_restx import Namespace, Resource
+
+from app import db
+from app.persistence.engine import describe_engine
+
+api = Namespace("diagnostics", description="Operational diagnostics")
+
+
+def _require_admin() -> None:
+    if not get_jwt().get("is_admin", False):
+        api.abort(403, "Administrator access required")
+
+
+@api.route("/database")
+class DatabaseDiagnostics(Resource):
+    @jwt_required()
+    @api.response(200, "Engine profile, effective PRAGMAs, pool and replica status")
+    @api.response(403, "Administrator access required")
+    def get(self):
+        """Describe the database engine profile. Administrator only."""
+        _require_admin()
+        report = describe_engine(db.engine, current_app.extensions.get("sqlite_profile"))
+        router = current_app.extensions.get("replica_router")
+        if router is not None:
+            report["replication"] = {
+                **router.stats(),
+                "pools": {key: describe_engine(db.engines[key])["pool"] for key in router.urls},
+            }
+        return report, 200
+
+
+@api.route("/passwords")
+class PasswordDiagnostics(Resource):
+    @jwt_required()
+    @api.response(200, "Work factor, pool occupancy, rejections and hash latency")
+    @api.response(403, "Administrator access required")
+    def get(self):
+        """Describe the password hashing pool. Administrator only."""
+        _require_admin()
+        return current_app.extensions["passwords"].stats(), 200
+
+
+__all__ = ["api"]
@@ -0,0 +1,56 @@
+"""Shared keyset pagination helpers for the v1 list endpoints."""
+
+from __future__ import annotations
+
+from urllib.parse import urlencode
+
+from flask import current_app, request
+from flask_restx import reqparse
+
+from app.persistence import Page
+
+pagination_parser = reqparse.RequestParser()
+pagination_parser.add_argument(
+    "limit",
+    type=int,
+    required=False,
+    location="args",
+    help="Maximum number of items to return",
+)
+pagination_parser.add_argument(
+    "cursor",
+    type=str,
+    required=False,
+    location="args",
+    help="Opaque cursor taken from the previous page's next link",
+)
+
+
+def parse_pagination(api) -> tuple[int, str | None]:
+    """Return the validated `(limit, cursor)` pair for the current request."""
+    args = pagination_parser.parse_args()
+    max_limit = int(current_app.config.get("API_MAX_PAGE_SIZE", 500))
+    limit = args.get("limit")
+    if limit is None:
+        limit = int(current_app.config.get("API_DEFAULT_PAGE_SIZE", 100))
+    if limit < 1 or limit > max_limit:
+        api.abort(400, f"limit must be between 1 and {max_limit}")
+    return limit, args.get("cursor") or None
+
+
+def pagination_headers(page: Page, limit: int) -> dict[str, str]:
+    """Build `Link`/`X-Next-Cursor` headers pointing at the following page."""
+    if page.next_cursor is None:
+        return {}
+
+    query = {key: values for key, values in request.args.lists() if key not in {"cursor", "limit"}}
+    query["limit"] = [str(limit)]
+    query["cursor"] = [page.next_cursor]
+    next_url = f"{request.base_url}?{urlencode(query, doseq=True)}"
+    return {
+        "Link": f'<{next_url}>; rel="next"',
+        "X-Next-Cursor": page.next_cursor,
+    }
+
+
+__all__ = ["pagination_headers", "pagination_parser", "parse_pagination"]
@@ -4,9 +4,15 @@ from __future__ import annotations
 
 from flask import current_app
 from flask_jwt_extended import get_jwt, get_jwt_identity, jwt_required
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, marshal, reqparse
 
+from app.geo import parse_bbox
 from app.models import Place
+from app.persistence import PlaceProjection
+
+from .batch import ids_parser, parse_ids
+from .conditional import conditional_headers
+from .pagination import pagination_headers, pagination_parser, parse_pagination
 
 api = Namespace("places", description="Place operations")
 
@@ -53,10 +59,21 @@ place_model = api.model(
         "owner": fields.Nested(owner_summary),
         "reviews": fields.List(fields.Nested(review_summary)),
         "amenities": fields.List(fields.Nested(amenity_summary)),
+        "review_count": fields.Integer,
         "average_rating": fields.Float,
     },
 )
 
+place_search_model = api.inherit(
+    "PlaceSearchResult",
+    place_model,
+    {
+        "distance_km": fields.Float,
+        "score": fields.Float(description="BM25 score of a keyword match (lower is better)"),
+        "snippet": fields.String(description="Matching text with <mark> highlights"),
+    },
+)
+
 place_create_model = api.model(
     "PlaceCreate",
     {
@@ -83,6 +100,89 @@ place_update_model = api.model(
 )
 
 
+projection_parser = reqparse.RequestParser()
+projection_parser.add_argument(
+    "fields",
+    type=str,
+    required=False,
+    location="args",
+    help="Comma-separated place fields to return (id is always included)",
+)
+projection_parser.add_argument(
+    "expand",
+    type=str,
+    required=False,
+    location="args",
+    help="Comma-separated relationships to embed: owner, amenities, reviews",
+)
+projection_parser.add_argument(
+    "reviews_limit",
+    type=int,
+    required=False,
+    location="args",
+    help="Maximum number of newest reviews to embed per place",
+)
+
+location_parser = reqparse.RequestParser()
+location_parser.add_argument(
+    "lat",
+    type=float,
+    required=False,
+    location="args",
+    help="Latitude of the search centre",
+)
+location_parser.add_argument(
+    "lng",
+    type=float,
+    required=False,
+    location="args",
+    help="Longitude of the search centre",
+)
+location_parser.add_argument(
+    "radius_km",
+    type=float,
+    required=False,
+    location="args",
+    help="Search radius in kilometres around lat/lng",
+)
+location_parser.add_argument(
+    "bbox",
+    type=str,
+    required=False,
+    location="args",
+    help="Bounding box as min_lng,min_lat,max_lng,max_lat",
+)
+
+text_parser = reqparse.RequestParser()
+text_parser.add_argument(
+    "q",
+    type=str,
+    required=False,
+    location="args",
+    help="Keywords matched against place names and descriptions",
+)
+
+amenity_parser = reqparse.RequestParser()
+amenity_parser.add_argument(
+    "amenity_id",
+    type=str,
+    action="append",
+    required=False,
+    location="args",
+    help="Only return places that have this amenity (repeatable)",
+)
+
+list_parser = pagination_parser.copy()
+for argument in (
+    *projection_parser.args,
+    *location_parser.args,
+    *amenity_parser.args,
+    *text_parser.args,
+    *ids_parser.args,
+):
+    list_parser.add_argument(argument)
+
+
 def _get_facade():
     facade = current_app.extensions.get("facade") or current_app.config.get("FACADE")
     if facade is None:
@@ -90,6 +190,87 @@ def _get_facade():
     return facade
 
 
+def _parse_projection() -> PlaceProjection | None:
+    args = projection_parser.parse_args()
+    try:
+        return PlaceProjection.parse(
+            args.get("fields"),
+            args.get("expand"),
+            args.get("reviews_limit"),
+        )
+    except ValueError as exc:
+        api.abort(400, str(exc))
+
+
+def _marshal_places(data, projection: PlaceProjection | None, model=place_model, extra=()):
+    if projection is None and not extra:
+        return marshal(data, model)
+    keys = projection.output_keys if projection is not None else place_model.keys()
+    return marshal(data, model, mask=",".join((*keys, *extra)))
+
+
+def _search_place_text(
+    query: str,
+    limit: int,
+    cursor: str | None,
+    projection: PlaceProjection | None,
+):
+    """Run a ranked keyword search and return the marshalled page with its headers."""
+    facade = _get_facade()
+    try:
+        page = facade.search_place_text(query, limit, cursor, projection=projection)
+    except ValueError as exc:
+        api.abort(400, str(exc))
+
+    documents = facade.serialize_places([hit.entity for hit in page.items], projection)
+    for document, hit in zip(documents, page.items):
+        document["score"] = hit.score
+        document["snippet"] = hit.snippet
+    body = _marshal_places(documents, projection, place_search_model, ("score", "snippet"))
+    return body, pagination_headers(page, limit)
+
+
+def _search_places(
+    limit: int,
+    cursor: str | None,
+    projection: PlaceProjection | None,
+    amenity_ids: list[str] | None,
+):
+    """Run a location search when any of lat/lng/radius_km/bbox was supplied."""
+    args = location_parser.parse_args()
+    if all(args.get(name) is None for name in ("lat", "lng", "radius_km", "bbox")):
+        return None
+    if cursor is not None:
+        api.abort(400, "cursor is not supported with location filters")
+
+    radius_km = args.get("radius_km")
+    if radius_km is None and args.get("bbox") is None and args.get("lat") is not None:
+        radius_km = float(current_app.config.get("GEO_DEFAULT_RADIUS_KM", 25))
+    max_radius = float(current_app.config.get("GEO_MAX_RADIUS_KM", 1000))
+    if radius_km is not None and radius_km > max_radius:
+        api.abort(400, f"radius_km must not exceed {max_radius:g}")
+
+    facade = _get_facade()
+    try:
+        bbox = parse_bbox(args["bbox"]) if args.get("bbox") is not None else None
+        results = facade.search_places(
+            limit,
+            latitude=args.get("lat"),
+            longitude=args.get("lng"),
+            radius_km=radius_km,
+            bbox=bbox,
+            projection=projection,
+            amenity_ids=amenity_ids,
+        )
+    except ValueError as exc:
+        api.abort(400, str(exc))
+
+    documents = facade.serialize_places([place for place, _ in results], projection)
+    for document, (_, distance) in zip(documents, results):
+        document["distance_km"] = round(distance, 3) if distance is not None else None
+    return _marshal_places(documents, projection, place_search_model, ("distance_km",))
+
+
 def _get_place_or_404(place_id: str) -> Place:
     place = _get_facade().get_place(place_id)
     if place is None:
@@ -99,11 +280,61 @@ def _get_place_or_404(place_id: str) -> Place:
 
 @api.route("/")
 class PlaceList(Resource):
-    @api.marshal_list_with(place_model)
+    @api.expect(list_parser)
+    @api.response(200, "Success", [place_search_model])
     def get(self):
-        """List places. Public endpoint."""
+        """List places ordered by creation time. Public endpoint.
+
+        `fields`, `expand` and `reviews_limit` shrink each place document and
+        limit which columns and relationships are loaded. `lat`/`lng` with
+        `radius_km` and/or `bbox` switch to a location search that returns the
+        `limit` nearest matches with their `distance_km`. Repeated `amenity_id`
+        parameters keep places that have all of those amenities. `q` runs a
+        ranked keyword search returning each match's `score` and `snippet`.
+        `ids` returns just the listed places, in the order given, with one query.
+        """
+        ids = parse_ids(api)
+        projection = _parse_projection()
         facade = _get_facade()
-        return [facade.serialize_place(place) for place in facade.list_places()]
+        amenity_ids = amenity_parser.parse_args().get("amenity_id")
+        query = text_parser.parse_args().get("q")
+        if ids is not None:
+            location_args = location_parser.parse_args()
+            if query is not None or amenity_ids or any(
+                value is not None for value in location_args.values()
+            ):
+                api.abort(400, "ids cannot be combined with search or amenity filters")
+            headers = conditional_headers(facade.get_version("places"))
+            places = facade.get_places_by_ids(ids, profile="card", projection=projection)
+            body = _marshal_places(facade.serialize_places(places, projection), projection)
+            return body, 200, headers
+        limit, cursor = parse_pagination(api)
+        headers = conditional_headers(facade.get_version("places"))
+        if query is not None:
+            location_args = location_parser.parse_args()
+            if amenity_ids or any(value is not None for value in location_args.values()):
+                api.abort(400, "q cannot be combined with location or amenity filters")
+            body, page_headers = _search_place_text(query, limit, cursor, projection)
+            return body, 200, {**headers, **page_headers}
+        nearby = _search_places(limit, cursor, projection, amenity_ids)
+        if nearby is not None:
+            return nearby, 200, headers
+        try:
+            page = facade.paginate_places(
+                limit,
+                cursor,
+                profile="card",
+                projection=projection,
+                amenity_ids=amenity_ids,
+            )
+        except ValueError as exc:
+            api.abort(400, str(exc))
+        places = facade.serialize_places(page.items, projection)
+        return (
+            _marshal_places(places, projection),
+            200,
+            {**headers, **pagination_headers(page, limit)},
+        )
 
     @jwt_required()
     @api.expect(place_create_model, validate=True)
@@ -135,10 +366,20 @@ class PlaceList(Resource):
 @api.route("/<string:place_id>")
 @api.response(404, "Place not found")
 class PlaceItem(Resource):
-    @api.marshal_with(place_model)
+    @api.expect(projection_parser)
+    @api.response(200, "Success", place_model)
     def get(self, place_id: str):
         """Fetch a single place. Public endpoint."""
-        return _get_facade().serialize_place(_get_place_or_404(place_id))
+        projection = _parse_projection()
+        facade = _get_facade()
+        version = facade.get_version("places", place_id)
+        if version is None:
+            api.abort(404, "Place not found")
+        headers = conditional_headers(version)
+        document = facade.get_place_document(place_id, projection, version)
+        if document is None:
+            api.abort(404, "Place not found")
+        return _marshal_places(document, projection), 200, headers
 
     @jwt_required()
     @api.expect(place_update_model, validate=True)
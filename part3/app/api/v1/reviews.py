@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from flask import current_app
 from flask_jwt_extended import get_jwt, get_jwt_identity, jwt_required
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource, fields, marshal
 
 from app.models import Review
 
+from .batch import ids_parser, parse_ids
+from .conditional import conditional_headers
+from .pagination import pagination_headers, pagination_parser, parse_pagination
+
 api = Namespace("reviews", description="Review operations")
 
 review_model = api.model(
@@ -21,6 +25,26 @@ review_model = api.model(
     },
 )
 
+review_search_model = api.inherit(
+    "ReviewSearchHit",
+    review_model,
+    {
+        "score": fields.Float(description="BM25 score of the match (lower is better)"),
+        "snippet": fields.String(description="Matching comment text with <mark> highlights"),
+    },
+)
+
+review_list_parser = pagination_parser.copy()
+review_list_parser.add_argument(
+    "q",
+    type=str,
+    required=False,
+    location="args",
+    help="Keywords matched against review comments",
+)
+for argument in ids_parser.args:
+    review_list_parser.add_argument(argument)
+
 review_create_model = api.model(
     "ReviewCreate",
     {
@@ -56,10 +80,42 @@ def _get_review_or_404(review_id: str) -> Review:
 
 @api.route("/")
 class ReviewList(Resource):
-    @api.marshal_list_with(review_model)
+    @api.expect(review_list_parser)
+    @api.response(200, "Success", [review_search_model])
     def get(self):
-        """List reviews. Public endpoint."""
-        return [review.to_dict() for review in _get_facade().list_reviews()]
+        """List reviews ordered by creation time, or ranked by `q` keywords. Public endpoint.
+
+        `ids` returns just the listed reviews, in the order given, with one query.
+        """
+        ids = parse_ids(api)
+        query = review_list_parser.parse_args().get("q")
+        facade = _get_facade()
+        if ids is not None:
+            if query is not None:
+                api.abort(400, "ids cannot be combined with q")
+            headers = conditional_headers(facade.get_version("reviews"))
+            reviews = [review.to_dict() for review in facade.get_reviews_by_ids(ids)]
+            return marshal(reviews, review_model), 200, headers
+        limit, cursor = parse_pagination(api)
+        headers = conditional_headers(facade.get_version("reviews"))
+        if query is not None:
+            try:
+                page = facade.search_review_text(query, limit, cursor)
+            except ValueError as exc:
+                api.abort(400, str(exc))
+            hits = [
+                {**hit.entity.to_dict(), "score": hit.score, "snippet": hit.snippet}
+                for hit in page.items
+            ]
+            body = marshal(hits, review_search_model)
+            return body, 200, {**headers, **pagination_headers(page, limit)}
+
+        try:
+            page = facade.paginate_reviews(limit, cursor)
+        except ValueError as exc:
+            api.abort(400, str(exc))
+        reviews = [review.to_dict() for review in page.items]
+        return marshal(reviews, review_model), 200, {**headers, **pagination_headers(page, limit)}
 
     @jwt_required()
     @api.expect(review_create_model, validate=True)
@@ -114,7 +170,11 @@ class ReviewItem(Resource):
     @api.marshal_with(review_model)
     def get(self, review_id: str):
         """Fetch a single review. Public endpoint."""
-        return _get_review_or_404(review_id).to_dict()
+        version = _get_facade().get_version("reviews", review_id)
+        if version is None:
+            api.abort(404, "Review not found")
+        headers = conditional_headers(version)
+        return _get_review_or_404(review_id).to_dict(), 200, headers
 
     @jwt_required()
     @api.expect(review_update_model, validate=True)
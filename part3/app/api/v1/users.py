@@ -8,6 +8,10 @@ from flask_restx import Namespace, Resource, fields
 
 from app.models import User
 
+from .batch import ids_parser, parse_ids
+from .conditional import conditional_headers
+from .pagination import pagination_headers, pagination_parser, parse_pagination
+
 api = Namespace("users", description="User operations")
 
 user_model = api.model(
@@ -43,6 +47,10 @@ user_update_model = api.model(
     },
 )
 
+user_list_parser = pagination_parser.copy()
+for argument in ids_parser.args:
+    user_list_parser.add_argument(argument)
+
 
 def _get_facade():
     facade = current_app.extensions.get("facade") or current_app.config.get("FACADE")
@@ -53,11 +61,26 @@ def _get_facade():
 
 @api.route("/")
 class UserList(Resource):
+    @api.expect(user_list_parser)
     @api.marshal_list_with(user_model)
     def get(self):
-        """List all users without password data."""
-        users = _get_facade().list_users()
-        return [user.to_dict() for user in users]
+        """List users ordered by email without password data.
+
+        `ids` returns just the listed users, in the order given, with one query.
+        """
+        ids = parse_ids(api)
+        facade = _get_facade()
+        if ids is not None:
+            headers = conditional_headers(facade.get_version("users"))
+            return [user.to_dict() for user in facade.get_users_by_ids(ids)], 200, headers
+        limit, cursor = parse_pagination(api)
+        headers = conditional_headers(facade.get_version("users"))
+        try:
+            page = facade.paginate_users(limit, cursor)
+        except ValueError as exc:
+            api.abort(400, str(exc))
+        users = [user.to_dict() for user in page.items]
+        return users, 200, {**headers, **pagination_headers(page, limit)}
 
     @jwt_required()
     @api.expect(user_create_model, validate=True)
@@ -83,10 +106,15 @@ class UserItem(Resource):
     @api.marshal_with(user_model)
     def get(self, user_id: str):
         """Fetch a single user without password data."""
-        user = _get_facade().get_user(user_id)
-        if user is None:
+        facade = _get_facade()
+        version = facade.get_version("users", user_id)
+        if version is None:
+            api.abort(404, "User not found")
+        headers = conditional_headers(version)
+        document = facade.get_user_document(user_id, version)
+        if document is None:
             api.abort(404, "User not found")
-        return user.to_dict()
+        return document, 200, headers
 
     @jwt_required()
     @api.expect(user_update_model, validate=True)
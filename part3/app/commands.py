@@ -0,0 +1,61 @@
+"""Flask CLI commands for HBnB Part 3 maintenance tasks."""
+
+from __future__ import annotations
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+
+from app import db
+from app.persistence import rebuild_search_indexes, upgrade_schema
+from app.persistence.engine import run_concurrency_benchmark
+
+
+@click.command("recompute-ratings")
+@with_appcontext
+def recompute_ratings_command() -> None:
+    """Rebuild the denormalized review totals stored on every place."""
+    updated = current_app.extensions["facade"].recompute_place_ratings()
+    click.echo(f"Recomputed rating totals for {updated} place(s).")
+
+
+@click.command("backfill-geohashes")
+@with_appcontext
+def backfill_geohashes_command() -> None:
+    """Add the geohash column and index if missing, then index places without a geohash."""
+    with db.engine.begin() as connection:
+        upgrade_schema(connection)
+    updated = current_app.extensions["facade"].places.backfill_geohashes()
+    click.echo(f"Indexed {updated} place(s).")
+
+
+@click.command("rebuild-search-index")
+@with_appcontext
+def rebuild_search_index_command() -> None:
+    """Recreate the full-text search tables from places and reviews."""
+    with db.engine.begin() as connection:
+        rebuilt = rebuild_search_indexes(connection)
+    click.echo(f"Rebuilt {rebuilt} search index(es).")
+
+
+@click.command("benchmark-database")
+@click.option("--workers", default=8, show_default=True, help="Concurrent threads.")
+@click.option("--operations", default=200, show_default=True, help="Statements per thread.")
+@click.option("--write-ratio", default=0.25, show_default=True, help="Share of inserts.")
+@with_appcontext
+def benchmark_database_command(workers: int, operations: int, write_ratio: float) -> None:
+    """Measure concurrent read/write throughput against the configured engine."""
+    report = run_concurrency_benchmark(db.engine, workers, operations, write_ratio)
+    for key, value in report.items():
+        click.echo(f"{key}: {value}")
+
+
+def register_commands(app: Flask) -> None:
+    """Attach maintenance commands to the Flask CLI."""
+    app.cli.add_command(recompute_ratings_command)
+    app.cli.add_command(backfill_geohashes_command)
+    app.cli.add_command(rebuild_search_index_command)
+    app.cli.add_command(benchmark_database_command)
+
+
+__all__ = ["register_commands"]
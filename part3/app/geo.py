@@ -0,0 +1,202 @@
+"""Geohash encoding, bounding boxes and great-circle distances for place search."""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable, Iterator, NamedTuple
+
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_PRECISION = 9
+GEOHASH_MAX_CELLS = 32
+# Nearest-place searches start with this radius and widen it by RING_GROWTH
+RING_START_KM = 1.0
+RING_GROWTH = 4.0
+# Half the circumference: a circle this wide covers the whole globe
+MAX_RING_KM = math.pi * EARTH_RADIUS_KM
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+class BoundingBox(NamedTuple):
+    """Latitude/longitude rectangle that never crosses the antimeridian."""
+
+    min_lat: float
+    min_lng: float
+    max_lat: float
+    max_lng: float
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        return (
+            self.min_lat <= latitude <= self.max_lat
+            and self.min_lng <= longitude <= self.max_lng
+        )
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Return the base32 geohash of a coordinate."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars: list[str] = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        value, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            bounds[0] = middle
+        else:
+            bounds[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Return the great-circle distance between two coordinates in kilometres."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _split(min_lat: float, min_lng: float, max_lat: float, max_lng: float) -> list[BoundingBox]:
+    if min_lng <= max_lng:
+        return [BoundingBox(min_lat, min_lng, max_lat, max_lng)]
+    return [
+        BoundingBox(min_lat, min_lng, max_lat, 180.0),
+        BoundingBox(min_lat, -180.0, max_lat, max_lng),
+    ]
+
+
+def radius_boxes(latitude: float, longitude: float, radius_km: float) -> list[BoundingBox]:
+    """Return the boxes enclosing a circle, split at the antimeridian."""
+    d_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat = latitude - d_lat
+    max_lat = latitude + d_lat
+    if min_lat <= -90 or max_lat >= 90:
+        return [BoundingBox(max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0)]
+
+    ratio = math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(latitude))
+    d_lng = math.degrees(math.asin(min(1.0, ratio)))
+    if d_lng >= 180:
+        return [BoundingBox(min_lat, -180.0, max_lat, 180.0)]
+    min_lng = longitude - d_lng
+    max_lng = longitude + d_lng
+    if min_lng < -180:
+        min_lng += 360
+    if max_lng > 180:
+        max_lng -= 360
+    return _split(min_lat, min_lng, max_lat, max_lng)
+
+
+def ring_radii(radius_km: float | None = None) -> Iterator[float | None]:
+    """Yield growing search radii ending with `radius_km`.
+
+    Without a radius the last value is `None`, standing for no distance limit.
+    """
+    ring = RING_START_KM
+    while ring < (radius_km if radius_km is not None else MAX_RING_KM):
+        yield ring
+        ring *= RING_GROWTH
+    yield radius_km
+
+
+def intersect_boxes(
+    boxes: Iterable[BoundingBox],
+    others: Iterable[BoundingBox],
+) -> list[BoundingBox]:
+    """Return the non-empty overlaps between two sets of boxes."""
+    others = list(others)
+    overlaps = []
+    for box in boxes:
+        for other in others:
+            overlap = BoundingBox(
+                max(box.min_lat, other.min_lat),
+                max(box.min_lng, other.min_lng),
+                min(box.max_lat, other.max_lat),
+                min(box.max_lng, other.max_lng),
+            )
+            if overlap.min_lat <= overlap.max_lat and overlap.min_lng <= overlap.max_lng:
+                overlaps.append(overlap)
+    return overlaps
+
+
+def parse_bbox(text: str) -> list[BoundingBox]:
+    """Parse `min_lng,min_lat,max_lng,max_lat` into boxes split at the antimeridian.
+
+    A `min_lng` greater than `max_lng` describes a box crossing the antimeridian.
+    """
+    parts = text.split(",")
+    if len(parts) != 4:
+        raise ValueError("bbox must be min_lng,min_lat,max_lng,max_lat")
+    try:
+        min_lng, min_lat, max_lng, max_lat = (float(part) for part in parts)
+    except ValueError as exc:
+        raise ValueError("bbox must contain four numbers") from exc
+    if not all(math.isfinite(value) for value in (min_lng, min_lat, max_lng, max_lat)):
+        raise ValueError("bbox must contain four numbers")
+    if not (-90 <= min_lat <= max_lat <= 90):
+        raise ValueError("bbox latitudes must satisfy -90 <= min_lat <= max_lat <= 90")
+    if not (-180 <= min_lng <= 180 and -180 <= max_lng <= 180):
+        raise ValueError("bbox longitudes must be between -180 and 180")
+    return _split(min_lat, min_lng, max_lat, max_lng)
+
+
+def _cell_size(precision: int) -> tuple[float, float]:
+    lat_bits = 5 * precision // 2
+    lng_bits = 5 * precision - lat_bits
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def _cell_span(low: float, high: float, origin: float, size: float, limit: float) -> range:
+    last = int((limit - origin) / size) - 1
+    first = min(int((low - origin) / size), last)
+    return range(first, min(int((high - origin) / size), last) + 1)
+
+
+def covering_cells(box: BoundingBox, max_cells: int = GEOHASH_MAX_CELLS) -> list[str]:
+    """Return the finest geohash cells (at most `max_cells`) covering a box."""
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = _cell_size(precision)
+        rows = _cell_span(box.min_lat, box.max_lat, -90.0, height, 90.0)
+        columns = _cell_span(box.min_lng, box.max_lng, -180.0, width, 180.0)
+        if len(rows) * len(columns) <= max_cells or precision == 1:
+            return sorted(
+                {
+                    encode_geohash(
+                        -90.0 + (row + 0.5) * height,
+                        -180.0 + (column + 0.5) * width,
+                        precision,
+                    )
+                    for row in rows
+                    for column in columns
+                }
+            )
+    return []
+
+
+__all__ = [
+    "BoundingBox",
+    "EARTH_RADIUS_KM",
+    "GEOHASH_MAX_CELLS",
+    "GEOHASH_PRECISION",
+    "MAX_RING_KM",
+    "RING_GROWTH",
+    "RING_START_KM",
+    "covering_cells",
+    "encode_geohash",
+    "haversine_km",
+    "intersect_boxes",
+    "parse_bbox",
+    "radius_boxes",
+    "ring_radii",
+]
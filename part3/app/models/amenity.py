@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from sqlalchemy import String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Index, String, func
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from app.models.associations import place_amenity
 from app.models.base import BaseModel
@@ -35,4 +35,9 @@ class Amenity(BaseModel):
         return data
 
 
+# Case-insensitive sort key, so "pool" lists next to "Pool" and keyset pages can order on it
+Amenity.name_key = column_property(func.lower(Amenity.__table__.c.name))
+Index("ix_amenities_name_lower", func.lower(Amenity.__table__.c.name), Amenity.__table__.c.name)
+
+
 __all__ = ["Amenity"]
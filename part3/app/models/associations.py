@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Table, Column, String
+from sqlalchemy import ForeignKey, Index, Table, Column, String
 
 from app import db
 
@@ -12,6 +12,8 @@ place_amenity = Table(
     db.metadata,
     Column("place_id", String(36), ForeignKey("places.id"), primary_key=True),
     Column("amenity_id", String(36), ForeignKey("amenities.id"), primary_key=True),
+    # Posting lists: every place holding an amenity, sorted by place id
+    Index("ix_place_amenity_amenity_id_place_id", "amenity_id", "place_id"),
 )
 
 
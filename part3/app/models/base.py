@@ -31,6 +31,7 @@ class BaseModel(db.Model):
         nullable=False,
         default=datetime.utcnow,
         onupdate=datetime.utcnow,
+        index=True,
     )
 
     def __init__(self, **kwargs) -> None:
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Collection, Optional
 
-from sqlalchemy import Float, ForeignKey, String, Text
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.geo import GEOHASH_PRECISION, encode_geohash
 from app.models.associations import place_amenity
 from app.models.base import BaseModel
 
@@ -15,12 +16,32 @@ class Place(BaseModel):
     """Place persisted in the relational database."""
 
     __tablename__ = "places"
+    __table_args__ = (
+        Index("ix_places_created_at_id", "created_at", "id"),
+        Index("ix_places_geohash", "geohash"),
+        Index("ix_places_search_key", "search_key", unique=True),
+    )
 
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     price: Mapped[float] = mapped_column(Float, nullable=False)
     latitude: Mapped[float] = mapped_column(Float, nullable=False)
     longitude: Mapped[float] = mapped_column(Float, nullable=False)
+    geohash: Mapped[Optional[str]] = mapped_column(String(GEOHASH_PRECISION), nullable=True)
+    # Full-text index key, assigned by the search triggers; unlike rowid it survives VACUUM
+    search_key: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    review_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    rating_sum: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
     owner_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("users.id"),
@@ -88,30 +109,74 @@ class Place(BaseModel):
         self.latitude = float(candidate["latitude"])
         self.longitude = float(candidate["longitude"])
 
+    def sync_geohash(self) -> None:
+        """Recompute the indexed geohash from the current coordinates."""
+        if self.latitude is None or self.longitude is None:
+            self.geohash = None
+        else:
+            self.geohash = encode_geohash(self.latitude, self.longitude)
+
     def average_rating(self) -> float | None:
-        """Return the average review rating for the place."""
-        if not self.reviews:
+        """Return the average review rating from the denormalized totals."""
+        if not self.review_count:
             return None
-        return sum(review.rating for review in self.reviews) / len(self.reviews)
-
-    def to_dict(self) -> dict[str, object]:
-        """Serialize the mapped place attributes."""
-        data = super().to_dict()
-        data.update(
-            {
-                "name": self.name,
-                "description": self.description,
-                "price": self.price,
-                "latitude": self.latitude,
-                "longitude": self.longitude,
-                "owner_id": self.owner_id,
-                "owner": self.owner.to_dict() if self.owner else None,
-                "reviews": [review.to_dict() for review in self.reviews],
-                "amenities": [amenity.to_dict() for amenity in self.amenities],
-                "average_rating": self.average_rating(),
-            }
-        )
+        return self.rating_sum / self.review_count
+
+    def to_dict(
+        self,
+        fields: Collection[str] | None = None,
+        expand: Collection[str] | None = None,
+        reviews: list["Review"] | None = None,
+    ) -> dict[str, object]:
+        """Serialize the place, limited to the requested fields and relationships.
+
+        Only requested attributes are touched, so deferred columns and
+        unrequested relationships are never lazy-loaded.
+        """
+        fields = PLACE_FIELDS if fields is None else fields
+        expand = PLACE_RELATIONS if expand is None else expand
+
+        data: dict[str, object] = {}
+        for name in PLACE_FIELDS:
+            if name == "id" or name in fields:
+                data[name] = self._field_value(name)
+        if "owner" in expand:
+            data["owner"] = self.owner.to_dict() if self.owner else None
+        if "reviews" in expand:
+            embedded = self.reviews if reviews is None else reviews
+            data["reviews"] = [review.to_dict() for review in embedded]
+        if "amenities" in expand:
+            data["amenities"] = [amenity.to_dict() for amenity in self.amenities]
         return data
 
-
-__all__ = ["Place"]
+    def _field_value(self, name: str) -> object:
+        if name in {"created_at", "updated_at"}:
+            return getattr(self, name).isoformat()
+        if name == "average_rating":
+            return self.average_rating()
+        return getattr(self, name)
+
+
+@event.listens_for(Place, "before_insert")
+@event.listens_for(Place, "before_update")
+def _sync_place_geohash(mapper, connection, target: Place) -> None:
+    target.sync_geohash()
+
+
+PLACE_FIELDS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "name",
+    "description",
+    "price",
+    "latitude",
+    "longitude",
+    "owner_id",
+    "review_count",
+    "average_rating",
+)
+PLACE_RELATIONS = ("owner", "reviews", "amenities")
+
+
+__all__ = ["PLACE_FIELDS", "PLACE_RELATIONS", "Place"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, String, Text, UniqueConstraint
+from typing import Optional
+
+from sqlalchemy import ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -12,10 +14,16 @@ class Review(BaseModel):
     """Review persisted in the relational database."""
 
     __tablename__ = "reviews"
-    __table_args__ = (UniqueConstraint("user_id", "place_id", name="uq_review_user_place"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "place_id", name="uq_review_user_place"),
+        Index("ix_reviews_created_at_id", "created_at", "id"),
+        Index("ix_reviews_search_key", "search_key", unique=True),
+    )
 
     rating: Mapped[int] = mapped_column(Integer, nullable=False)
     comment: Mapped[str] = mapped_column(Text, nullable=False)
+    # Full-text index key, assigned by the search triggers; unlike rowid it survives VACUUM
+    search_key: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
     place_id: Mapped[str] = mapped_column(
         String(36),
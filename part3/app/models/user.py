@@ -5,7 +5,7 @@ from __future__ import annotations
 from sqlalchemy import Boolean, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app import bcrypt
+from app import passwords
 from app.models.base import BaseModel
 
 
@@ -38,11 +38,15 @@ class User(BaseModel):
     @password.setter
     def password(self, raw_password: str) -> None:
         self._validate_password(raw_password)
-        self.password_hash = bcrypt.generate_password_hash(raw_password).decode("utf-8")
+        self.password_hash = passwords.hash(raw_password)
 
     def verify_password(self, raw_password: str) -> bool:
         """Return whether a raw password matches the stored hash."""
-        return bcrypt.check_password_hash(self.password_hash, raw_password)
+        return passwords.verify(self.password_hash, raw_password)
+
+    def password_needs_rehash(self) -> bool:
+        """Return whether the stored hash uses an outdated work factor."""
+        return passwords.needs_rehash(self.password_hash)
 
     def to_dict(self) -> dict[str, str]:
         """Serialize the user without exposing password data."""
@@ -0,0 +1,20 @@
+"""Change counters backing collection ETags."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, DateTime, Integer, String, Table
+
+from app import db
+
+
+# One row per collection, bumped by triggers whenever a source table changes
+collection_versions = Table(
+    "collection_versions",
+    db.metadata,
+    Column("name", String(32), primary_key=True),
+    Column("version", Integer, nullable=False, default=0),
+    Column("changed_at", DateTime, nullable=False),
+)
+
+
+__all__ = ["collection_versions"]
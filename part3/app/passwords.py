@@ -0,0 +1,188 @@
+"""Bcrypt hashing and verification on a bounded worker process pool.
+
+Bcrypt is deliberately slow, so running it in the request thread ties up
+a worker for the whole hash. `PasswordHasher` sends the work to a process
+pool instead. It admits at most `workers + queue_size` operations at a
+time. Callers that cannot get a slot within `acquire_timeout` get
+`PasswordHasherBusy`, which the API turns into `503` with `Retry-After`.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable
+
+import bcrypt as _bcrypt
+from flask import Flask
+
+_COST = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+LATENCY_SAMPLES = 512
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when every hashing slot is taken."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Password hashing is saturated, retry later")
+        self.retry_after = retry_after
+
+
+def _hash_password(raw_password: str, rounds: int) -> str:
+    salt = _bcrypt.gensalt(rounds=rounds)
+    return _bcrypt.hashpw(raw_password.encode("utf-8"), salt).decode("utf-8")
+
+
+def _check_password(password_hash: str, raw_password: str) -> bool:
+    try:
+        return _bcrypt.checkpw(raw_password.encode("utf-8"), password_hash.encode("utf-8"))
+    except ValueError:
+        # Malformed stored hashes never match
+        return False
+
+
+def hash_cost(password_hash: str) -> int | None:
+    """Return the bcrypt work factor encoded in a hash."""
+    match = _COST.match(password_hash or "")
+    return int(match.group(1)) if match else None
+
+
+class _Latency:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.samples.append(seconds)
+
+    def summary(self) -> dict[str, float | int]:
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p95_ms": round(p95 * 1000, 3),
+        }
+
+
+class PasswordHasher:
+    """Flask extension running bcrypt on a bounded process pool.
+
+    `workers=0` runs bcrypt in the calling thread, still bounded by the
+    queue, which keeps tests and single-process tools free of a pool.
+    """
+
+    def __init__(self, app: Flask | None = None) -> None:
+        self.rounds = 12
+        self.workers = 0
+        self.queue_size = 32
+        self.acquire_timeout = 0.05
+        self.retry_after = 1
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._reset_metrics()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask) -> None:
+        self.shutdown()
+        self.rounds = int(app.config.get("BCRYPT_LOG_ROUNDS", 12))
+        self.workers = int(app.config.get("PASSWORD_HASH_WORKERS", 0))
+        self.queue_size = int(app.config.get("PASSWORD_HASH_QUEUE_SIZE", 32))
+        self.acquire_timeout = float(app.config.get("PASSWORD_HASH_ACQUIRE_TIMEOUT", 0.05))
+        self.retry_after = int(app.config.get("PASSWORD_HASH_RETRY_AFTER", 1))
+        if not 4 <= self.rounds <= 31:
+            raise ValueError("BCRYPT_LOG_ROUNDS must be between 4 and 31")
+        if self.workers < 0 or self.queue_size < 0 or self.workers + self.queue_size < 1:
+            raise ValueError("Password hashing needs at least one worker or queue slot")
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._reset_metrics()
+        app.extensions["passwords"] = self
+
+    # Public API
+    def hash(self, raw_password: str) -> str:
+        """Return a bcrypt hash of `raw_password` at the configured cost."""
+        return self._run("hash", _hash_password, raw_password, self.rounds)
+
+    def verify(self, password_hash: str, raw_password: str) -> bool:
+        """Return whether `raw_password` matches `password_hash`."""
+        return self._run("verify", _check_password, password_hash, raw_password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Return whether a hash was made with a different work factor."""
+        return hash_cost(password_hash) != self.rounds
+
+    def stats(self) -> dict[str, Any]:
+        with self._metrics_lock:
+            return {
+                "rounds": self.rounds,
+                "workers": self.workers,
+                "capacity": self.workers + self.queue_size,
+                "in_flight": self._in_flight,
+                "queue_depth": max(0, self._in_flight - max(self.workers, 1)),
+                "peak_in_flight": self._peak,
+                "rejected": self._rejected,
+                "failed": self._failed,
+                "latency": {name: latency.summary() for name, latency in self._latency.items()},
+            }
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    # Internals
+    def _run(self, operation: str, function: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            with self._metrics_lock:
+                self._rejected += 1
+            raise PasswordHasherBusy(self.retry_after)
+
+        started = time.perf_counter()
+        with self._metrics_lock:
+            self._in_flight += 1
+            self._peak = max(self._peak, self._in_flight)
+        try:
+            if self.workers:
+                future: Future = self._pool().submit(function, *args)
+                return future.result()
+            return function(*args)
+        except Exception:
+            with self._metrics_lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._metrics_lock:
+                self._in_flight -= 1
+                self._latency[operation].add(time.perf_counter() - started)
+            self._slots.release()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # Spawned workers avoid inheriting locks held by server threads at fork time
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _reset_metrics(self) -> None:
+        self._in_flight = 0
+        self._peak = 0
+        self._rejected = 0
+        self._failed = 0
+        self._latency = {"hash": _Latency(), "verify": _Latency()}
+
+
+__all__ = ["PasswordHasher", "PasswordHasherBusy", "hash_cost"]
@@ -1,15 +1,34 @@
 """Persistence abstractions for HBnB Part 3."""
 
 from .amenity_repository import AmenityRepository
-from .place_repository import PlaceRepository
+from .migrations import upgrade_schema
+from .pagination import Page
+from .place_repository import PlaceProjection, PlaceRepository
+from .predicates import And, Eq, In, Like, Or, Predicate, Range
 from .repository import SQLAlchemyRepository
 from .review_repository import ReviewRepository
+from .search import SearchHit, install_search_indexes, rebuild_search_indexes
+from .unit_of_work import unit_of_work
 from .user_repository import UserRepository
 
 __all__ = [
     "AmenityRepository",
+    "And",
+    "Eq",
+    "In",
+    "Like",
+    "Or",
+    "Page",
+    "PlaceProjection",
     "PlaceRepository",
+    "Predicate",
+    "Range",
     "ReviewRepository",
     "SQLAlchemyRepository",
+    "SearchHit",
     "UserRepository",
+    "install_search_indexes",
+    "rebuild_search_indexes",
+    "unit_of_work",
+    "upgrade_schema",
 ]
@@ -16,11 +16,5 @@ class AmenityRepository(SQLAlchemyRepository[Amenity]):
         """Return the amenity matching the provided name."""
         return self.find_by_fields(name=name.strip())
 
-    def get_by_ids(self, amenity_ids: list[str]) -> list[Amenity]:
-        """Return amenities for a set of ids."""
-        if not amenity_ids:
-            return []
-        return list(self.session.query(self.model).filter(self.model.id.in_(amenity_ids)).all())
-
 
 __all__ = ["AmenityRepository"]
@@ -0,0 +1,233 @@
+"""SQLite engine profile: connection PRAGMAs, pool sizing and diagnostics."""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Mapping
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import OperationalError
+
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORES = ("DEFAULT", "FILE", "MEMORY")
+
+BENCHMARK_TABLE = "engine_benchmark"
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """PRAGMA values applied to every new SQLite connection."""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -65536
+    mmap_size: int = 268435456
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 5000
+    foreign_keys: bool = True
+
+    def __post_init__(self) -> None:
+        # Values are interpolated into PRAGMA statements, so only known keywords pass
+        for name, allowed in (
+            ("journal_mode", JOURNAL_MODES),
+            ("synchronous", SYNCHRONOUS_LEVELS),
+            ("temp_store", TEMP_STORES),
+        ):
+            value = str(getattr(self, name)).upper()
+            if value not in allowed:
+                raise ValueError(f"{name} must be one of: {', '.join(allowed)}")
+            object.__setattr__(self, name, value)
+        for name in ("cache_size", "mmap_size", "busy_timeout"):
+            object.__setattr__(self, name, int(getattr(self, name)))
+        if self.mmap_size < 0 or self.busy_timeout < 0:
+            raise ValueError("mmap_size and busy_timeout must be non-negative")
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "SQLiteProfile":
+        defaults = cls()
+        return cls(
+            journal_mode=config.get("SQLITE_JOURNAL_MODE", defaults.journal_mode),
+            synchronous=config.get("SQLITE_SYNCHRONOUS", defaults.synchronous),
+            cache_size=config.get("SQLITE_CACHE_SIZE", defaults.cache_size),
+            mmap_size=config.get("SQLITE_MMAP_SIZE", defaults.mmap_size),
+            temp_store=config.get("SQLITE_TEMP_STORE", defaults.temp_store),
+            busy_timeout=config.get("SQLITE_BUSY_TIMEOUT_MS", defaults.busy_timeout),
+            foreign_keys=bool(config.get("SQLITE_FOREIGN_KEYS", defaults.foreign_keys)),
+        )
+
+    def statements(self) -> list[str]:
+        # busy_timeout goes first so switching journal mode can wait out other writers
+        return [
+            f"PRAGMA busy_timeout = {self.busy_timeout}",
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA cache_size = {self.cache_size}",
+            f"PRAGMA mmap_size = {self.mmap_size}",
+            f"PRAGMA temp_store = {self.temp_store}",
+            f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}",
+        ]
+
+
+def is_memory_sqlite(uri: str) -> bool:
+    url = make_url(uri)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(config: Mapping[str, Any], uri: str | None = None) -> dict[str, Any]:
+    """Build SQLAlchemy engine options, adding pool sizing where a queue pool is used.
+
+    `uri` defaults to the primary database. In-memory SQLite shares one
+    static connection, so pool sizing does not apply.
+    """
+    options = dict(config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    uri = uri or config.get("SQLALCHEMY_DATABASE_URI") or "sqlite:///:memory:"
+    if is_memory_sqlite(uri):
+        return options
+    options.setdefault("pool_size", int(config.get("DATABASE_POOL_SIZE", 5)))
+    options.setdefault("max_overflow", int(config.get("DATABASE_MAX_OVERFLOW", 10)))
+    options.setdefault("pool_timeout", float(config.get("DATABASE_POOL_TIMEOUT", 30)))
+    options.setdefault("pool_recycle", int(config.get("DATABASE_POOL_RECYCLE", 1800)))
+    return options
+
+
+def install_sqlite_profile(engine: Engine, profile: SQLiteProfile) -> bool:
+    """Apply `profile` on every new DBAPI connection of a SQLite engine."""
+    if engine.dialect.name != "sqlite":
+        return False
+
+    @event.listens_for(engine, "connect")
+    def _apply_profile(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in profile.statements():
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    return True
+
+
+def describe_engine(engine: Engine, profile: SQLiteProfile | None = None) -> dict[str, Any]:
+    """Report the configured profile, the PRAGMAs in effect and pool status."""
+    pool = engine.pool
+    report: dict[str, Any] = {
+        "dialect": engine.dialect.name,
+        "pool": {
+            "class": type(pool).__name__,
+            "size": _call(pool, "size"),
+            "checked_out": _call(pool, "checkedout"),
+            "overflow": _call(pool, "overflow"),
+            "recycle": getattr(pool, "_recycle", None),
+        },
+    }
+    if profile is None or engine.dialect.name != "sqlite":
+        return report
+    report["profile"] = asdict(profile)
+    with engine.connect() as connection:
+        report["pragmas"] = {
+            name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in asdict(profile)
+        }
+    return report
+
+
+def run_concurrency_benchmark(
+    engine: Engine,
+    workers: int = 8,
+    operations: int = 200,
+    write_ratio: float = 0.25,
+) -> dict[str, Any]:
+    """Hammer a scratch table from `workers` threads and report throughput.
+
+    Each worker performs `operations` statements, a `write_ratio` share of
+    them inserts committed one by one. Lock errors are counted rather than
+    raised so profiles can be compared by how many requests would have failed.
+    """
+    if workers < 1 or operations < 1:
+        raise ValueError("workers and operations must be positive")
+    if not 0 <= write_ratio <= 1:
+        raise ValueError("write_ratio must be between 0 and 1")
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            f"CREATE TABLE IF NOT EXISTS {BENCHMARK_TABLE} "
+            "(id INTEGER PRIMARY KEY, worker TEXT NOT NULL, payload TEXT NOT NULL)"
+        )
+
+    insert = text(f"INSERT INTO {BENCHMARK_TABLE} (worker, payload) VALUES (:worker, :payload)")
+    select = text(f"SELECT COUNT(*) FROM {BENCHMARK_TABLE} WHERE worker = :worker")
+    every = max(1, round(1 / write_ratio)) if write_ratio else 0
+    latencies: list[float] = []
+    counts = {"reads": 0, "writes": 0, "locked": 0, "errors": 0}
+    lock = threading.Lock()
+    start_gate = threading.Barrier(workers)
+
+    def work() -> None:
+        worker = uuid.uuid4().hex
+        local: list[float] = []
+        local_counts = dict.fromkeys(counts, 0)
+        start_gate.wait()
+        for index in range(operations):
+            writing = bool(every) and index % every == 0
+            began = time.perf_counter()
+            try:
+                if writing:
+                    with engine.begin() as connection:
+                        connection.execute(insert, {"worker": worker, "payload": str(index)})
+                    local_counts["writes"] += 1
+                else:
+                    with engine.connect() as connection:
+                        connection.execute(select, {"worker": worker}).scalar()
+                    local_counts["reads"] += 1
+            except OperationalError as exc:
+                key = "locked" if "locked" in str(exc.orig) else "errors"
+                local_counts[key] += 1
+            local.append(time.perf_counter() - began)
+        with lock:
+            latencies.extend(local)
+            for key, value in local_counts.items():
+                counts[key] += value
+
+    threads = [threading.Thread(target=work) for _ in range(workers)]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {BENCHMARK_TABLE}")
+
+    ordered = sorted(latencies)
+    completed = counts["reads"] + counts["writes"]
+    return {
+        "workers": workers,
+        "operations": workers * operations,
+        **counts,
+        "elapsed_s": round(elapsed, 4),
+        "ops_per_s": round(completed / elapsed, 1) if elapsed else None,
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+    }
+
+
+def _call(pool: Any, name: str) -> Any:
+    method = getattr(pool, name, None)
+    return method() if callable(method) else None
+
+
+__all__ = [
+    "SQLiteProfile",
+    "describe_engine",
+    "engine_options",
+    "install_sqlite_profile",
+    "is_memory_sqlite",
+    "run_concurrency_benchmark",
+]
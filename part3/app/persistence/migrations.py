@@ -0,0 +1,81 @@
+"""Idempotent schema upgrades for databases created by older releases."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex
+
+from app import db
+from app.geo import GEOHASH_PRECISION
+
+
+@dataclass(frozen=True)
+class AddedColumn:
+    """Column added to an existing table, with an optional SQL backfill."""
+
+    table: str
+    name: str
+    definition: str
+    backfill: str | None = None
+
+    def ddl(self) -> str:
+        return f"ALTER TABLE {self.table} ADD COLUMN {self.name} {self.definition}"
+
+
+ADDED_COLUMNS = (
+    AddedColumn(
+        "places",
+        "review_count",
+        "INTEGER NOT NULL DEFAULT 0",
+        "UPDATE places SET review_count = "
+        "(SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id)",
+    ),
+    AddedColumn(
+        "places",
+        "rating_sum",
+        "INTEGER NOT NULL DEFAULT 0",
+        "UPDATE places SET rating_sum = "
+        "(SELECT COALESCE(SUM(rating), 0) FROM reviews WHERE reviews.place_id = places.id)",
+    ),
+    # Filled in Python by `flask backfill-geohashes`; ix_places_geohash follows below
+    AddedColumn("places", "geohash", f"VARCHAR({GEOHASH_PRECISION})"),
+    # Seeded from the current rowids; the search index is then rebuilt on these keys
+    AddedColumn("places", "search_key", "INTEGER", "UPDATE places SET search_key = rowid"),
+    AddedColumn("reviews", "search_key", "INTEGER", "UPDATE reviews SET search_key = rowid"),
+)
+
+
+def upgrade_schema(connection: Connection) -> list[str]:
+    """Add columns and indexes missing from existing tables, backfilling new columns.
+
+    Tables that do not exist yet are skipped; `create_all()` builds them
+    with the current schema. Returns the `table.column` names added.
+    """
+    inspector = inspect(connection)
+    tables = set(inspector.get_table_names())
+    existing = {
+        table: {column["name"] for column in inspector.get_columns(table)} for table in tables
+    }
+    added: list[str] = []
+    for column in ADDED_COLUMNS:
+        if column.table not in existing or column.name in existing[column.table]:
+            continue
+        connection.exec_driver_sql(column.ddl())
+        if column.backfill:
+            connection.exec_driver_sql(column.backfill)
+        existing[column.table].add(column.name)
+        added.append(f"{column.table}.{column.name}")
+
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            # Indexes on columns this release cannot add are left to a rebuild
+            columns = {column.name for column in index.columns}
+            if table.name in existing and columns <= existing[table.name]:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+    return added
+
+
+__all__ = ["ADDED_COLUMNS", "AddedColumn", "upgrade_schema"]
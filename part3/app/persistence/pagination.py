@@ -0,0 +1,57 @@
+"""Keyset pagination primitives for the SQLAlchemy repositories."""
+
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, Sequence, TypeVar
+
+from sqlalchemy import DateTime
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """A single page of entities plus the cursor for the following page."""
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: Sequence[object]) -> str:
+    """Encode ordering key values into an opaque URL-safe cursor."""
+    serializable = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(serializable, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[object]) -> tuple[object, ...]:
+    """Decode a cursor back into typed values for the provided key columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("Invalid cursor")
+
+    decoded: list[object] = []
+    for column, value in zip(columns, values):
+        if isinstance(column.type, DateTime):
+            if not isinstance(value, str):
+                raise ValueError("Invalid cursor")
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError as exc:
+                raise ValueError("Invalid cursor") from exc
+        elif not isinstance(value, (str, int, float)):
+            raise ValueError("Invalid cursor")
+        decoded.append(value)
+    return tuple(decoded)
+
+
+__all__ = ["Page", "decode_cursor", "encode_cursor"]
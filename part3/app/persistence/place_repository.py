@@ -2,19 +2,285 @@
 
 from __future__ import annotations
 
-from app.models import Place
-from app.persistence.repository import SQLAlchemyRepository
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import joinedload, load_only, selectinload
+
+from app.geo import BoundingBox, covering_cells
+from app.models import Amenity, Place, Review, User
+from app.models.place import PLACE_FIELDS, PLACE_RELATIONS
+from app.models.associations import place_amenity
+from app.persistence.predicates import In, Or, Predicate, Range
+from app.persistence.repository import SCAN_BATCH_SIZE, SQLAlchemyRepository
+from app.persistence.search import SEARCH_INDEXES
+
+LOAD_PROFILES = {
+    "card": (
+        selectinload(Place.owner),
+        selectinload(Place.amenities),
+        selectinload(Place.reviews),
+    ),
+    "detail": (
+        joinedload(Place.owner),
+        selectinload(Place.amenities),
+        selectinload(Place.reviews),
+    ),
+}
+
+
+FIELD_COLUMNS = {
+    "average_rating": ("review_count", "rating_sum"),
+}
+
+
+@dataclass(frozen=True)
+class PlaceProjection:
+    """Requested place fields and embedded relationships for one response."""
+
+    fields: frozenset[str] = frozenset(PLACE_FIELDS)
+    expand: frozenset[str] = frozenset(PLACE_RELATIONS)
+    reviews_limit: int | None = None
+
+    @classmethod
+    def parse(
+        cls,
+        fields: str | None = None,
+        expand: str | None = None,
+        reviews_limit: int | None = None,
+    ) -> "PlaceProjection | None":
+        """Build a projection from query parameters; `None` means the full document."""
+        if fields is None and expand is None and reviews_limit is None:
+            return None
+
+        requested = {name.strip() for name in (fields or "").split(",") if name.strip()}
+        expanded = {name.strip() for name in (expand or "").split(",") if name.strip()}
+        unknown = sorted((requested | expanded) - set(PLACE_FIELDS) - set(PLACE_RELATIONS))
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+        if reviews_limit is not None and reviews_limit < 0:
+            raise ValueError("reviews_limit must be a non-negative integer")
+
+        expanded |= requested & set(PLACE_RELATIONS)
+        scalars = requested & set(PLACE_FIELDS)
+        if fields is None:
+            scalars = set(PLACE_FIELDS)
+            if expand is None:
+                expanded = set(PLACE_RELATIONS)
+        return cls(
+            fields=frozenset(scalars | {"id"}),
+            expand=frozenset(expanded),
+            reviews_limit=reviews_limit,
+        )
+
+    @property
+    def cache_key(self) -> str:
+        return "|".join(
+            [",".join(sorted(self.fields)), ",".join(sorted(self.expand)), str(self.reviews_limit)]
+        )
+
+    @property
+    def output_keys(self) -> list[str]:
+        """Return the top-level keys the serialized document will contain."""
+        return sorted(self.fields | self.expand)
+
+    def options(self) -> tuple:
+        """Return loader options fetching only the requested columns and relationships."""
+        columns = {"id"}
+        for name in self.fields:
+            columns.update(FIELD_COLUMNS.get(name, (name,)))
+        if "owner" in self.expand:
+            columns.add("owner_id")
+        options = [load_only(*(getattr(Place, name) for name in sorted(columns)))]
+        if "owner" in self.expand:
+            options.append(selectinload(Place.owner))
+        if "amenities" in self.expand:
+            options.append(selectinload(Place.amenities))
+        if "reviews" in self.expand and self.reviews_limit is None:
+            options.append(selectinload(Place.reviews))
+        return tuple(options)
+
+
+@dataclass(frozen=True)
+class HasAllAmenities(Predicate):
+    """Match places holding every amenity, intersecting posting lists in the given order.
+
+    The first amenity drives the scan over its `place_amenity` posting list and
+    each further amenity is a primary-key probe, so places missing the first
+    amenity are never visited. Order the ids from the shortest list upwards.
+    """
+
+    amenity_ids: tuple[str, ...]
+
+    def compile(self, model: type) -> Any:
+        postings = [place_amenity.alias(f"posting_{i}") for i in range(len(self.amenity_ids))]
+        first = postings[0]
+        query = select(first.c.place_id).select_from(first)
+        for posting, amenity_id in zip(postings[1:], self.amenity_ids[1:]):
+            query = query.join(
+                posting,
+                and_(posting.c.place_id == first.c.place_id, posting.c.amenity_id == amenity_id),
+            )
+        query = query.where(first.c.amenity_id == self.amenity_ids[0])
+        return model.id.in_(query)
 
 
 class PlaceRepository(SQLAlchemyRepository[Place]):
     """Repository with place-specific lookup helpers."""
 
+    search_index = SEARCH_INDEXES["places"]
+
     def __init__(self) -> None:
         super().__init__(Place)
 
+    @staticmethod
+    def profile_options(profile: str | None) -> tuple:
+        """Return the eager-loading options for a named loading profile."""
+        if profile is None:
+            return ()
+        try:
+            return LOAD_PROFILES[profile]
+        except KeyError as exc:
+            raise ValueError(f"Unknown loading profile: {profile}") from exc
+
+    def get_with_profile(self, place_id: str, profile: str | None) -> Place | None:
+        """Retrieve a place with the relationships required by a loading profile."""
+        return self.get(place_id, options=self.profile_options(profile))
+
+    def adjust_rating_totals(self, place_id: str, count_delta: int, rating_delta: int) -> None:
+        """Atomically shift a place's review count and rating sum in SQL."""
+        if not count_delta and not rating_delta:
+            return
+        self.session.query(self.model).filter(self.model.id == place_id).update(
+            {
+                self.model.review_count: self.model.review_count + count_delta,
+                self.model.rating_sum: self.model.rating_sum + rating_delta,
+            },
+            synchronize_session="evaluate",
+        )
+
+    def recompute_rating_totals(self) -> int:
+        """Rebuild every place's review totals from the reviews table."""
+        count_subquery = (
+            select(func.count(Review.id)).where(Review.place_id == self.model.id).scalar_subquery()
+        )
+        sum_subquery = (
+            select(func.coalesce(func.sum(Review.rating), 0))
+            .where(Review.place_id == self.model.id)
+            .scalar_subquery()
+        )
+        updated = self.session.query(self.model).update(
+            {
+                self.model.review_count: count_subquery,
+                self.model.rating_sum: sum_subquery,
+            },
+            synchronize_session=False,
+        )
+        self.session.expire_all()
+        self._commit()
+        return updated
+
+    def version(self, place_id: str) -> tuple | None:
+        """Return change-detection values covering the place and what it embeds."""
+        row = self.session.execute(
+            select(
+                Place.updated_at,
+                User.updated_at,
+                select(func.max(Review.updated_at))
+                .where(Review.place_id == Place.id)
+                .scalar_subquery(),
+                select(func.count())
+                .select_from(place_amenity)
+                .where(place_amenity.c.place_id == Place.id)
+                .scalar_subquery(),
+                select(func.max(Amenity.updated_at))
+                .join(place_amenity, place_amenity.c.amenity_id == Amenity.id)
+                .where(place_amenity.c.place_id == Place.id)
+                .scalar_subquery(),
+            )
+            .join(User, User.id == Place.owner_id)
+            .where(Place.id == place_id)
+        ).one_or_none()
+        if row is None:
+            return None
+        return (place_id, *row)
+
+    def _aggregate_version(self) -> tuple:
+        # Covers every place and embedded entity, like the "places" counter
+        row = self.session.execute(
+            select(
+                func.count(Place.id),
+                func.max(Place.updated_at),
+                select(func.max(User.updated_at)).scalar_subquery(),
+                select(func.max(Amenity.updated_at)).scalar_subquery(),
+                select(func.count()).select_from(place_amenity).scalar_subquery(),
+                select(func.max(Review.updated_at)).scalar_subquery(),
+            )
+        ).one()
+        return tuple(row)
+
+    def amenity_filter(self, amenity_ids: Iterable[str]) -> Predicate:
+        """Build a predicate for places holding all amenities, shortest posting list first."""
+        requested = list(dict.fromkeys(amenity_ids))
+        sizes = dict(
+            self.session.execute(
+                select(place_amenity.c.amenity_id, func.count())
+                .where(place_amenity.c.amenity_id.in_(requested))
+                .group_by(place_amenity.c.amenity_id)
+            ).all()
+        )
+        if not requested or len(sizes) < len(requested):
+            return In("id", ())
+        return HasAllAmenities(tuple(sorted(requested, key=lambda amenity_id: sizes[amenity_id])))
+
+    def locate(
+        self,
+        boxes: Iterable[BoundingBox],
+        predicate: Predicate | None = None,
+        limit: int | None = None,
+    ) -> list[tuple]:
+        """Return `(id, latitude, longitude, created_at)` rows inside any box.
+
+        Each box is first narrowed to index range scans over its covering
+        geohash cells, then to the exact coordinate bounds, so full places are
+        never loaded for candidates that are later discarded. With `limit`,
+        only the oldest `limit` rows are returned, ordered by creation time.
+        """
+        where = Or(tuple(self._box_predicate(box) for box in boxes))
+        if predicate is not None:
+            where = where & predicate
+        query = select(Place.id, Place.latitude, Place.longitude, Place.created_at).where(
+            where.compile(Place)
+        )
+        if limit is not None:
+            query = query.order_by(Place.created_at, Place.id).limit(limit)
+        return [tuple(row) for row in self.session.execute(query)]
+
+    @staticmethod
+    def _box_predicate(box: BoundingBox) -> Predicate:
+        cells = Or(
+            tuple(Range("geohash", gte=cell, lt=f"{cell}~") for cell in covering_cells(box))
+        )
+        return (
+            cells
+            & Range("latitude", gte=box.min_lat, lte=box.max_lat)
+            & Range("longitude", gte=box.min_lng, lte=box.max_lng)
+        )
+
+    def backfill_geohashes(self) -> int:
+        """Populate geohashes for places inserted without them, e.g. by raw SQL."""
+        updated = 0
+        query = self.session.query(Place).filter(Place.geohash.is_(None))
+        for place in query.yield_per(SCAN_BATCH_SIZE):
+            place.sync_geohash()
+            updated += 1
+        self._commit()
+        return updated
+
     def get_by_owner(self, owner_id: str) -> list[Place]:
         """Return places for a specific owner."""
         return self.filter_by_fields(owner_id=owner_id)
 
 
-__all__ = ["PlaceRepository"]
+__all__ = ["HasAllAmenities", "LOAD_PROFILES", "PlaceProjection", "PlaceRepository"]
@@ -0,0 +1,120 @@
+"""Composable repository predicates compiled into SQLAlchemy WHERE clauses."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from sqlalchemy import and_, false, inspect, or_, true
+
+
+class Predicate(ABC):
+    """Base class for predicates that compile against a mapped model."""
+
+    @abstractmethod
+    def compile(self, model: type) -> Any:
+        """Return the SQLAlchemy clause for the provided model."""
+
+    def __and__(self, other: "Predicate") -> "And":
+        return And((self, other))
+
+    def __or__(self, other: "Predicate") -> "Or":
+        return Or((self, other))
+
+
+def _column(model: type, field_name: str) -> Any:
+    # Only mapped columns: relationships, hybrids and plain methods would not compile
+    if field_name not in inspect(model).column_attrs:
+        raise ValueError(f"Unknown field: {field_name}")
+    return getattr(model, field_name)
+
+
+@dataclass(frozen=True)
+class Eq(Predicate):
+    """Match rows whose field equals a value."""
+
+    field: str
+    value: Any
+
+    def compile(self, model: type) -> Any:
+        return _column(model, self.field) == self.value
+
+
+@dataclass(frozen=True)
+class In(Predicate):
+    """Match rows whose field is one of the provided values."""
+
+    field: str
+    values: tuple[Any, ...]
+
+    def __init__(self, field: str, values: Iterable[Any]) -> None:
+        object.__setattr__(self, "field", field)
+        object.__setattr__(self, "values", tuple(values))
+
+    def compile(self, model: type) -> Any:
+        if not self.values:
+            return false()
+        return _column(model, self.field).in_(self.values)
+
+
+@dataclass(frozen=True)
+class Range(Predicate):
+    """Match rows whose field falls inside optional lower/upper bounds."""
+
+    field: str
+    gte: Any = None
+    lte: Any = None
+    gt: Any = None
+    lt: Any = None
+
+    def compile(self, model: type) -> Any:
+        column = _column(model, self.field)
+        clauses = []
+        if self.gte is not None:
+            clauses.append(column >= self.gte)
+        if self.gt is not None:
+            clauses.append(column > self.gt)
+        if self.lte is not None:
+            clauses.append(column <= self.lte)
+        if self.lt is not None:
+            clauses.append(column < self.lt)
+        return and_(true(), *clauses)
+
+
+@dataclass(frozen=True)
+class Like(Predicate):
+    """Match rows whose field matches a SQL LIKE pattern."""
+
+    field: str
+    pattern: str
+    case_sensitive: bool = False
+
+    def compile(self, model: type) -> Any:
+        column = _column(model, self.field)
+        if self.case_sensitive:
+            return column.like(self.pattern)
+        return column.ilike(self.pattern)
+
+
+@dataclass(frozen=True)
+class And(Predicate):
+    """Match rows satisfying every nested predicate."""
+
+    predicates: tuple[Predicate, ...]
+
+    def compile(self, model: type) -> Any:
+        return and_(true(), *(predicate.compile(model) for predicate in self.predicates))
+
+
+@dataclass(frozen=True)
+class Or(Predicate):
+    """Match rows satisfying at least one nested predicate."""
+
+    predicates: tuple[Predicate, ...]
+
+    def compile(self, model: type) -> Any:
+        return or_(false(), *(predicate.compile(model) for predicate in self.predicates))
+
+
+__all__ = ["And", "Eq", "In", "Like", "Or", "Predicate", "Range"]
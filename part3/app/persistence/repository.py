@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
-from typing import Callable, Generic, TypeVar
+import logging
+from typing import Callable, Generic, Iterable, Sequence, TypeVar, Union
+
+from sqlalchemy import func, select, tuple_
 
 from app import db
 from app.models import BaseModel
+from app.persistence.pagination import Page, decode_cursor, encode_cursor
+from app.persistence.predicates import Predicate
+from app.persistence.search import SearchHit, SearchIndex, search_page
+from app.persistence.unit_of_work import in_unit_of_work
+from app.persistence.versions import read_collection_version
 
 T = TypeVar("T", bound=BaseModel)
 
+logger = logging.getLogger(__name__)
+
+SCAN_BATCH_SIZE = 500
+
 
 class SQLAlchemyRepository(Generic[T]):
     """Generic repository backed by the Flask-SQLAlchemy session."""
 
+    search_index: SearchIndex | None = None
+
     def __init__(self, model: type[T]) -> None:
         self.model = model
         self.session = db.session
@@ -20,12 +34,29 @@ class SQLAlchemyRepository(Generic[T]):
     def save(self, entity: T) -> T:
         """Persist an entity."""
         self.session.add(entity)
-        self.session.commit()
+        self._commit()
         return entity
 
-    def get(self, entity_id) -> T | None:
-        """Retrieve an entity by primary key."""
-        return self.session.get(self.model, entity_id)
+    def save_many(self, entities: Iterable[T]) -> list[T]:
+        """Persist several entities with a single batched flush."""
+        items = list(entities)
+        if not items:
+            return items
+        self.session.add_all(items)
+        self._commit()
+        return items
+
+    def get(self, entity_id, options: Sequence = ()) -> T | None:
+        """Retrieve an entity by primary key, applying optional loader options."""
+        return self.session.get(self.model, entity_id, options=list(options))
+
+    def get_by_ids(self, entity_ids: Iterable[str], options: Sequence = ()) -> list[T]:
+        """Retrieve several entities with a single IN query."""
+        ids = list(dict.fromkeys(entity_ids))
+        if not ids:
+            return []
+        query = self.session.query(self.model).options(*options)
+        return list(query.filter(self.model.id.in_(ids)).all())
 
     def delete(self, entity_id) -> bool:
         """Delete an entity by primary key."""
@@ -33,25 +64,118 @@ class SQLAlchemyRepository(Generic[T]):
         if entity is None:
             return False
         self.session.delete(entity)
-        self.session.commit()
+        self._commit()
         return True
 
-    def list(self) -> list[T]:
-        """Return all entities for the configured model."""
-        return self.session.query(self.model).all()
+    def delete_many(self, entity_ids: Iterable[str]) -> int:
+        """Delete several entities loaded with one IN query; return the count."""
+        entities = self.get_by_ids(entity_ids)
+        if not entities:
+            return 0
+        for entity in entities:
+            self.session.delete(entity)
+        self._commit()
+        return len(entities)
+
+    def list(self, order_by: Sequence[str] = (), options: Sequence = ()) -> list[T]:
+        """Return all entities for the configured model, optionally ordered in SQL."""
+        query = self.session.query(self.model).options(*options)
+        if order_by:
+            query = query.order_by(*self._columns(order_by))
+        return query.all()
+
+    def paginate(
+        self,
+        order_by: Sequence[str],
+        limit: int,
+        cursor: str | None = None,
+        options: Sequence = (),
+        predicate: Predicate | None = None,
+    ) -> Page[T]:
+        """Return one keyset page ordered by the given unique column combination."""
+        columns = self._columns(order_by)
+        query = self.session.query(self.model).options(*options)
+        if predicate is not None:
+            query = query.filter(predicate.compile(self.model))
+        if cursor:
+            after = decode_cursor(cursor, columns)
+            if len(columns) == 1:
+                query = query.filter(columns[0] > after[0])
+            else:
+                query = query.filter(tuple_(*columns) > tuple_(*after))
+
+        rows = query.order_by(*columns).limit(limit + 1).all()
+        if len(rows) <= limit:
+            return Page(items=rows)
+
+        rows = rows[:limit]
+        last = rows[-1]
+        return Page(
+            items=rows,
+            next_cursor=encode_cursor([getattr(last, name) for name in order_by]),
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        options: Sequence = (),
+    ) -> Page[SearchHit[T]]:
+        """Return one page of keyword matches ranked by BM25."""
+        if self.search_index is None:
+            raise ValueError(f"{self.model.__name__} does not support search")
+        return search_page(
+            self.session,
+            self.model,
+            self.search_index,
+            query,
+            limit,
+            cursor,
+            options=options,
+        )
+
+    def version(self, entity_id) -> tuple | None:
+        """Return cheap change-detection values for one entity without loading it."""
+        updated_at = self.session.execute(
+            select(self.model.updated_at).where(self.model.id == entity_id)
+        ).scalar_one_or_none()
+        if updated_at is None:
+            return None
+        return (entity_id, updated_at)
+
+    def collection_version(self) -> tuple:
+        """Return the collection's change counter, a single primary-key read."""
+        version = read_collection_version(self.session, self.model.__tablename__)
+        if version is not None:
+            return version
+        return self._aggregate_version()
+
+    def _aggregate_version(self) -> tuple:
+        # Fallback for engines without the counter triggers
+        row = self.session.execute(
+            select(func.count(self.model.id), func.max(self.model.updated_at))
+        ).one()
+        return tuple(row)
 
     def clear(self) -> None:
         """Delete all entities for the configured model."""
         self.session.query(self.model).delete()
-        self.session.commit()
-
-    def find_first(self, predicate: Callable[[T], bool]) -> T | None:
-        """Return the first entity matching a Python predicate."""
-        return next((item for item in self.list() if predicate(item)), None)
-
-    def filter(self, predicate: Callable[[T], bool]) -> list[T]:
-        """Return entities matching a Python predicate."""
-        return [item for item in self.list() if predicate(item)]
+        self._commit()
+
+    def find_first(self, predicate: Union[Predicate, Callable[[T], bool]]) -> T | None:
+        """Return the first entity matching a predicate, using LIMIT 1 when compilable."""
+        if isinstance(predicate, Predicate):
+            query = self.session.query(self.model).filter(predicate.compile(self.model))
+            return query.limit(1).first()
+        return next((item for item in self._scan(predicate) if predicate(item)), None)
+
+    def filter(self, predicate: Union[Predicate, Callable[[T], bool]]) -> list[T]:
+        """Return entities matching a predicate, compiled to SQL when possible."""
+        if isinstance(predicate, Predicate):
+            query = self.session.query(self.model).filter(predicate.compile(self.model))
+            return list(query.all())
+        return [item for item in self._scan(predicate) if predicate(item)]
 
     def find_by_fields(self, **kwargs) -> T | None:
         """Return the first entity matching the provided field values."""
@@ -61,5 +185,24 @@ class SQLAlchemyRepository(Generic[T]):
         """Return all entities matching the provided field values."""
         return list(self.session.query(self.model).filter_by(**kwargs).all())
 
+    def _commit(self) -> None:
+        """Commit immediately, or only flush while a unit of work is active."""
+        if in_unit_of_work(self.session):
+            self.session.flush()
+        else:
+            self.session.commit()
+
+    def _scan(self, predicate: Callable[[T], bool]):
+        """Stream rows in batches for legacy Python-callable predicates."""
+        logger.warning(
+            "Callable predicate %r on %s evaluated in Python; use a compiled Predicate instead",
+            predicate,
+            self.model.__name__,
+        )
+        return self.session.query(self.model).yield_per(SCAN_BATCH_SIZE)
+
+    def _columns(self, names: Sequence[str]) -> list:
+        return [getattr(self.model, name) for name in names]
+
 
 __all__ = ["SQLAlchemyRepository"]
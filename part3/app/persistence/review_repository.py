@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from typing import Iterable
+
+from sqlalchemy import func, select
+
 from app.models import Review
 from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.search import SEARCH_INDEXES
 
 
 class ReviewRepository(SQLAlchemyRepository[Review]):
     """Repository with review-specific lookup helpers."""
 
+    search_index = SEARCH_INDEXES["reviews"]
+
     def __init__(self) -> None:
         super().__init__(Review)
 
@@ -16,6 +24,35 @@ class ReviewRepository(SQLAlchemyRepository[Review]):
         """Return reviews for a specific place."""
         return self.filter_by_fields(place_id=place_id)
 
+    def latest_for_places(self, place_ids: Iterable[str], limit: int) -> dict[str, list[Review]]:
+        """Return up to `limit` newest reviews per place with one windowed query."""
+        ids = list(dict.fromkeys(place_ids))
+        grouped: dict[str, list[Review]] = defaultdict(list)
+        if not ids or limit <= 0:
+            return grouped
+
+        position = (
+            func.row_number()
+            .over(
+                partition_by=self.model.place_id,
+                order_by=(self.model.created_at.desc(), self.model.id.desc()),
+            )
+            .label("position")
+        )
+        ranked = (
+            select(self.model.id, position).where(self.model.place_id.in_(ids)).subquery()
+        )
+        reviews = (
+            self.session.query(self.model)
+            .join(ranked, ranked.c.id == self.model.id)
+            .filter(ranked.c.position <= limit)
+            .order_by(ranked.c.position)
+            .all()
+        )
+        for review in reviews:
+            grouped[review.place_id].append(review)
+        return grouped
+
     def get_by_user_and_place(self, user_id: str, place_id: str) -> Review | None:
         """Return the review for a user/place pair if it exists."""
         return self.find_by_fields(user_id=user_id, place_id=place_id)
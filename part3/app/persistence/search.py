@@ -0,0 +1,256 @@
+"""SQLite FTS5 full-text indexes over place and review text."""
+
+from __future__ import annotations
+
+import html
+import re
+from dataclasses import dataclass
+from typing import Generic, Sequence, TypeVar
+
+from sqlalchemy import Column, Float, Integer, bindparam, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.persistence.pagination import Page, decode_cursor, encode_cursor
+
+T = TypeVar("T")
+
+HIGHLIGHT_OPEN = "<mark>"
+HIGHLIGHT_CLOSE = "</mark>"
+SNIPPET_TOKENS = 12
+# Integer column on each source table that the FTS rows are keyed on
+SEARCH_KEY = "search_key"
+
+# Private-use markers stand in for the tags until the snippet text is escaped
+_OPEN_MARKER = "\ue000"
+_CLOSE_MARKER = "\ue001"
+
+_CURSOR_COLUMNS = (Column("score", Float), Column("rowid", Integer))
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """External-content FTS5 table mirroring text columns of a source table.
+
+    Triggers on the source table keep the index in sync with every insert,
+    update and delete, including writes made outside the ORM. Rows are keyed
+    on the source's `search_key` column rather than its implicit rowid,
+    which SQLite may renumber on VACUUM. The insert trigger assigns the key.
+    """
+
+    source: str
+    columns: tuple[str, ...]
+    weights: tuple[float, ...]
+
+    @property
+    def table(self) -> str:
+        return f"{self.source}_fts"
+
+    def ddl(self) -> list[str]:
+        """Return idempotent statements creating the FTS table and its triggers."""
+        columns = ", ".join(self.columns)
+        new_values = ", ".join(f"new.{column}" for column in self.columns)
+        old_values = ", ".join(f"old.{column}" for column in self.columns)
+        assign = (
+            f"UPDATE {self.source} SET {SEARCH_KEY} = "
+            f"(SELECT COALESCE(MAX({SEARCH_KEY}), 0) + 1 FROM {self.source}) "
+            f"WHERE rowid = new.rowid AND new.{SEARCH_KEY} IS NULL;"
+        )
+        insert_assigned = (
+            f"INSERT INTO {self.table}(rowid, {columns}) "
+            f"SELECT {SEARCH_KEY}, {columns} FROM {self.source} WHERE rowid = new.rowid;"
+        )
+        insert = (
+            f"INSERT INTO {self.table}(rowid, {columns}) "
+            f"VALUES (new.{SEARCH_KEY}, {new_values});"
+        )
+        delete = (
+            f"INSERT INTO {self.table}({self.table}, rowid, {columns}) "
+            f"VALUES ('delete', old.{SEARCH_KEY}, {old_values});"
+        )
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+            f"{columns}, content='{self.source}', content_rowid='{SEARCH_KEY}', "
+            "tokenize='unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_ai AFTER INSERT ON {self.source} "
+            f"BEGIN {assign} {insert_assigned} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_ad AFTER DELETE ON {self.source} "
+            f"BEGIN {delete} END",
+            f"CREATE TRIGGER IF NOT EXISTS {self.table}_au AFTER UPDATE OF {columns} "
+            f"ON {self.source} BEGIN {delete} {insert} END",
+        ]
+
+    def rebuild_sql(self) -> str:
+        return f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')"
+
+    def drop_ddl(self) -> list[str]:
+        """Return statements removing the FTS table and its triggers."""
+        triggers = [
+            f"DROP TRIGGER IF EXISTS {self.table}_{suffix}" for suffix in ("ai", "ad", "au")
+        ]
+        return [*triggers, f"DROP TABLE IF EXISTS {self.table}"]
+
+
+SEARCH_INDEXES = {
+    "places": SearchIndex("places", ("name", "description"), (10.0, 1.0)),
+    "reviews": SearchIndex("reviews", ("comment",), (1.0,)),
+}
+
+
+@dataclass
+class SearchHit(Generic[T]):
+    """Entity matched by a keyword search with its BM25 score and snippet."""
+
+    entity: T
+    score: float
+    snippet: str
+
+
+def search_supported(connection: Connection) -> bool:
+    return connection.dialect.name == "sqlite"
+
+
+def install_search_indexes(connection: Connection) -> list[str]:
+    """Create missing FTS tables and triggers, backfilling newly created tables.
+
+    Tables from older releases, keyed on the source rowid, are dropped and
+    rebuilt on `search_key`.
+    """
+    if not search_supported(connection):
+        return []
+    created: list[str] = []
+    for index in SEARCH_INDEXES.values():
+        existing = connection.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": index.table},
+        ).first()
+        if existing is not None and f"content_rowid='{SEARCH_KEY}'" not in existing.sql:
+            for statement in index.drop_ddl():
+                connection.exec_driver_sql(statement)
+            existing = None
+        for statement in index.ddl():
+            connection.exec_driver_sql(statement)
+        if existing is None:
+            connection.exec_driver_sql(index.rebuild_sql())
+            created.append(index.table)
+    return created
+
+
+def rebuild_search_indexes(connection: Connection) -> int:
+    """Rebuild every FTS table from its source rows."""
+    install_search_indexes(connection)
+    for index in SEARCH_INDEXES.values():
+        connection.exec_driver_sql(index.rebuild_sql())
+    return len(SEARCH_INDEXES)
+
+
+def match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query requiring every word.
+
+    Words are quoted so FTS5 operators and punctuation in user input are inert.
+    """
+    words = _WORD.findall(query or "")
+    if not words:
+        raise ValueError("q must contain at least one word")
+    return " ".join(f'"{word}"' for word in words)
+
+
+def search_page(
+    session: Session,
+    model: type[T],
+    index: SearchIndex,
+    query: str,
+    limit: int,
+    cursor: str | None = None,
+    options: Sequence = (),
+) -> Page[SearchHit[T]]:
+    """Return one page of matches ordered by BM25 score (best first)."""
+    if not search_supported(session.get_bind()):
+        raise ValueError("Full-text search requires SQLite")
+
+    params: dict[str, object] = {"match": match_expression(query), "limit": limit + 1}
+    after = ""
+    if cursor:
+        params["score"], params["rowid"] = decode_cursor(cursor, _CURSOR_COLUMNS)
+        after = "WHERE score > :score OR (score = :score AND rowid > :rowid)"
+
+    weights = ", ".join(str(weight) for weight in index.weights)
+    ranked = text(
+        f"""
+        SELECT rowid, score FROM (
+            SELECT rowid, bm25({index.table}, {weights}) AS score
+            FROM {index.table}
+            WHERE {index.table} MATCH :match
+        )
+        {after}
+        ORDER BY score, rowid
+        LIMIT :limit
+        """
+    )
+    rows = session.execute(ranked, params).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1].score, rows[-1].rowid])
+    if not rows:
+        return Page(items=[], next_cursor=next_cursor)
+
+    # Snippets and entities are only built for the page, not for every match
+    details = text(
+        f"""
+        SELECT {index.table}.rowid AS rowid,
+               {index.source}.id AS id,
+               snippet({index.table}, -1, :open, :close, '…', {SNIPPET_TOKENS}) AS snippet
+        FROM {index.table}
+        JOIN {index.source} ON {index.source}.{SEARCH_KEY} = {index.table}.rowid
+        WHERE {index.table} MATCH :match AND {index.table}.rowid IN :rowids
+        """
+    ).bindparams(bindparam("rowids", expanding=True))
+    matched = {
+        row.rowid: row
+        for row in session.execute(
+            details,
+            {
+                "match": params["match"],
+                "open": _OPEN_MARKER,
+                "close": _CLOSE_MARKER,
+                "rowids": [row.rowid for row in rows],
+            },
+        )
+    }
+    ids = [matched[row.rowid].id for row in rows if row.rowid in matched]
+    loaded = session.query(model).options(*options).filter(model.id.in_(ids)).all()
+    entities = {entity.id: entity for entity in loaded}
+    hits = []
+    for row in rows:
+        detail = matched.get(row.rowid)
+        if detail is not None and detail.id in entities:
+            hits.append(
+                SearchHit(
+                    entity=entities[detail.id],
+                    score=row.score,
+                    snippet=highlight(detail.snippet),
+                )
+            )
+    return Page(items=hits, next_cursor=next_cursor)
+
+
+def highlight(snippet: str) -> str:
+    """HTML-escape snippet text, then turn the match markers into `<mark>` tags."""
+    escaped = html.escape(snippet)
+    return escaped.replace(_OPEN_MARKER, HIGHLIGHT_OPEN).replace(_CLOSE_MARKER, HIGHLIGHT_CLOSE)
+
+
+__all__ = [
+    "SEARCH_INDEXES",
+    "SEARCH_KEY",
+    "SearchHit",
+    "SearchIndex",
+    "highlight",
+    "install_search_indexes",
+    "match_expression",
+    "rebuild_search_indexes",
+    "search_page",
+]
@@ -0,0 +1,39 @@
+"""Unit-of-work support shared by the SQLAlchemy repositories."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+UNIT_OF_WORK_DEPTH_KEY = "hbnb_unit_of_work_depth"
+
+
+def in_unit_of_work(session: Session) -> bool:
+    """Return whether the session is inside an active unit of work."""
+    return session.info.get(UNIT_OF_WORK_DEPTH_KEY, 0) > 0
+
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """Group repository writes into a single transaction.
+
+    Repository writes inside the block only flush; the outermost block commits
+    once on success and rolls back on error. Nested blocks join the outer one.
+    """
+    depth = session.info.get(UNIT_OF_WORK_DEPTH_KEY, 0)
+    session.info[UNIT_OF_WORK_DEPTH_KEY] = depth + 1
+    try:
+        yield session
+    except BaseException:
+        session.info[UNIT_OF_WORK_DEPTH_KEY] = depth
+        if depth == 0:
+            session.rollback()
+        raise
+    session.info[UNIT_OF_WORK_DEPTH_KEY] = depth
+    if depth == 0:
+        session.commit()
+
+
+__all__ = ["in_unit_of_work", "unit_of_work"]
@@ -0,0 +1,76 @@
+"""Per-collection change counters kept current by SQLite triggers."""
+
+from __future__ import annotations
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.versions import collection_versions
+
+# Tables whose writes change each collection's representation
+COLLECTION_SOURCES = {
+    "users": ("users",),
+    "amenities": ("amenities",),
+    "reviews": ("reviews",),
+    "places": ("places", "users", "amenities", "place_amenity", "reviews"),
+}
+
+
+def version_triggers() -> list[str]:
+    """Return idempotent trigger DDL bumping the counters on every row write."""
+    collections_by_table: dict[str, list[str]] = {}
+    for name, tables in COLLECTION_SOURCES.items():
+        for table in tables:
+            collections_by_table.setdefault(table, []).append(name)
+
+    statements = []
+    for table, names in collections_by_table.items():
+        targets = ", ".join(f"'{name}'" for name in names)
+        bump = (
+            "UPDATE collection_versions SET version = version + 1, "
+            f"changed_at = datetime('now') WHERE name IN ({targets});"
+        )
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()} "
+                f"AFTER {event} ON {table} BEGIN {bump} END"
+            )
+    return statements
+
+
+def install_collection_versions(connection: Connection) -> bool:
+    """Seed the counter rows and create their triggers; SQLite only."""
+    if connection.dialect.name != "sqlite":
+        return False
+    for name in COLLECTION_SOURCES:
+        connection.execute(
+            text(
+                "INSERT OR IGNORE INTO collection_versions (name, version, changed_at) "
+                "VALUES (:name, 0, datetime('now'))"
+            ),
+            {"name": name},
+        )
+    for statement in version_triggers():
+        connection.exec_driver_sql(statement)
+    return True
+
+
+def read_collection_version(session: Session, name: str) -> tuple | None:
+    """Return `(name, version, changed_at)`, or `None` without trigger support."""
+    row = session.execute(
+        select(collection_versions.c.version, collection_versions.c.changed_at).where(
+            collection_versions.c.name == name
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    return (name, *row)
+
+
+__all__ = [
+    "COLLECTION_SOURCES",
+    "install_collection_versions",
+    "read_collection_version",
+    "version_triggers",
+]
@@ -0,0 +1,110 @@
+"""Read/write routing between the primary database and read replicas.
+
+Repositories share `db.session`, so routing happens in the session's
+`get_bind`. SELECTs issued while serving a safe (GET/HEAD/OPTIONS) request
+go to a replica. Everything else goes to the primary: writes, flushes, raw
+SQL, CLI commands and every statement of a request that writes. Once a
+session writes, its remaining reads stick to the primary too, so a request
+always reads its own writes.
+"""
+
+from __future__ import annotations
+
+import threading
+from itertools import count
+from typing import Any, Mapping
+
+from flask import current_app, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+REPLICA_STRATEGIES = ("round_robin", "least_busy")
+REPLICA_BIND_PREFIX = "replica_"
+PRIMARY_KEY = "hbnb_primary_only"
+REPLICA_KEY = "hbnb_replica"
+
+
+class ReplicaRouter:
+    """Pick a replica bind for each session and count how reads were spread."""
+
+    def __init__(self, urls: list[str], strategy: str = "round_robin") -> None:
+        if strategy not in REPLICA_STRATEGIES:
+            raise ValueError(f"Replica strategy must be one of: {', '.join(REPLICA_STRATEGIES)}")
+        self.strategy = strategy
+        self.urls = {f"{REPLICA_BIND_PREFIX}{index}": url for index, url in enumerate(urls)}
+        self._turn = count()
+        self._lock = threading.Lock()
+        self._routed = dict.fromkeys(self.urls, 0)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "ReplicaRouter | None":
+        urls = [url for url in config.get("DATABASE_REPLICA_URLS") or () if url]
+        if not urls:
+            return None
+        return cls(urls, config.get("DATABASE_REPLICA_STRATEGY", "round_robin"))
+
+    def choose(self, engines: Mapping[str | None, Any]) -> str:
+        keys = list(self.urls)
+        start = next(self._turn) % len(keys)
+        ordered = keys[start:] + keys[:start]
+        if self.strategy == "least_busy":
+            # Fewest checked-out connections wins; ties rotate via `ordered`
+            key = min(ordered, key=lambda name: _checked_out(engines[name]))
+        else:
+            key = ordered[0]
+        with self._lock:
+            self._routed[key] += 1
+        return key
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            routed = dict(self._routed)
+        return {"strategy": self.strategy, "replicas": len(self.urls), "sessions": routed}
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that sends safe-request reads to a replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._reads_from_replica(clause):
+            router: ReplicaRouter | None = current_app.extensions.get("replica_router")
+            if router is not None:
+                key = self.info.get(REPLICA_KEY)
+                if key is None:
+                    key = self.info[REPLICA_KEY] = router.choose(self._db.engines)
+                return self._db.engines[key]
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+    def _reads_from_replica(self, clause) -> bool:
+        return (
+            not self._flushing
+            and not self.info.get(PRIMARY_KEY)
+            and getattr(clause, "is_select", False)
+            and has_request_context()
+            and request.method in SAFE_METHODS
+        )
+
+
+def stick_to_primary(session: Session) -> None:
+    """Route the rest of this session's statements to the primary."""
+    session.info[PRIMARY_KEY] = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _stick_after_flush(session, _flush_context) -> None:
+    stick_to_primary(session)
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _stick_before_dml(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        stick_to_primary(state.session)
+
+
+def _checked_out(engine) -> int:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if callable(checkedout) else 0
+
+
+__all__ = ["ReplicaRouter", "RoutingSession", "SAFE_METHODS", "stick_to_primary"]
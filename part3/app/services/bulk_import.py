@@ -0,0 +1,252 @@
+"""Chunked NDJSON ingestion for places, amenities and reviews."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models import Amenity, Place, Review
+from app.persistence import In
+
+if TYPE_CHECKING:
+    from app.services.facade import HBnBFacade
+
+BULK_KINDS = ("places", "amenities", "reviews")
+
+
+def iter_ndjson(lines: Iterable[bytes | str]) -> Iterator[tuple[int, Any, str | None]]:
+    """Yield `(line_number, record, error)` for each non-blank NDJSON line."""
+    for line_number, raw_line in enumerate(lines, start=1):
+        if isinstance(raw_line, bytes):
+            try:
+                raw_line = raw_line.decode("utf-8")
+            except UnicodeDecodeError:
+                yield line_number, None, "line is not valid UTF-8"
+                continue
+        raw_line = raw_line.strip()
+        if not raw_line:
+            continue
+        try:
+            record = json.loads(raw_line)
+        except ValueError as exc:
+            yield line_number, None, f"invalid JSON: {exc.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "each line must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def _error(line_number: int, message: str) -> dict[str, Any]:
+    return {"line": line_number, "status": "error", "error": message}
+
+
+class BulkImporter:
+    """Validate and insert NDJSON records in chunked transactions.
+
+    Only one chunk of parsed records is held in memory at a time. References
+    to owners, users, places and amenities are resolved with one IN query per
+    chunk instead of one lookup per row.
+    """
+
+    def __init__(self, facade: "HBnBFacade", chunk_size: int = 500) -> None:
+        self.facade = facade
+        self.chunk_size = max(1, chunk_size)
+
+    def run(self, kind: str, lines: Iterable[bytes | str]) -> Iterator[dict[str, Any]]:
+        """Import records of one kind and yield one result per input line."""
+        if kind not in BULK_KINDS:
+            raise ValueError(f"Unsupported bulk kind: {kind}")
+
+        builder = getattr(self, f"_build_{kind}")
+        created = failed = 0
+        chunk: list[tuple[int, Any, str | None]] = []
+        for parsed in iter_ndjson(lines):
+            chunk.append(parsed)
+            if len(chunk) >= self.chunk_size:
+                for result in self._import_chunk(builder, chunk):
+                    created, failed = self._tally(result, created, failed)
+                    yield result
+                chunk = []
+        if chunk:
+            for result in self._import_chunk(builder, chunk):
+                created, failed = self._tally(result, created, failed)
+                yield result
+
+        yield {"summary": {"kind": kind, "created": created, "failed": failed}}
+
+    @staticmethod
+    def _tally(result: dict[str, Any], created: int, failed: int) -> tuple[int, int]:
+        if result["status"] == "created":
+            return created + 1, failed
+        return created, failed + 1
+
+    def _import_chunk(self, builder, chunk) -> list[dict[str, Any]]:
+        results: dict[int, dict[str, Any]] = {}
+        records: list[tuple[int, dict[str, Any]]] = []
+        for line_number, record, error in chunk:
+            if error is not None:
+                results[line_number] = _error(line_number, error)
+            else:
+                records.append((line_number, record))
+
+        entities: list[tuple[int, Any]] = []
+        for line_number, outcome in builder(records):
+            if isinstance(outcome, str):
+                results[line_number] = _error(line_number, outcome)
+            else:
+                entities.append((line_number, outcome))
+
+        if entities:
+            repository = self._repository_for(entities[0][1])
+            try:
+                with self.facade.unit_of_work():
+                    repository.save_many(entity for _, entity in entities)
+                    self._apply_rating_totals(entity for _, entity in entities)
+            except SQLAlchemyError as exc:
+                message = f"chunk rejected by database: {exc.__class__.__name__}"
+                for line_number, _ in entities:
+                    results[line_number] = _error(line_number, message)
+            else:
+                self._invalidate_cache(entity for _, entity in entities)
+                for line_number, entity in entities:
+                    results[line_number] = {
+                        "line": line_number,
+                        "status": "created",
+                        "id": entity.id,
+                    }
+
+        return [results[line_number] for line_number in sorted(results)]
+
+    def _apply_rating_totals(self, entities: Iterable[Any]) -> None:
+        totals: dict[str, list[int]] = {}
+        for entity in entities:
+            if isinstance(entity, Review):
+                place_totals = totals.setdefault(entity.place_id, [0, 0])
+                place_totals[0] += 1
+                place_totals[1] += entity.rating
+        for place_id, (review_count, rating_sum) in totals.items():
+            self.facade.places.adjust_rating_totals(place_id, review_count, rating_sum)
+
+    def _invalidate_cache(self, entities: Iterable[Any]) -> None:
+        tags: set[str] = set()
+        for entity in entities:
+            if isinstance(entity, Review):
+                tags.add(f"place:{entity.place_id}")
+            elif isinstance(entity, Amenity):
+                tags.add("amenities")
+        self.facade.invalidate_cache(*tags)
+
+    def _repository_for(self, entity: Any):
+        if isinstance(entity, Place):
+            return self.facade.places
+        if isinstance(entity, Review):
+            return self.facade.reviews
+        return self.facade.amenities
+
+    def _build_amenities(self, records):
+        names: list[str] = []
+        for _, record in records:
+            name = record.get("name")
+            if isinstance(name, str) and name.strip():
+                names.append(name.strip())
+        existing = {
+            amenity.name for amenity in self.facade.amenities.filter(In("name", set(names)))
+        }
+
+        for line_number, record in records:
+            try:
+                name = Amenity.validate_name(record.get("name"))
+            except ValueError as exc:
+                yield line_number, str(exc)
+                continue
+            if name in existing:
+                yield line_number, "Amenity already exists"
+                continue
+            existing.add(name)
+            yield line_number, Amenity(name=name)
+
+    def _build_places(self, records):
+        owner_ids = {str(record.get("owner_id")) for _, record in records}
+        amenity_ids = {
+            str(amenity_id)
+            for _, record in records
+            if isinstance(record.get("amenity_ids"), list)
+            for amenity_id in record["amenity_ids"]
+        }
+        owners = {user.id: user for user in self.facade.users.get_by_ids(owner_ids)}
+        amenities = {
+            amenity.id: amenity for amenity in self.facade.amenities.get_by_ids(amenity_ids)
+        }
+
+        for line_number, record in records:
+            try:
+                Place.validate_payload(record)
+            except ValueError as exc:
+                yield line_number, str(exc)
+                continue
+            owner = owners.get(str(record.get("owner_id")))
+            if owner is None:
+                yield line_number, "Owner not found"
+                continue
+            requested = record.get("amenity_ids") or []
+            if not isinstance(requested, list):
+                yield line_number, "amenity_ids must be a list"
+                continue
+            requested = list(dict.fromkeys(str(amenity_id) for amenity_id in requested))
+            if any(amenity_id not in amenities for amenity_id in requested):
+                yield line_number, "Amenity not found"
+                continue
+
+            place = Place(
+                name=str(record["name"]).strip(),
+                description=record.get("description"),
+                price=float(record["price"]),
+                latitude=float(record["latitude"]),
+                longitude=float(record["longitude"]),
+                owner_id=owner.id,
+            )
+            place.amenities = [amenities[amenity_id] for amenity_id in requested]
+            yield line_number, place
+
+    def _build_reviews(self, records):
+        user_ids = {str(record.get("user_id")) for _, record in records}
+        place_ids = {str(record.get("place_id")) for _, record in records}
+        known_users = {user.id for user in self.facade.users.get_by_ids(user_ids)}
+        known_places = {place.id for place in self.facade.places.get_by_ids(place_ids)}
+        reviewed = {
+            (review.user_id, review.place_id)
+            for review in self.facade.reviews.filter(
+                In("user_id", known_users) & In("place_id", known_places)
+            )
+        }
+
+        for line_number, record in records:
+            try:
+                Review.validate_payload(record)
+            except ValueError as exc:
+                yield line_number, str(exc)
+                continue
+            user_id = str(record.get("user_id"))
+            place_id = str(record.get("place_id"))
+            if user_id not in known_users:
+                yield line_number, "User not found"
+                continue
+            if place_id not in known_places:
+                yield line_number, "Place not found"
+                continue
+            if (user_id, place_id) in reviewed:
+                yield line_number, "You have already reviewed this place"
+                continue
+            reviewed.add((user_id, place_id))
+            yield line_number, Review(
+                rating=int(record["rating"]),
+                comment=str(record["comment"]).strip(),
+                user_id=user_id,
+                place_id=place_id,
+            )
+
+
+__all__ = ["BULK_KINDS", "BulkImporter", "iter_ndjson"]
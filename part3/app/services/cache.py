@@ -0,0 +1,155 @@
+"""Pluggable document caches used by the HBnB facade."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+
+class NullCache:
+    """Cache backend that never stores anything."""
+
+    def get(self, key: str) -> Any | None:
+        return None
+
+    def set(self, key: str, value: Any, size: int = 1, tags: Iterable[str] = ()) -> None:
+        return None
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        return 0
+
+    def clear(self) -> None:
+        return None
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0}
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float
+    tags: frozenset[str] = field(default_factory=frozenset)
+
+
+class LRUCache:
+    """Thread-safe in-process LRU cache with TTL, byte bound and tag invalidation.
+
+    Every entry is also indexed under the tags it was stored with so writers can
+    evict exactly the documents that embed a changed entity.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """Return a live cached value or `None`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: Any, size: int = 1, tags: Iterable[str] = ()) -> None:
+        """Store a value, evicting least recently used entries to fit the bounds."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            entry = _Entry(
+                value=value,
+                size=size,
+                expires_at=self._clock() + self.ttl,
+                tags=frozenset(tags),
+            )
+            self._entries[key] = entry
+            self._bytes += size
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Evict every entry stored under any of the provided tags."""
+        removed = 0
+        with self._lock:
+            for tag in set(tags):
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+
+def build_cache(config: dict[str, Any]) -> LRUCache | NullCache:
+    """Create the facade cache described by the Flask configuration."""
+    if not config.get("FACADE_CACHE_ENABLED", False):
+        return NullCache()
+    return LRUCache(
+        max_entries=int(config.get("FACADE_CACHE_MAX_ENTRIES", 1024)),
+        max_bytes=int(config.get("FACADE_CACHE_MAX_BYTES", 16 * 1024 * 1024)),
+        ttl=float(config.get("FACADE_CACHE_TTL", 60)),
+    )
+
+
+__all__ = ["LRUCache", "NullCache", "build_cache"]
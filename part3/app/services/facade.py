@@ -2,25 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Any
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
 
+from sqlalchemy import func
+
+from app.geo import BoundingBox, haversine_km, intersect_boxes, radius_boxes, ring_radii
 from app.models import Amenity, Place, Review, User
 from app.persistence import (
     AmenityRepository,
+    Page,
+    PlaceProjection,
     PlaceRepository,
     ReviewRepository,
+    SearchHit,
     UserRepository,
+    unit_of_work,
 )
+from app.services.cache import LRUCache, NullCache
+
+
+USER_ORDERING = ("email",)
+PLACE_ORDERING = ("created_at", "id")
+REVIEW_ORDERING = ("created_at", "id")
+AMENITY_ORDERING = ("name_key", "name")
 
 
 class HBnBFacade:
     """Service facade for repository-backed persistence workflows."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: LRUCache | NullCache | None = None,
+        replica_lag: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self.users = UserRepository()
         self.places = PlaceRepository()
         self.reviews = ReviewRepository()
         self.amenities = AmenityRepository()
+        self.cache = cache if cache is not None else NullCache()
+        # Reads may come from a replica this far behind, so fresh writes skip cache fills
+        self.replica_lag = replica_lag
+        self._clock = clock
+        self._written: dict[str | None, float] = {}
+        self._written_lock = threading.Lock()
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["HBnBFacade"]:
+        """Run several facade operations in one transaction with a single commit."""
+        with unit_of_work(self.users.session):
+            yield self
 
     def create_user(self, data: dict[str, Any]) -> User:
         """Create and persist a user after validation."""
@@ -42,7 +77,16 @@ class HBnBFacade:
 
     def list_users(self) -> list[User]:
         """Return all users ordered by email."""
-        return sorted(self.users.list(), key=lambda user: user.email)
+        return self.users.list(order_by=USER_ORDERING)
+
+    def paginate_users(self, limit: int, cursor: str | None = None) -> Page[User]:
+        """Return one page of users ordered by email."""
+        return self.users.paginate(USER_ORDERING, limit, cursor)
+
+    def get_users_by_ids(self, user_ids: Iterable[str]) -> list[User]:
+        """Load users with one IN query, in request order, skipping unknown ids."""
+        ids = list(dict.fromkeys(user_ids))
+        return _in_order(self.users.get_by_ids(ids), ids)
 
     def get_user(self, user_id: str) -> User | None:
         """Retrieve a single user."""
@@ -83,11 +127,31 @@ class HBnBFacade:
                 raise ValueError("is_admin must be a boolean")
             user.is_admin = data["is_admin"]
 
-        return self.users.save(user)
+        self.users.save(user)
+        self.invalidate_cache(f"user:{user.id}")
+        return user
 
     def delete_user(self, user_id: str) -> bool:
-        """Delete a user."""
-        return self.users.delete(user_id)
+        """Delete a user and release their reviews from other places' totals."""
+        with self.unit_of_work():
+            totals = (
+                self.reviews.session.query(
+                    Review.place_id,
+                    func.count(Review.id),
+                    func.sum(Review.rating),
+                )
+                .join(Place, Place.id == Review.place_id)
+                .filter(Review.user_id == user_id, Place.owner_id != user_id)
+                .group_by(Review.place_id)
+                .all()
+            )
+            deleted = self.users.delete(user_id)
+            if deleted:
+                for place_id, review_count, rating_sum in totals:
+                    self.places.adjust_rating_totals(place_id, -review_count, -int(rating_sum))
+        if deleted:
+            self.invalidate_cache(f"user:{user_id}", *(f"place:{row[0]}" for row in totals))
+        return deleted
 
     def create_place(self, data: dict[str, Any]) -> Place:
         """Create and persist a place."""
@@ -97,12 +161,7 @@ class HBnBFacade:
         if owner is None:
             raise ValueError("Owner not found")
 
-        amenities: list[Amenity] = []
-        for amenity_id in data.get("amenity_ids", []):
-            amenity = self.amenities.get(str(amenity_id))
-            if amenity is None:
-                raise ValueError("Amenity not found")
-            amenities.append(amenity)
+        amenities = self.resolve_amenities(data.get("amenity_ids", []))
 
         place = Place(
             name=str(data["name"]).strip(),
@@ -116,13 +175,171 @@ class HBnBFacade:
         place.amenities = amenities
         return self.places.save(place)
 
-    def list_places(self) -> list[Place]:
-        """Return all places."""
-        return sorted(self.places.list(), key=lambda place: place.created_at)
+    def list_places(self, profile: str | None = None) -> list[Place]:
+        """Return all places ordered by creation time."""
+        return self.places.list(
+            order_by=PLACE_ORDERING,
+            options=self.places.profile_options(profile),
+        )
+
+    def paginate_places(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        profile: str | None = "card",
+        projection: PlaceProjection | None = None,
+        amenity_ids: Iterable[str] | None = None,
+    ) -> Page[Place]:
+        """Return one page of places ordered by creation time.
+
+        A projection, when given, replaces the loading profile so only the
+        requested columns and relationships are fetched. `amenity_ids` keeps
+        places that have every listed amenity.
+        """
+        if projection is not None:
+            options = projection.options()
+        else:
+            options = self.places.profile_options(profile)
+        predicate = self.places.amenity_filter(amenity_ids) if amenity_ids else None
+        return self.places.paginate(
+            PLACE_ORDERING,
+            limit,
+            cursor,
+            options=options,
+            predicate=predicate,
+        )
 
-    def get_place(self, place_id: str) -> Place | None:
-        """Retrieve a place."""
-        return self.places.get(place_id)
+    def get_place(
+        self,
+        place_id: str,
+        profile: str | None = None,
+        projection: PlaceProjection | None = None,
+    ) -> Place | None:
+        """Retrieve a place, eagerly loading the relationships of a profile or projection."""
+        if projection is not None:
+            return self.places.get(place_id, options=projection.options())
+        return self.places.get_with_profile(place_id, profile)
+
+    def get_places_by_ids(
+        self,
+        place_ids: Iterable[str],
+        profile: str | None = "card",
+        projection: PlaceProjection | None = None,
+    ) -> list[Place]:
+        """Load places with one IN query, in request order, skipping unknown ids."""
+        ids = list(dict.fromkeys(place_ids))
+        if projection is not None:
+            options = projection.options()
+        else:
+            options = self.places.profile_options(profile)
+        return _in_order(self.places.get_by_ids(ids, options=options), ids)
+
+    def search_places(
+        self,
+        limit: int,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        radius_km: float | None = None,
+        bbox: list[BoundingBox] | None = None,
+        profile: str | None = "card",
+        projection: PlaceProjection | None = None,
+        amenity_ids: Iterable[str] | None = None,
+    ) -> list[tuple[Place, float | None]]:
+        """Return up to `limit` places inside a radius and/or bounding box.
+
+        Candidates come from the geohash index as bare coordinates and are
+        refined with exact haversine distances; only the surviving page is
+        loaded as full places. Results are sorted by distance when a centre is
+        given, otherwise by creation time in SQL.
+        """
+        has_center = latitude is not None or longitude is not None
+        if has_center and (latitude is None or longitude is None):
+            raise ValueError("lat and lng must be provided together")
+        if has_center:
+            if not (-90 <= latitude <= 90) or not (-180 <= longitude <= 180):
+                raise ValueError("lat must be between -90 and 90 and lng between -180 and 180")
+        if radius_km is not None:
+            if not has_center:
+                raise ValueError("radius_km requires lat and lng")
+            if radius_km <= 0:
+                raise ValueError("radius_km must be positive")
+        elif not bbox:
+            raise ValueError("radius_km or bbox is required for a location search")
+
+        predicate = self.places.amenity_filter(amenity_ids) if amenity_ids else None
+        matches: list[tuple[str, float | None]]
+        if has_center:
+            matches = self._nearest_places(limit, latitude, longitude, radius_km, bbox, predicate)
+        else:
+            # The bounding boxes are exact, so SQL can sort and cut the page
+            rows = self.places.locate(bbox, predicate, limit=limit)
+            matches = [(place_id, None) for place_id, *_ in rows]
+
+        if projection is not None:
+            options = projection.options()
+        else:
+            options = self.places.profile_options(profile)
+        loaded = {
+            place.id: place
+            for place in self.places.get_by_ids(
+                (place_id for place_id, _ in matches),
+                options=options,
+            )
+        }
+        return [
+            (loaded[place_id], distance)
+            for place_id, distance in matches
+            if place_id in loaded
+        ]
+
+    def _nearest_places(
+        self,
+        limit: int,
+        latitude: float,
+        longitude: float,
+        radius_km: float | None,
+        bbox: list[BoundingBox] | None,
+        predicate,
+    ) -> list[tuple[str, float]]:
+        """Return `(id, distance)` for the nearest places, searching rings of growing radius.
+
+        Once a ring holds `limit` places within its radius, no place outside it
+        can be nearer, so dense areas never read the whole search area.
+        """
+        for ring_km in ring_radii(radius_km):
+            if ring_km is None:
+                boxes = bbox
+            else:
+                boxes = radius_boxes(latitude, longitude, ring_km)
+                if bbox:
+                    boxes = intersect_boxes(boxes, bbox)
+            final = ring_km == radius_km
+            if not boxes and not final:
+                continue
+            matches: list[tuple[float, str]] = []
+            for place_id, place_lat, place_lng, _ in self.places.locate(boxes, predicate):
+                distance = haversine_km(latitude, longitude, place_lat, place_lng)
+                if ring_km is None or distance <= ring_km:
+                    matches.append((distance, place_id))
+            if final or len(matches) >= limit:
+                matches.sort()
+                return [(place_id, distance) for distance, place_id in matches[:limit]]
+        return []
+
+    def search_place_text(
+        self,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        profile: str | None = "card",
+        projection: PlaceProjection | None = None,
+    ) -> Page[SearchHit[Place]]:
+        """Return places whose name or description match `query`, best BM25 score first."""
+        if projection is not None:
+            options = projection.options()
+        else:
+            options = self.places.profile_options(profile)
+        return self.places.search(query, limit, cursor, options=options)
 
     def update_place(self, place_id: str, data: dict[str, Any]) -> Place | None:
         """Apply place updates and persist them."""
@@ -131,20 +348,20 @@ class HBnBFacade:
             return None
         update_data = dict(data)
         if "amenity_ids" in data:
-            amenities: list[Amenity] = []
-            for amenity_id in data["amenity_ids"] or []:
-                amenity = self.amenities.get(str(amenity_id))
-                if amenity is None:
-                    raise ValueError("Amenity not found")
-                amenities.append(amenity)
-            place.amenities = amenities
+            place.amenities = self.resolve_amenities(data["amenity_ids"] or [])
             update_data.pop("amenity_ids", None)
         place.update_from_payload(update_data)
-        return self.places.save(place)
+        place.touch()
+        self.places.save(place)
+        self.invalidate_cache(f"place:{place_id}")
+        return place
 
     def delete_place(self, place_id: str) -> bool:
         """Delete a place."""
-        return self.places.delete(place_id)
+        deleted = self.places.delete(place_id)
+        if deleted:
+            self.invalidate_cache(f"place:{place_id}")
+        return deleted
 
     def create_review(self, data: dict[str, Any]) -> Review:
         """Create and persist a review."""
@@ -167,11 +384,33 @@ class HBnBFacade:
         )
         review.author = user
         review.place = place
-        return self.reviews.save(review)
+        with self.unit_of_work():
+            self.reviews.save(review)
+            self.places.adjust_rating_totals(place_id, 1, review.rating)
+        self.invalidate_cache(f"place:{place_id}")
+        return review
 
     def list_reviews(self) -> list[Review]:
-        """Return all reviews."""
-        return sorted(self.reviews.list(), key=lambda review: review.created_at)
+        """Return all reviews ordered by creation time."""
+        return self.reviews.list(order_by=REVIEW_ORDERING)
+
+    def paginate_reviews(self, limit: int, cursor: str | None = None) -> Page[Review]:
+        """Return one page of reviews ordered by creation time."""
+        return self.reviews.paginate(REVIEW_ORDERING, limit, cursor)
+
+    def get_reviews_by_ids(self, review_ids: Iterable[str]) -> list[Review]:
+        """Load reviews with one IN query, in request order, skipping unknown ids."""
+        ids = list(dict.fromkeys(review_ids))
+        return _in_order(self.reviews.get_by_ids(ids), ids)
+
+    def search_review_text(
+        self,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> Page[SearchHit[Review]]:
+        """Return reviews whose comment matches `query`, best BM25 score first."""
+        return self.reviews.search(query, limit, cursor)
 
     def list_reviews_for_place(self, place_id: str) -> list[Review]:
         """Return reviews for a place."""
@@ -190,12 +429,32 @@ class HBnBFacade:
         review = self.reviews.get(review_id)
         if review is None:
             return None
+        previous_rating = review.rating
         review.update_from_payload(data)
-        return self.reviews.save(review)
+        with self.unit_of_work():
+            self.reviews.save(review)
+            self.places.adjust_rating_totals(review.place_id, 0, review.rating - previous_rating)
+        self.invalidate_cache(f"place:{review.place_id}")
+        return review
 
     def delete_review(self, review_id: str) -> bool:
-        """Delete a review."""
-        return self.reviews.delete(review_id)
+        """Delete a review and remove it from its place's rating totals."""
+        review = self.reviews.get(review_id)
+        if review is None:
+            return False
+        place_id, rating = review.place_id, review.rating
+        with self.unit_of_work():
+            self.reviews.delete(review_id)
+            self.places.adjust_rating_totals(place_id, -1, -rating)
+        self.invalidate_cache(f"place:{place_id}")
+        return True
+
+    def recompute_place_ratings(self) -> int:
+        """Rebuild denormalized review totals for every place."""
+        updated = self.places.recompute_rating_totals()
+        self.cache.clear()
+        self._note_writes([None])
+        return updated
 
     def create_amenity(self, data: dict[str, Any]) -> Amenity:
         """Create and persist an amenity."""
@@ -203,11 +462,22 @@ class HBnBFacade:
         if self.amenities.get_by_name(name) is not None:
             raise ValueError("Amenity already exists")
         amenity = Amenity(name=name)
-        return self.amenities.save(amenity)
+        self.amenities.save(amenity)
+        self.invalidate_cache("amenities")
+        return amenity
 
     def list_amenities(self) -> list[Amenity]:
-        """Return all amenities."""
-        return sorted(self.amenities.list(), key=lambda amenity: amenity.name.lower())
+        """Return all amenities ordered by name."""
+        return self.amenities.list(order_by=AMENITY_ORDERING)
+
+    def paginate_amenities(self, limit: int, cursor: str | None = None) -> Page[Amenity]:
+        """Return one page of amenities ordered by name, ignoring case."""
+        return self.amenities.paginate(AMENITY_ORDERING, limit, cursor)
+
+    def get_amenities_by_ids(self, amenity_ids: Iterable[str]) -> list[Amenity]:
+        """Load amenities with one IN query, in request order, skipping unknown ids."""
+        ids = list(dict.fromkeys(amenity_ids))
+        return _in_order(self.amenities.get_by_ids(ids), ids)
 
     def get_amenity(self, amenity_id: str) -> Amenity | None:
         """Retrieve an amenity."""
@@ -223,7 +493,17 @@ class HBnBFacade:
         if existing is not None and existing.id != amenity.id:
             raise ValueError("Amenity already exists")
         amenity.name = name
-        return self.amenities.save(amenity)
+        self.amenities.save(amenity)
+        self.invalidate_cache("amenities", f"amenity:{amenity_id}")
+        return amenity
+
+    def resolve_amenities(self, amenity_ids) -> list[Amenity]:
+        """Load amenities for the given ids with one query, preserving order."""
+        ids = list(dict.fromkeys(str(amenity_id) for amenity_id in amenity_ids))
+        found = {amenity.id: amenity for amenity in self.amenities.get_by_ids(ids)}
+        if len(found) != len(ids):
+            raise ValueError("Amenity not found")
+        return [found[amenity_id] for amenity_id in ids]
 
     def delete_amenity(self, amenity_id: str) -> bool:
         """Delete an amenity."""
@@ -231,11 +511,205 @@ class HBnBFacade:
         if amenity is None:
             return False
         amenity.places.clear()
-        return self.amenities.delete(amenity_id)
-
-    def serialize_place(self, place: Place) -> dict[str, Any]:
+        deleted = self.amenities.delete(amenity_id)
+        self.invalidate_cache("amenities", f"amenity:{amenity_id}")
+        return deleted
+
+    def bulk_import(
+        self,
+        kind: str,
+        lines: Iterable[bytes | str],
+        chunk_size: int = 500,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream per-line results while importing NDJSON records in chunks."""
+        from app.services.bulk_import import BulkImporter
+
+        return BulkImporter(self, chunk_size=chunk_size).run(kind, lines)
+
+    def get_version(self, kind: str, entity_id: str | None = None) -> tuple | None:
+        """Return change-detection values for an entity or a whole collection."""
+        repositories = {
+            "users": self.users,
+            "places": self.places,
+            "reviews": self.reviews,
+            "amenities": self.amenities,
+        }
+        repository = repositories[kind]
+        if entity_id is None:
+            return repository.collection_version()
+        return repository.version(entity_id)
+
+    def serialize_place(
+        self,
+        place: Place,
+        projection: PlaceProjection | None = None,
+    ) -> dict[str, Any]:
         """Serialize a place with ORM-managed relationship data."""
-        return place.to_dict()
+        return self.serialize_places([place], projection)[0]
+
+    def serialize_places(
+        self,
+        places: list[Place],
+        projection: PlaceProjection | None = None,
+    ) -> list[dict[str, Any]]:
+        """Serialize places, fetching capped review lists with a single query."""
+        if projection is None:
+            return [place.to_dict() for place in places]
+
+        latest: dict[str, list[Review]] = {}
+        if "reviews" in projection.expand and projection.reviews_limit is not None:
+            latest = self.reviews.latest_for_places(
+                (place.id for place in places),
+                projection.reviews_limit,
+            )
+        return [
+            place.to_dict(
+                fields=projection.fields,
+                expand=projection.expand,
+                reviews=latest.get(place.id, []) if projection.reviews_limit is not None else None,
+            )
+            for place in places
+        ]
+
+    def get_place_document(
+        self,
+        place_id: str,
+        projection: PlaceProjection | None = None,
+        version: tuple | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the serialized place detail, read through the cache.
+
+        A cached copy built from another `version` than the one given, as
+        returned by `get_version`, is treated as a miss.
+        """
+
+        def load() -> dict[str, Any] | None:
+            place = self.get_place(place_id, profile="detail", projection=projection)
+            return self.serialize_place(place, projection) if place is not None else None
+
+        def tags(document: dict[str, Any]) -> list[str]:
+            owner = document.get("owner")
+            return [
+                f"place:{place_id}",
+                *([f"user:{owner['id']}"] if owner else []),
+                *(f"amenity:{amenity['id']}" for amenity in document.get("amenities", [])),
+            ]
+
+        key = f"place:{place_id}"
+        if projection is not None:
+            key = f"{key}:{projection.cache_key}"
+        return self._read_through(key, load, tags, version)
+
+    def get_user_document(
+        self,
+        user_id: str,
+        version: tuple | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the serialized user, read through the cache at `version`."""
+
+        def load() -> dict[str, Any] | None:
+            user = self.get_user(user_id)
+            return user.to_dict() if user is not None else None
+
+        return self._read_through(
+            f"user:{user_id}",
+            load,
+            lambda _: [f"user:{user_id}"],
+            version,
+        )
+
+    def get_amenity_document(
+        self,
+        amenity_id: str,
+        version: tuple | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the serialized amenity, read through the cache at `version`."""
+
+        def load() -> dict[str, Any] | None:
+            amenity = self.get_amenity(amenity_id)
+            return amenity.to_dict() if amenity is not None else None
+
+        return self._read_through(
+            f"amenity:{amenity_id}",
+            load,
+            lambda _: [f"amenity:{amenity_id}"],
+            version,
+        )
+
+    def get_amenity_page_document(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        version: tuple | None = None,
+    ) -> dict[str, Any]:
+        """Return one serialized amenity page with its next cursor, read through the cache.
+
+        `version` is the amenities collection version, as for `get_amenity_document`.
+        """
+
+        def load() -> dict[str, Any]:
+            page = self.paginate_amenities(limit, cursor)
+            return {
+                "items": [amenity.to_dict() for amenity in page.items],
+                "next_cursor": page.next_cursor,
+            }
+
+        key = f"amenities:{limit}:{cursor or ''}"
+        return self._read_through(key, load, lambda _: ["amenities"], version)
+
+    def _read_through(self, key: str, load, tags, version: tuple | None = None) -> Any | None:
+        # Each entry records the version it was built from. Other workers write to the
+        # database without evicting this process's cache, so a copy whose version no
+        # longer matches is stale and would be served under the new version's ETag.
+        stamp = None if version is None else "|".join(str(value) for value in version)
+        cached = self.cache.get(key)
+        if cached is not None:
+            cached_stamp, document = json.loads(cached)
+            if stamp is None or cached_stamp == stamp:
+                return document
+        document = load()
+        if document is not None:
+            document_tags = list(tags(document))
+            if not self._written_recently(document_tags):
+                encoded = json.dumps([stamp, document], separators=(",", ":"))
+                self.cache.set(key, encoded, size=len(encoded), tags=document_tags)
+        return document
+
+    def invalidate_cache(self, *tags: str) -> None:
+        """Evict cached documents stored under any of the given tags."""
+        self.cache.invalidate_tags(tags)
+        self._note_writes(tags)
+
+    def _note_writes(self, tags: Iterable[str | None]) -> None:
+        # `None` stands for every tag, after the whole cache was cleared
+        if self.replica_lag <= 0:
+            return
+        now = self._clock()
+        with self._written_lock:
+            for tag in tags:
+                self._written.pop(tag, None)
+                self._written[tag] = now
+            # Oldest writes come first, so expired ones are pruned from the front
+            cutoff = now - self.replica_lag
+            for tag, written_at in list(self._written.items()):
+                if written_at > cutoff:
+                    break
+                del self._written[tag]
+
+    def _written_recently(self, tags: Iterable[str]) -> bool:
+        """Return whether a replica might still miss a write to any of the tags."""
+        if self.replica_lag <= 0:
+            return False
+        cutoff = self._clock() - self.replica_lag
+        with self._written_lock:
+            if self._written.get(None, cutoff) > cutoff:
+                return True
+            return any(self._written.get(tag, cutoff) > cutoff for tag in tags)
+
+
+def _in_order(entities: Iterable[Any], ids: list[str]) -> list[Any]:
+    found = {entity.id: entity for entity in entities}
+    return [found[entity_id] for entity_id in ids if entity_id in found]
 
 
 __all__ = ["HBnBFacade"]
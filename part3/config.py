@@ -16,7 +16,11 @@ def _resolve_database_uri(env_var: str, default_filename: str) -> str:
         if default_filename == ":memory:":
             return "sqlite:///:memory:"
         return f"sqlite:///{INSTANCE_DIR / default_filename}"
+    return _normalize_database_uri(database_url)
 
+
+def _normalize_database_uri(database_url: str) -> str:
+    """Anchor relative SQLite paths to the Part 3 directory."""
     if database_url.startswith("sqlite:///") and not database_url.startswith("sqlite:////"):
         relative_path = database_url.removeprefix("sqlite:///")
         return f"sqlite:///{(BASE_DIR / relative_path).resolve()}"
@@ -30,6 +34,41 @@ class Config:
     DEBUG = False
     TESTING = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    API_DEFAULT_PAGE_SIZE = int(os.getenv("API_DEFAULT_PAGE_SIZE", "100"))
+    API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "500"))
+    API_MAX_BATCH_IDS = int(os.getenv("API_MAX_BATCH_IDS", "100"))
+    BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "500"))
+    FACADE_CACHE_ENABLED = os.getenv("FACADE_CACHE_ENABLED", "true").lower() == "true"
+    FACADE_CACHE_TTL = float(os.getenv("FACADE_CACHE_TTL", "60"))
+    FACADE_CACHE_MAX_ENTRIES = int(os.getenv("FACADE_CACHE_MAX_ENTRIES", "1024"))
+    FACADE_CACHE_MAX_BYTES = int(os.getenv("FACADE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+    GEO_DEFAULT_RADIUS_KM = float(os.getenv("GEO_DEFAULT_RADIUS_KM", "25"))
+    GEO_MAX_RADIUS_KM = float(os.getenv("GEO_MAX_RADIUS_KM", "1000"))
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_FOREIGN_KEYS = os.getenv("SQLITE_FOREIGN_KEYS", "true").lower() == "true"
+    DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+    DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+    DATABASE_POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+    DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))
+    DATABASE_REPLICA_URLS = [
+        _normalize_database_uri(url.strip())
+        for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",")
+        if url.strip()
+    ]
+    DATABASE_REPLICA_STRATEGY = os.getenv("DATABASE_REPLICA_STRATEGY", "round_robin")
+    DATABASE_REPLICA_LAG = float(os.getenv("DATABASE_REPLICA_LAG", "5"))
+    BCRYPT_LOG_ROUNDS = int(os.getenv("BCRYPT_LOG_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS = int(
+        os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+    )
+    PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "32"))
+    PASSWORD_HASH_ACQUIRE_TIMEOUT = float(os.getenv("PASSWORD_HASH_ACQUIRE_TIMEOUT", "0.05"))
+    PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "1"))
 
 
 class DevelopmentConfig(Config):
@@ -40,6 +79,8 @@ class DevelopmentConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     DEBUG = True
+    BCRYPT_LOG_ROUNDS = 4
+    PASSWORD_HASH_WORKERS = 0
     SQLALCHEMY_DATABASE_URI = _resolve_database_uri("TEST_DATABASE_URL", ":memory:")
 
 
@@ -1,5 +1,8 @@
 PRAGMA foreign_keys = ON;
 
+DROP TABLE IF EXISTS collection_versions;
+DROP TABLE IF EXISTS reviews_fts;
+DROP TABLE IF EXISTS places_fts;
 DROP TABLE IF EXISTS place_amenity;
 DROP TABLE IF EXISTS reviews;
 DROP TABLE IF EXISTS places;
@@ -18,6 +21,7 @@ CREATE TABLE users (
 );
 
 CREATE INDEX idx_users_email ON users(email);
+CREATE INDEX ix_users_updated_at ON users(updated_at);
 
 CREATE TABLE amenities (
     id TEXT PRIMARY KEY,
@@ -27,6 +31,8 @@ CREATE TABLE amenities (
 );
 
 CREATE INDEX idx_amenities_name ON amenities(name);
+CREATE INDEX ix_amenities_name_lower ON amenities(lower(name), name);
+CREATE INDEX ix_amenities_updated_at ON amenities(updated_at);
 
 CREATE TABLE places (
     id TEXT PRIMARY KEY,
@@ -37,11 +43,19 @@ CREATE TABLE places (
     price REAL NOT NULL CHECK (price >= 0),
     latitude REAL NOT NULL CHECK (latitude BETWEEN -90 AND 90),
     longitude REAL NOT NULL CHECK (longitude BETWEEN -180 AND 180),
+    geohash TEXT,
+    search_key INTEGER,
+    review_count INTEGER NOT NULL DEFAULT 0 CHECK (review_count >= 0),
+    rating_sum INTEGER NOT NULL DEFAULT 0 CHECK (rating_sum >= 0),
     owner_id TEXT NOT NULL,
     FOREIGN KEY (owner_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
 CREATE INDEX idx_places_owner_id ON places(owner_id);
+CREATE INDEX ix_places_created_at_id ON places(created_at, id);
+CREATE INDEX ix_places_geohash ON places(geohash);
+CREATE UNIQUE INDEX ix_places_search_key ON places(search_key);
+CREATE INDEX ix_places_updated_at ON places(updated_at);
 
 CREATE TABLE reviews (
     id TEXT PRIMARY KEY,
@@ -49,6 +63,7 @@ CREATE TABLE reviews (
     updated_at TEXT NOT NULL,
     rating INTEGER NOT NULL CHECK (rating BETWEEN 1 AND 5),
     comment TEXT NOT NULL,
+    search_key INTEGER,
     user_id TEXT NOT NULL,
     place_id TEXT NOT NULL,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
@@ -58,6 +73,9 @@ CREATE TABLE reviews (
 
 CREATE INDEX idx_reviews_user_id ON reviews(user_id);
 CREATE INDEX idx_reviews_place_id ON reviews(place_id);
+CREATE INDEX ix_reviews_created_at_id ON reviews(created_at, id);
+CREATE UNIQUE INDEX ix_reviews_search_key ON reviews(search_key);
+CREATE INDEX ix_reviews_updated_at ON reviews(updated_at);
 
 CREATE TABLE place_amenity (
     place_id TEXT NOT NULL,
@@ -66,3 +84,125 @@ CREATE TABLE place_amenity (
     FOREIGN KEY (place_id) REFERENCES places(id) ON DELETE CASCADE,
     FOREIGN KEY (amenity_id) REFERENCES amenities(id) ON DELETE CASCADE
 );
+
+CREATE INDEX ix_place_amenity_amenity_id_place_id ON place_amenity(amenity_id, place_id);
+
+-- Full-text search: external-content FTS5 tables kept in sync by triggers,
+-- keyed on search_key because VACUUM may renumber the implicit rowid
+CREATE VIRTUAL TABLE places_fts USING fts5(
+    name,
+    description,
+    content='places',
+    content_rowid='search_key',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER places_fts_ai AFTER INSERT ON places BEGIN
+    UPDATE places SET search_key = (SELECT COALESCE(MAX(search_key), 0) + 1 FROM places)
+    WHERE rowid = new.rowid AND new.search_key IS NULL;
+    INSERT INTO places_fts(rowid, name, description)
+    SELECT search_key, name, description FROM places WHERE rowid = new.rowid;
+END;
+CREATE TRIGGER places_fts_ad AFTER DELETE ON places BEGIN
+    INSERT INTO places_fts(places_fts, rowid, name, description)
+    VALUES ('delete', old.search_key, old.name, old.description);
+END;
+CREATE TRIGGER places_fts_au AFTER UPDATE OF name, description ON places BEGIN
+    INSERT INTO places_fts(places_fts, rowid, name, description)
+    VALUES ('delete', old.search_key, old.name, old.description);
+    INSERT INTO places_fts(rowid, name, description)
+    VALUES (new.search_key, new.name, new.description);
+END;
+
+CREATE VIRTUAL TABLE reviews_fts USING fts5(
+    comment,
+    content='reviews',
+    content_rowid='search_key',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER reviews_fts_ai AFTER INSERT ON reviews BEGIN
+    UPDATE reviews SET search_key = (SELECT COALESCE(MAX(search_key), 0) + 1 FROM reviews)
+    WHERE rowid = new.rowid AND new.search_key IS NULL;
+    INSERT INTO reviews_fts(rowid, comment)
+    SELECT search_key, comment FROM reviews WHERE rowid = new.rowid;
+END;
+CREATE TRIGGER reviews_fts_ad AFTER DELETE ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, comment)
+    VALUES ('delete', old.search_key, old.comment);
+END;
+CREATE TRIGGER reviews_fts_au AFTER UPDATE OF comment ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, comment)
+    VALUES ('delete', old.search_key, old.comment);
+    INSERT INTO reviews_fts(rowid, comment) VALUES (new.search_key, new.comment);
+END;
+
+-- Collection ETags: one change counter per collection, bumped by triggers
+CREATE TABLE collection_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    changed_at TEXT NOT NULL
+);
+INSERT INTO collection_versions (name, version, changed_at) VALUES
+    ('users', 0, datetime('now')),
+    ('amenities', 0, datetime('now')),
+    ('reviews', 0, datetime('now')),
+    ('places', 0, datetime('now'));
+CREATE TRIGGER users_version_insert AFTER INSERT ON users BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('users', 'places');
+END;
+CREATE TRIGGER users_version_update AFTER UPDATE ON users BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('users', 'places');
+END;
+CREATE TRIGGER users_version_delete AFTER DELETE ON users BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('users', 'places');
+END;
+CREATE TRIGGER amenities_version_insert AFTER INSERT ON amenities BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('amenities', 'places');
+END;
+CREATE TRIGGER amenities_version_update AFTER UPDATE ON amenities BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('amenities', 'places');
+END;
+CREATE TRIGGER amenities_version_delete AFTER DELETE ON amenities BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('amenities', 'places');
+END;
+CREATE TRIGGER reviews_version_insert AFTER INSERT ON reviews BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('reviews', 'places');
+END;
+CREATE TRIGGER reviews_version_update AFTER UPDATE ON reviews BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('reviews', 'places');
+END;
+CREATE TRIGGER reviews_version_delete AFTER DELETE ON reviews BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('reviews', 'places');
+END;
+CREATE TRIGGER places_version_insert AFTER INSERT ON places BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('places');
+END;
+CREATE TRIGGER places_version_update AFTER UPDATE ON places BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('places');
+END;
+CREATE TRIGGER places_version_delete AFTER DELETE ON places BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('places');
+END;
+CREATE TRIGGER place_amenity_version_insert AFTER INSERT ON place_amenity BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('places');
+END;
+CREATE TRIGGER place_amenity_version_update AFTER UPDATE ON place_amenity BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('places');
+END;
+CREATE TRIGGER place_amenity_version_delete AFTER DELETE ON place_amenity BEGIN
+    UPDATE collection_versions SET version = version + 1, changed_at = datetime('now')
+    WHERE name IN ('places');
+END;
@@ -5,7 +5,40 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 PART3_DIR = Path(__file__).resolve().parents[1]
 
 if str(PART3_DIR) not in sys.path:
     sys.path.insert(0, str(PART3_DIR))
+
+
+@pytest.fixture
+def file_config(tmp_path):
+    """Build testing config classes on an SQLite file, so the data outlives one app."""
+    from config import TestingConfig
+
+    def build(**overrides):
+        attributes = {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'hbnb.db'}", **overrides}
+        return type("FileTestingConfig", (TestingConfig,), attributes)
+
+    return build
+
+
+@pytest.fixture
+def downgrade_schema():
+    """Run DDL against an app's database to recreate one from an older release.
+
+    The engine is disposed afterwards, so a new `create_app()` on the same
+    file starts from the downgraded schema.
+    """
+    from app import db
+
+    def run(app, *statements: str) -> None:
+        with app.app_context():
+            with db.engine.begin() as connection:
+                for statement in statements:
+                    connection.exec_driver_sql(statement)
+            db.engine.dispose()
+
+    return run
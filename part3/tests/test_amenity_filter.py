@@ -0,0 +1,103 @@
+"""Tests for amenity posting-list filters on the place listing."""
+
+from __future__ import annotations
+
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models import Amenity, Place, User
+from app.persistence.place_repository import HasAllAmenities
+from app.services import HBnBFacade
+
+
+def _seed(app) -> dict[str, str]:
+    with app.app_context():
+        owner = User(
+            first_name="Owner",
+            last_name="User",
+            email="owner@example.com",
+            password_hash="not-a-real-hash",
+        )
+        wifi, pool, parking = Amenity(name="WiFi"), Amenity(name="Pool"), Amenity(name="Parking")
+        db.session.add_all([owner, wifi, pool, parking])
+        layouts = {
+            "all": [wifi, pool, parking],
+            "wifi-pool": [wifi, pool],
+            "wifi": [wifi],
+            "none": [],
+        }
+        ids = {"wifi": wifi.id, "pool": pool.id, "parking": parking.id}
+        for name, amenities in layouts.items():
+            place = Place(
+                name=name,
+                price=80.0,
+                latitude=18.4,
+                longitude=-66.1,
+                owner_id=owner.id,
+            )
+            place.amenities = amenities
+            db.session.add(place)
+        db.session.commit()
+        return ids
+
+
+def _names(response) -> list[str]:
+    assert response.status_code == 200
+    return sorted(place["name"] for place in response.get_json())
+
+
+def test_listing_intersects_requested_amenities():
+    app = create_app("testing")
+    ids = _seed(app)
+
+    with app.test_client() as client:
+        wifi = client.get(f"/api/v1/places/?amenity_id={ids['wifi']}")
+        wifi_pool = client.get(
+            f"/api/v1/places/?amenity_id={ids['wifi']}&amenity_id={ids['pool']}"
+        )
+        every = client.get(
+            "/api/v1/places/?"
+            f"amenity_id={ids['wifi']}&amenity_id={ids['pool']}&amenity_id={ids['parking']}"
+        )
+        unknown = client.get(f"/api/v1/places/?amenity_id={ids['wifi']}&amenity_id=missing")
+        nearby = client.get(
+            f"/api/v1/places/?lat=18.4&lng=-66.1&radius_km=5&amenity_id={ids['parking']}"
+        )
+
+    assert _names(wifi) == ["all", "wifi", "wifi-pool"]
+    assert _names(wifi_pool) == ["all", "wifi-pool"]
+    assert _names(every) == ["all"]
+    assert _names(unknown) == []
+    assert _names(nearby) == ["all"]
+
+
+def test_amenity_filter_starts_from_shortest_posting_list():
+    app = create_app("testing")
+    ids = _seed(app)
+
+    with app.app_context():
+        predicate = HBnBFacade().places.amenity_filter([ids["wifi"], ids["parking"], ids["pool"]])
+
+    assert predicate == HasAllAmenities((ids["parking"], ids["pool"], ids["wifi"]))
+
+
+def test_amenity_filter_uses_posting_index():
+    app = create_app("testing")
+    ids = _seed(app)
+    plans: list[str] = []
+
+    with app.app_context():
+        facade = HBnBFacade()
+
+        def _explain(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and "posting_0" in statement:
+                rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                plans.extend(str(row[-1]) for row in rows)
+
+        event.listen(db.engine, "before_cursor_execute", _explain)
+        try:
+            facade.paginate_places(10, amenity_ids=[ids["pool"], ids["parking"]])
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _explain)
+
+    assert any("ix_place_amenity_amenity_id_place_id" in plan for plan in plans)
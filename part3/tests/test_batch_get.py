@@ -0,0 +1,151 @@
+"""Tests for `?ids=` multi-get on the Part 3 list endpoints."""
+
+from __future__ import annotations
+
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models import Review, User
+
+
+def _seed(app, guests: int = 3) -> dict[str, list[str]]:
+    with app.app_context():
+        owner = User(
+            first_name="Owner",
+            last_name="User",
+            email="owner@example.com",
+            password_hash="not-a-real-hash",
+        )
+        users = [
+            User(
+                first_name=f"Guest{index}",
+                last_name="User",
+                email=f"guest{index}@example.com",
+                password_hash="not-a-real-hash",
+            )
+            for index in range(guests)
+        ]
+        db.session.add_all([owner, *users])
+        db.session.commit()
+        facade = app.extensions["facade"]
+        wifi = facade.create_amenity({"name": "WiFi"})
+        pool = facade.create_amenity({"name": "Pool"})
+        places = [
+            facade.create_place(
+                {
+                    "name": f"Loft {index}",
+                    "price": 80.0 + index,
+                    "latitude": 18.0,
+                    "longitude": -66.0,
+                    "owner_id": owner.id,
+                    "amenity_ids": [wifi.id],
+                }
+            )
+            for index in range(2)
+        ]
+        reviews = [
+            facade.create_review(
+                {"rating": 4, "comment": "Nice", "user_id": user.id, "place_id": places[0].id}
+            )
+            for user in users
+        ]
+        return {
+            "users": [user.id for user in users],
+            "places": [place.id for place in places],
+            "amenities": [wifi.id, pool.id],
+            "reviews": [review.id for review in reviews],
+        }
+
+
+def _count_statements(app, request):
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        response = request()
+    finally:
+        with app.app_context():
+            event.remove(db.engine, "before_cursor_execute", _record)
+    return response, statements
+
+
+def test_users_ids_returns_requested_users_in_order_with_one_query():
+    app = create_app("testing")
+    ids = _seed(app, guests=5)["users"]
+    requested = [ids[3], ids[0], "missing", ids[3], ids[1]]
+
+    with app.test_client() as client:
+        response, statements = _count_statements(
+            app, lambda: client.get(f"/api/v1/users/?ids={','.join(requested)}")
+        )
+
+    assert response.status_code == 200
+    assert [user["id"] for user in response.get_json()] == [ids[3], ids[0], ids[1]]
+    assert "password" not in response.get_json()[0]
+    assert "Link" not in response.headers
+    assert "ETag" in response.headers
+    # One collection version query plus the IN query
+    selects = [statement for statement in statements if " IN (" in statement]
+    assert len(statements) == 2
+    assert len(selects) == 1
+
+
+def test_places_amenities_and_reviews_accept_ids():
+    app = create_app("testing")
+    seeded = _seed(app)
+
+    with app.test_client() as client:
+        places = client.get(
+            f"/api/v1/places/?ids={seeded['places'][1]},{seeded['places'][0]}&fields=id,name"
+        )
+        amenities = client.get(f"/api/v1/amenities/?ids={','.join(seeded['amenities'])}")
+        reviews = client.get(f"/api/v1/reviews/?ids={seeded['reviews'][2]}")
+
+    assert places.status_code == 200
+    assert places.get_json() == [
+        {"id": seeded["places"][1], "name": "Loft 1"},
+        {"id": seeded["places"][0], "name": "Loft 0"},
+    ]
+    assert [amenity["name"] for amenity in amenities.get_json()] == ["WiFi", "Pool"]
+    assert [review["id"] for review in reviews.get_json()] == [seeded["reviews"][2]]
+    with app.app_context():
+        review = db.session.get(Review, seeded["reviews"][2])
+        assert reviews.get_json()[0]["user_id"] == review.user_id
+
+
+def test_ids_enforces_batch_cap_and_rejects_empty_lists():
+    app = create_app("testing")
+    app.config["API_MAX_BATCH_IDS"] = 2
+    ids = _seed(app)["users"]
+
+    with app.test_client() as client:
+        too_many = client.get(f"/api/v1/users/?ids={','.join(ids)}")
+        # Duplicates count once against the cap
+        deduplicated = client.get(f"/api/v1/users/?ids={ids[0]},{ids[0]},{ids[1]}")
+        empty = client.get("/api/v1/users/?ids=,")
+        combined = client.get(f"/api/v1/reviews/?ids={ids[0]}&q=nice")
+
+    assert too_many.status_code == 400
+    assert "at most 2" in too_many.get_json()["message"]
+    assert deduplicated.status_code == 200
+    assert len(deduplicated.get_json()) == 2
+    assert empty.status_code == 400
+    assert combined.status_code == 400
+
+
+def test_ids_response_revalidates_against_collection_etag():
+    app = create_app("testing")
+    ids = _seed(app)["amenities"]
+
+    with app.test_client() as client:
+        first = client.get(f"/api/v1/amenities/?ids={ids[0]}")
+        revalidated = client.get(
+            f"/api/v1/amenities/?ids={ids[0]}",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+
+    assert revalidated.status_code == 304
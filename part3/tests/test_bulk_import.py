@@ -0,0 +1,151 @@
+"""Tests for the Part 3 NDJSON bulk ingestion endpoint."""
+
+from __future__ import annotations
+
+import json
+
+from app import create_app, db
+from app.models import Amenity, Place, Review, User
+
+
+def _create_user(app, email: str, password: str, is_admin: bool = False) -> User:
+    with app.app_context():
+        user = User(
+            first_name=email.split("@", 1)[0].title(),
+            last_name="User",
+            email=email,
+            password_hash="",
+            is_admin=is_admin,
+        )
+        user.password = password
+        db.session.add(user)
+        db.session.commit()
+        db.session.refresh(user)
+        return user
+
+
+def _login(client, email: str, password: str) -> str:
+    response = client.post(
+        "/api/v1/auth/login",
+        json={"email": email, "password": password},
+    )
+    assert response.status_code == 200
+    return response.get_json()["access_token"]
+
+
+def _ndjson(*records) -> str:
+    return "\n".join(
+        record if isinstance(record, str) else json.dumps(record) for record in records
+    )
+
+
+def _results(response) -> list[dict]:
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_bulk_import_requires_admin():
+    app = create_app("testing")
+    _create_user(app, "user@example.com", "secret123")
+
+    with app.test_client() as client:
+        anonymous = client.post("/api/v1/bulk/amenities", data=_ndjson({"name": "WiFi"}))
+        token = _login(client, "user@example.com", "secret123")
+        regular = client.post(
+            "/api/v1/bulk/amenities",
+            data=_ndjson({"name": "WiFi"}),
+            headers={"Authorization": f"Bearer {token}"},
+            buffered=True,
+        )
+
+    assert anonymous.status_code == 401
+    assert regular.status_code == 403
+
+
+def test_bulk_import_streams_per_line_results_across_chunks():
+    app = create_app("testing")
+    app.config["BULK_IMPORT_CHUNK_SIZE"] = 2
+    admin = _create_user(app, "admin@example.com", "secret123", is_admin=True)
+    guest = _create_user(app, "guest@example.com", "secret456")
+
+    with app.test_client() as client:
+        token = _login(client, "admin@example.com", "secret123")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        amenities = client.post(
+            "/api/v1/bulk/amenities",
+            data=_ndjson({"name": "WiFi"}, {"name": "Pool"}, "not json", {"name": "WiFi"}),
+            headers=headers,
+            buffered=True,
+        )
+        with app.app_context():
+            wifi_id = Amenity.query.filter_by(name="WiFi").one().id
+
+        places = client.post(
+            "/api/v1/bulk/places",
+            data=_ndjson(
+                {
+                    "name": "Loft",
+                    "price": 90.0,
+                    "latitude": 18.0,
+                    "longitude": -66.0,
+                    "owner_id": admin.id,
+                    "amenity_ids": [wifi_id],
+                },
+                {
+                    "name": "Ghost",
+                    "price": 10.0,
+                    "latitude": 1.0,
+                    "longitude": 1.0,
+                    "owner_id": "missing",
+                },
+                {
+                    "name": "",
+                    "price": 10.0,
+                    "latitude": 1.0,
+                    "longitude": 1.0,
+                    "owner_id": admin.id,
+                },
+            ),
+            headers=headers,
+            buffered=True,
+        )
+        place_id = _results(places)[0]["id"]
+
+        reviews = client.post(
+            "/api/v1/bulk/reviews",
+            data=_ndjson(
+                {"rating": 5, "comment": "Great", "user_id": guest.id, "place_id": place_id},
+                {"rating": 4, "comment": "Again", "user_id": guest.id, "place_id": place_id},
+            ),
+            headers=headers,
+            buffered=True,
+        )
+
+    amenity_results = _results(amenities)
+    assert amenities.status_code == 200
+    assert amenities.mimetype == "application/x-ndjson"
+    assert [result.get("status") for result in amenity_results[:4]] == [
+        "created",
+        "created",
+        "error",
+        "error",
+    ]
+    assert amenity_results[3]["error"] == "Amenity already exists"
+    assert amenity_results[-1] == {"summary": {"kind": "amenities", "created": 2, "failed": 2}}
+
+    place_results = _results(places)
+    assert [result.get("status") for result in place_results[:3]] == [
+        "created",
+        "error",
+        "error",
+    ]
+    assert place_results[1]["error"] == "Owner not found"
+
+    review_results = _results(reviews)
+    assert review_results[0]["status"] == "created"
+    assert review_results[1]["error"] == "You have already reviewed this place"
+
+    with app.app_context():
+        place = db.session.get(Place, place_id)
+        assert [amenity.name for amenity in place.amenities] == ["WiFi"]
+        assert Review.query.count() == 1
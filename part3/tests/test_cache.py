@@ -0,0 +1,119 @@
+"""Tests for the facade document cache."""
+
+from __future__ import annotations
+
+from app import create_app, db
+from app.models import User
+from app.services import HBnBFacade
+from app.services.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_cache_enforces_ttl_byte_bound_and_counts_hits():
+    clock = FakeClock()
+    cache = LRUCache(max_entries=10, max_bytes=10, ttl=5, clock=clock)
+
+    cache.set("a", "aaaa", size=4)
+    cache.set("b", "bbbb", size=4)
+    assert cache.get("a") == "aaaa"
+    cache.set("c", "cccc", size=4)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == "cccc"
+    clock.now = 6
+    assert cache.get("a") is None
+    assert cache.stats() == {"hits": 2, "misses": 2, "evictions": 1, "entries": 1, "bytes": 4}
+
+
+def test_lru_cache_invalidates_entries_by_tag():
+    cache = LRUCache()
+    cache.set("place:1", "{}", tags=["place:1", "user:9", "amenity:7"])
+    cache.set("place:2", "{}", tags=["place:2", "amenity:7"])
+    cache.set("user:9", "{}", tags=["user:9"])
+
+    assert cache.invalidate_tags(["amenity:7"]) == 2
+    assert cache.get("place:1") is None
+    assert cache.get("place:2") is None
+    assert cache.get("user:9") == "{}"
+
+
+def test_facade_cache_evicts_place_documents_embedding_changed_entities():
+    app = create_app("testing")
+
+    with app.app_context():
+        facade = HBnBFacade(cache=LRUCache())
+        owner = User(
+            first_name="Owner",
+            last_name="User",
+            email="owner@example.com",
+            password_hash="not-a-real-hash",
+        )
+        guest = User(
+            first_name="Guest",
+            last_name="User",
+            email="guest@example.com",
+            password_hash="not-a-real-hash",
+        )
+        db.session.add_all([owner, guest])
+        db.session.commit()
+        wifi = facade.create_amenity({"name": "WiFi"})
+        place = facade.create_place(
+            {
+                "name": "Loft",
+                "price": 80.0,
+                "latitude": 18.0,
+                "longitude": -66.0,
+                "owner_id": owner.id,
+                "amenity_ids": [wifi.id],
+            }
+        )
+
+        assert facade.get_place_document(place.id)["amenities"][0]["name"] == "WiFi"
+        assert facade.get_place_document(place.id) is not None
+        assert facade.cache.stats()["hits"] == 1
+
+        facade.update_amenity(wifi.id, {"name": "Fast WiFi"})
+        assert facade.get_place_document(place.id)["amenities"][0]["name"] == "Fast WiFi"
+
+        facade.update_user(owner.id, {"first_name": "Renamed"})
+        assert facade.get_place_document(place.id)["owner"]["first_name"] == "Renamed"
+
+        facade.create_review(
+            {"rating": 4, "comment": "Nice", "user_id": guest.id, "place_id": place.id}
+        )
+        assert facade.get_place_document(place.id)["average_rating"] == 4
+
+        facade.delete_user(guest.id)
+        assert facade.get_place_document(place.id)["reviews"] == []
+
+        assert facade.get_amenity_page_document(10)["items"][0]["name"] == "Fast WiFi"
+        facade.create_amenity({"name": "Pool"})
+        assert len(facade.get_amenity_page_document(10)["items"]) == 2
+
+
+def test_facade_cache_reloads_documents_written_by_another_worker():
+    app = create_app("testing")
+
+    with app.app_context():
+        worker = HBnBFacade(cache=LRUCache())
+        other_worker = HBnBFacade(cache=LRUCache())
+        amenity = worker.create_amenity({"name": "WiFi"})
+        version = worker.get_version("amenities", amenity.id)
+        assert worker.get_amenity_document(amenity.id, version)["name"] == "WiFi"
+        assert worker.get_amenity_page_document(10, None, worker.get_version("amenities"))
+
+        # The other worker's write cannot evict this worker's cache
+        other_worker.update_amenity(amenity.id, {"name": "Fast WiFi"})
+
+        assert worker.get_amenity_document(amenity.id)["name"] == "WiFi"
+        version = worker.get_version("amenities", amenity.id)
+        assert worker.get_amenity_document(amenity.id, version)["name"] == "Fast WiFi"
+        page = worker.get_amenity_page_document(10, None, worker.get_version("amenities"))
+        assert page["items"][0]["name"] == "Fast WiFi"
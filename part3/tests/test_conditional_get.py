@@ -0,0 +1,149 @@
+"""Tests for ETag / Last-Modified conditional GET support."""
+
+from __future__ import annotations
+
+from sqlalchemy import event, text
+
+from app import create_app, db
+from app.models import User
+
+
+def _seed(app) -> tuple[str, str, str]:
+    with app.app_context():
+        owner = User(
+            first_name="Owner",
+            last_name="User",
+            email="owner@example.com",
+            password_hash="not-a-real-hash",
+        )
+        guest = User(
+            first_name="Guest",
+            last_name="User",
+            email="guest@example.com",
+            password_hash="not-a-real-hash",
+        )
+        db.session.add_all([owner, guest])
+        db.session.commit()
+        facade = app.extensions["facade"]
+        wifi = facade.create_amenity({"name": "WiFi"})
+        place = facade.create_place(
+            {
+                "name": "Loft",
+                "price": 80.0,
+                "latitude": 18.0,
+                "longitude": -66.0,
+                "owner_id": owner.id,
+                "amenity_ids": [wifi.id],
+            }
+        )
+        return place.id, guest.id, wifi.id
+
+
+def test_place_detail_returns_304_for_matching_etag_with_single_query():
+    app = create_app("testing")
+    place_id, _, _ = _seed(app)
+
+    with app.test_client() as client:
+        first = client.get(f"/api/v1/places/{place_id}")
+        etag = first.headers["ETag"]
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            revalidated = client.get(
+                f"/api/v1/places/{place_id}", headers={"If-None-Match": etag}
+            )
+        finally:
+            with app.app_context():
+                event.remove(db.engine, "before_cursor_execute", _record)
+
+        by_date = client.get(
+            f"/api/v1/places/{place_id}",
+            headers={"If-Modified-Since": first.headers["Last-Modified"]},
+        )
+
+    assert first.status_code == 200
+    assert etag.startswith('"')
+    assert "Last-Modified" in first.headers
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b""
+    assert revalidated.headers["ETag"] == etag
+    assert len(statements) == 1
+    assert by_date.status_code == 304
+
+
+def test_place_etag_changes_when_embedded_entities_change():
+    app = create_app("testing")
+    place_id, guest_id, wifi_id = _seed(app)
+
+    with app.test_client() as client:
+        original = client.get(f"/api/v1/places/{place_id}").headers["ETag"]
+
+        with app.app_context():
+            app.extensions["facade"].update_amenity(wifi_id, {"name": "Fast WiFi"})
+        after_amenity = client.get(
+            f"/api/v1/places/{place_id}", headers={"If-None-Match": original}
+        )
+
+        with app.app_context():
+            app.extensions["facade"].create_review(
+                {"rating": 5, "comment": "Great", "user_id": guest_id, "place_id": place_id}
+            )
+        after_review = client.get(
+            f"/api/v1/places/{place_id}",
+            headers={"If-None-Match": after_amenity.headers["ETag"]},
+        )
+
+        list_first = client.get("/api/v1/amenities/")
+        list_again = client.get(
+            "/api/v1/amenities/", headers={"If-None-Match": list_first.headers["ETag"]}
+        )
+        missing = client.get("/api/v1/places/missing", headers={"If-None-Match": original})
+
+    assert after_amenity.status_code == 200
+    assert after_amenity.get_json()["amenities"][0]["name"] == "Fast WiFi"
+    assert after_review.status_code == 200
+    assert after_review.get_json()["average_rating"] == 5
+    assert list_first.status_code == 200
+    assert list_again.status_code == 304
+    assert missing.status_code == 404
+
+
+def test_collection_etags_read_one_counter_row_and_see_raw_sql_writes():
+    app = create_app("testing")
+    _seed(app)
+
+    with app.test_client() as client:
+        first = client.get("/api/v1/places/")
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            revalidated = client.get(
+                "/api/v1/places/", headers={"If-None-Match": first.headers["ETag"]}
+            )
+        finally:
+            with app.app_context():
+                event.remove(db.engine, "before_cursor_execute", _record)
+
+        with app.app_context():
+            db.session.execute(text("UPDATE users SET first_name = 'Renamed'"))
+            db.session.commit()
+        after_raw_write = client.get(
+            "/api/v1/places/", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    assert revalidated.status_code == 304
+    assert len(statements) == 1
+    assert "collection_versions" in statements[0]
+    assert "count(" not in statements[0].lower()
+    assert after_raw_write.status_code == 200
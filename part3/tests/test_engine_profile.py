@@ -0,0 +1,115 @@
+"""Tests for the Part 3 SQLite engine profile and its diagnostics."""
+
+from __future__ import annotations
+
+import pytest
+
+from app import create_app, db
+from app.models import User
+from app.persistence.engine import SQLiteProfile, engine_options, run_concurrency_benchmark
+
+
+def _create_user(app, email: str, password: str, is_admin: bool = False) -> None:
+    with app.app_context():
+        user = User(
+            first_name="Ops",
+            last_name="User",
+            email=email,
+            password_hash="",
+            is_admin=is_admin,
+        )
+        user.password = password
+        db.session.add(user)
+        db.session.commit()
+
+
+def _login(client, email: str, password: str) -> str:
+    response = client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200
+    return response.get_json()["access_token"]
+
+
+def test_profile_pragmas_apply_to_every_pooled_connection(file_config):
+    app = create_app(file_config(SQLITE_CACHE_SIZE=-2048, DATABASE_POOL_SIZE=3))
+
+    with app.app_context():
+        connections = [db.engine.connect() for _ in range(3)]
+        try:
+            for connection in connections:
+                pragma = connection.exec_driver_sql
+                assert pragma("PRAGMA journal_mode").scalar() == "wal"
+                assert pragma("PRAGMA synchronous").scalar() == 1
+                assert pragma("PRAGMA cache_size").scalar() == -2048
+                assert pragma("PRAGMA temp_store").scalar() == 2
+                assert pragma("PRAGMA busy_timeout").scalar() == 5000
+                assert pragma("PRAGMA foreign_keys").scalar() == 1
+        finally:
+            for connection in connections:
+                connection.close()
+        assert db.engine.pool.size() == 3
+
+
+def test_engine_options_skip_pool_sizing_for_in_memory_sqlite(tmp_path):
+    assert engine_options({"SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"}) == {}
+
+    options = engine_options(
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'x.db'}",
+            "SQLALCHEMY_ENGINE_OPTIONS": {"pool_size": 2},
+            "DATABASE_POOL_RECYCLE": 60,
+        }
+    )
+    assert options["pool_size"] == 2
+    assert options["pool_recycle"] == 60
+
+
+def test_profile_rejects_unknown_pragma_keywords():
+    with pytest.raises(ValueError):
+        SQLiteProfile.from_config({"SQLITE_JOURNAL_MODE": "WAL; DROP TABLE users"})
+    assert SQLiteProfile.from_config({"SQLITE_SYNCHRONOUS": "full"}).synchronous == "FULL"
+
+
+def test_database_diagnostics_is_admin_only_and_reports_effective_pragmas(file_config):
+    app = create_app(file_config())
+    _create_user(app, "admin@example.com", "secret123", is_admin=True)
+    _create_user(app, "user@example.com", "secret123")
+
+    with app.test_client() as client:
+        anonymous = client.get("/api/v1/diagnostics/database")
+        user_token = _login(client, "user@example.com", "secret123")
+        regular = client.get(
+            "/api/v1/diagnostics/database",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        admin_token = _login(client, "admin@example.com", "secret123")
+        response = client.get(
+            "/api/v1/diagnostics/database",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+    assert anonymous.status_code == 401
+    assert regular.status_code == 403
+    assert response.status_code == 200
+    report = response.get_json()
+    assert report["dialect"] == "sqlite"
+    assert report["profile"]["journal_mode"] == "WAL"
+    assert report["pragmas"]["journal_mode"] == "wal"
+    assert report["pragmas"]["foreign_keys"] == 1
+    assert report["pool"]["class"] == "QueuePool"
+    assert report["pool"]["recycle"] == 1800
+
+
+def test_concurrency_benchmark_runs_without_lock_errors(file_config):
+    app = create_app(file_config())
+
+    with app.app_context():
+        report = run_concurrency_benchmark(db.engine, workers=6, operations=40, write_ratio=0.5)
+        remaining = db.session.execute(
+            db.text("SELECT name FROM sqlite_master WHERE name = 'engine_benchmark'")
+        ).first()
+
+    assert report["operations"] == 240
+    assert report["reads"] + report["writes"] == 240
+    assert report["locked"] == 0
+    assert report["errors"] == 0
+    assert remaining is None
@@ -0,0 +1,186 @@
+"""Tests for geohash-backed location search on places."""
+
+from __future__ import annotations
+
+import random
+
+from sqlalchemy import inspect
+
+from app import create_app, db
+from app.geo import covering_cells, encode_geohash, haversine_km, parse_bbox, radius_boxes
+from app.models import Place, User
+from app.services import HBnBFacade
+
+SAN_JUAN = (18.4655, -66.1057)
+
+
+def _seed(app, coordinates) -> dict[str, tuple[float, float]]:
+    with app.app_context():
+        owner = User(
+            first_name="Owner",
+            last_name="User",
+            email="owner@example.com",
+            password_hash="not-a-real-hash",
+        )
+        db.session.add(owner)
+        seeded = {}
+        for index, (latitude, longitude) in enumerate(coordinates):
+            place = Place(
+                name=f"Place {index}",
+                price=50.0,
+                latitude=latitude,
+                longitude=longitude,
+                owner_id=owner.id,
+            )
+            db.session.add(place)
+            seeded[place.id] = (latitude, longitude)
+        db.session.commit()
+        return seeded
+
+
+def test_geohash_matches_reference_values():
+    assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert encode_geohash(-25.382708, -49.265506, 6) == "6gkzwg"
+
+
+def test_haversine_distance_between_known_cities():
+    # San Juan to Ponce is roughly 70 km in a straight line.
+    assert 65 < haversine_km(*SAN_JUAN, 18.0111, -66.6141) < 75
+
+
+def test_covering_cells_contain_every_point_of_the_box():
+    rng = random.Random(7)
+    for latitude, longitude, radius in [(18.4, -66.1, 5), (-33.9, 151.2, 40), (64.1, -21.9, 300)]:
+        for box in radius_boxes(latitude, longitude, radius):
+            cells = covering_cells(box)
+            assert len(cells) <= 32
+            for _ in range(200):
+                point = (
+                    rng.uniform(box.min_lat, box.max_lat),
+                    rng.uniform(box.min_lng, box.max_lng),
+                )
+                assert any(encode_geohash(*point).startswith(cell) for cell in cells)
+
+
+def test_radius_and_bbox_split_at_antimeridian():
+    assert len(radius_boxes(0.0, 179.9, 50)) == 2
+    assert len(parse_bbox("179,-1,-179,1")) == 2
+
+
+def test_radius_search_matches_brute_force_and_sorts_by_distance():
+    rng = random.Random(42)
+    coordinates = [(rng.uniform(17.5, 19.5), rng.uniform(-67.5, -65.0)) for _ in range(300)]
+    app = create_app("testing")
+    seeded = _seed(app, coordinates)
+    expected = sorted(
+        (haversine_km(*SAN_JUAN, *point), place_id)
+        for place_id, point in seeded.items()
+        if haversine_km(*SAN_JUAN, *point) <= 40
+    )
+
+    with app.app_context():
+        results = HBnBFacade().search_places(
+            500, latitude=SAN_JUAN[0], longitude=SAN_JUAN[1], radius_km=40
+        )
+
+    assert [place.id for place, _ in results] == [place_id for _, place_id in expected]
+    assert [distance for _, distance in results] == [distance for distance, _ in expected]
+
+
+def test_searches_read_only_the_candidates_their_page_needs():
+    rng = random.Random(3)
+    coordinates = [(rng.uniform(18.3, 18.6), rng.uniform(-66.3, -65.9)) for _ in range(200)]
+    app = create_app("testing")
+    seeded = _seed(app, coordinates)
+    nearest = sorted(
+        (haversine_km(*SAN_JUAN, *point), place_id) for place_id, point in seeded.items()
+    )
+
+    with app.app_context():
+        facade = HBnBFacade()
+        oldest = [
+            place.id for place in db.session.query(Place).order_by(Place.created_at, Place.id)
+        ][:5]
+        locate = facade.places.locate
+        candidates = []
+
+        def counting_locate(*args, **kwargs):
+            rows = locate(*args, **kwargs)
+            candidates.append(len(rows))
+            return rows
+
+        facade.places.locate = counting_locate
+        near = facade.search_places(5, latitude=SAN_JUAN[0], longitude=SAN_JUAN[1], radius_km=50)
+        ring_candidates = sum(candidates)
+        candidates.clear()
+        boxed = facade.search_places(5, bbox=parse_bbox("-66.3,18.3,-65.9,18.6"))
+
+    assert [place.id for place, _ in near] == [place_id for _, place_id in nearest[:5]]
+    assert ring_candidates < len(seeded)
+    assert [place.id for place, _ in boxed] == oldest
+    assert candidates == [5]
+
+
+def test_places_endpoint_filters_by_radius_and_bbox():
+    app = create_app("testing")
+    _seed(app, [SAN_JUAN, (18.0111, -66.6141), (40.7128, -74.0060)])
+
+    with app.test_client() as client:
+        nearby = client.get(
+            f"/api/v1/places/?lat={SAN_JUAN[0]}&lng={SAN_JUAN[1]}&radius_km=100&fields=name"
+        )
+        boxed = client.get("/api/v1/places/?bbox=-75,40,-73,41")
+        with_cursor = client.get("/api/v1/places/?lat=18&lng=-66&cursor=abc")
+        lonely_radius = client.get("/api/v1/places/?radius_km=5")
+        bad_bbox = client.get("/api/v1/places/?bbox=1,2,3")
+
+    assert nearby.status_code == 200
+    body = nearby.get_json()
+    assert [place["name"] for place in body] == ["Place 0", "Place 1"]
+    assert set(body[0]) == {"id", "name", "distance_km"}
+    assert body[0]["distance_km"] == 0.0
+    assert [place["name"] for place in boxed.get_json()] == ["Place 2"]
+    assert boxed.get_json()[0]["distance_km"] is None
+    assert with_cursor.status_code == 400
+    assert lonely_radius.status_code == 400
+    assert bad_bbox.status_code == 400
+
+
+def test_backfill_indexes_places_without_geohash():
+    app = create_app("testing")
+    seeded = _seed(app, [SAN_JUAN])
+
+    with app.app_context():
+        db.session.query(Place).update({Place.geohash: None})
+        db.session.commit()
+        facade = HBnBFacade()
+        assert facade.search_places(10, latitude=SAN_JUAN[0], longitude=SAN_JUAN[1], radius_km=1) == []
+        assert facade.places.backfill_geohashes() == 1
+        results = facade.search_places(10, latitude=SAN_JUAN[0], longitude=SAN_JUAN[1], radius_km=1)
+
+    assert [place.id for place, _ in results] == list(seeded)
+
+
+def test_backfill_command_migrates_a_database_without_the_geohash_column(
+    file_config, downgrade_schema
+):
+    config = file_config()
+    app = create_app(config)
+    seeded = _seed(app, [SAN_JUAN])
+    downgrade_schema(
+        app, "DROP INDEX ix_places_geohash", "ALTER TABLE places DROP COLUMN geohash"
+    )
+
+    upgraded = create_app(config)
+    result = upgraded.test_cli_runner().invoke(args=["backfill-geohashes"])
+
+    assert result.exit_code == 0
+    assert "Indexed 1 place(s)" in result.output
+    with upgraded.app_context():
+        assert "ix_places_geohash" in {
+            index["name"] for index in inspect(db.engine).get_indexes("places")
+        }
+        results = HBnBFacade().search_places(
+            10, latitude=SAN_JUAN[0], longitude=SAN_JUAN[1], radius_km=1
+        )
+    assert [place.id for place, _ in results] == list(seeded)
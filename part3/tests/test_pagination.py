@@ -0,0 +1,105 @@
+"""Tests for keyset pagination on the Part 3 list endpoints."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from app import create_app, db
+from app.models import Amenity, Place, User
+from app.services import HBnBFacade
+
+
+def _seed_places(app, count: int) -> list[str]:
+    with app.app_context():
+        owner = User(
+            first_name="Owner",
+            last_name="User",
+            email="owner@example.com",
+            password_hash="not-a-real-hash",
+        )
+        db.session.add(owner)
+        base = datetime(2024, 1, 1)
+        for index in range(count):
+            place = Place(
+                name=f"Place {index}",
+                price=50.0 + index,
+                latitude=18.0,
+                longitude=-66.0,
+                owner_id=owner.id,
+                created_at=base + timedelta(minutes=index // 2),
+            )
+            db.session.add(place)
+        db.session.commit()
+
+        ordered = db.session.query(Place.id).order_by(Place.created_at, Place.id).all()
+        return [row.id for row in ordered]
+
+
+def test_facade_paginates_places_by_created_at_and_id():
+    app = create_app("testing")
+    expected_ids = _seed_places(app, 7)
+
+    with app.app_context():
+        facade = HBnBFacade()
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = facade.paginate_places(3, cursor)
+            seen.extend(place.id for place in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+    assert seen == expected_ids
+
+
+def test_places_endpoint_returns_next_link_until_exhausted():
+    app = create_app("testing")
+    expected_ids = _seed_places(app, 5)
+
+    with app.test_client() as client:
+        first = client.get("/api/v1/places/?limit=2")
+        second = client.get(f"/api/v1/places/?limit=2&cursor={first.headers['X-Next-Cursor']}")
+        third = client.get(f"/api/v1/places/?limit=2&cursor={second.headers['X-Next-Cursor']}")
+
+    assert first.status_code == 200
+    assert 'rel="next"' in first.headers["Link"]
+    assert [place["id"] for place in first.get_json()] == expected_ids[:2]
+    assert [place["id"] for place in second.get_json()] == expected_ids[2:4]
+    assert [place["id"] for place in third.get_json()] == expected_ids[4:]
+    assert "Link" not in third.headers
+    assert "X-Next-Cursor" not in third.headers
+
+
+def test_list_endpoints_reject_invalid_limit_and_cursor():
+    app = create_app("testing")
+
+    with app.app_context():
+        db.session.add(Amenity(name="WiFi"))
+        db.session.commit()
+
+    with app.test_client() as client:
+        bad_limit = client.get("/api/v1/amenities/?limit=0")
+        bad_cursor = client.get("/api/v1/amenities/?cursor=not-a-cursor")
+        amenities = client.get("/api/v1/amenities/?limit=1")
+
+    assert bad_limit.status_code == 400
+    assert bad_cursor.status_code == 400
+    assert amenities.status_code == 200
+    assert amenities.get_json()[0]["name"] == "WiFi"
+    assert "X-Next-Cursor" not in amenities.headers
+
+
+def test_amenity_pages_order_names_case_insensitively():
+    app = create_app("testing")
+    with app.app_context():
+        for name in ("pool", "WiFi", "Balcony", "air conditioning"):
+            db.session.add(Amenity(name=name))
+        db.session.commit()
+        facade = HBnBFacade()
+
+        first = facade.paginate_amenities(limit=2)
+        second = facade.paginate_amenities(limit=2, cursor=first.next_cursor)
+
+    assert [amenity.name for amenity in first.items] == ["air conditioning", "Balcony"]
+    assert [amenity.name for amenity in second.items] == ["pool", "WiFi"]
@@ -0,0 +1,115 @@
+"""Tests for Part 3 password hashing on the bounded worker pool."""
+
+from __future__ import annotations
+
+from app import create_app, db
+from app.models import User
+from app.passwords import PasswordHasher, hash_cost
+from config import TestingConfig
+
+
+def _create_user(app, email: str, password: str, is_admin: bool = False) -> str:
+    with app.app_context():
+        user = User(
+            first_name="Pat",
+            last_name="User",
+            email=email,
+            password_hash="",
+            is_admin=is_admin,
+        )
+        user.password = password
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+def _login(client, email: str, password: str):
+    return client.post("/api/v1/auth/login", json={"email": email, "password": password})
+
+
+def test_process_pool_hashes_and_verifies_passwords():
+    app = create_app(type("PooledTestingConfig", (TestingConfig,), {"PASSWORD_HASH_WORKERS": 1}))
+    hasher = PasswordHasher(app)
+    try:
+        password_hash = hasher.hash("secret123")
+        assert hash_cost(password_hash) == 4
+        assert hasher.verify(password_hash, "secret123") is True
+        assert hasher.verify(password_hash, "wrong") is False
+        assert hasher.verify("not-a-hash", "secret123") is False
+    finally:
+        hasher.shutdown()
+
+    stats = hasher.stats()
+    assert stats["workers"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["latency"]["hash"]["count"] == 1
+    assert stats["latency"]["verify"]["count"] == 3
+
+
+def test_login_returns_503_with_retry_after_when_hashing_is_saturated():
+    config = type(
+        "SaturatedTestingConfig",
+        (TestingConfig,),
+        {"PASSWORD_HASH_QUEUE_SIZE": 1, "PASSWORD_HASH_ACQUIRE_TIMEOUT": 0},
+    )
+    app = create_app(config)
+    _create_user(app, "pat@example.com", "secret123")
+    hasher = app.extensions["passwords"]
+
+    hasher._slots.acquire()
+    try:
+        with app.test_client() as client:
+            response = _login(client, "pat@example.com", "secret123")
+    finally:
+        hasher._slots.release()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert hasher.stats()["rejected"] == 1
+
+
+def test_login_rehashes_passwords_made_with_an_old_work_factor():
+    app = create_app("testing")
+    user_id = _create_user(app, "pat@example.com", "secret123")
+    app.extensions["passwords"].rounds = 5
+    users = app.extensions["facade"].users
+    saved = []
+    save = users.save
+    users.save = lambda user: saved.append(user.id) or save(user)
+
+    with app.test_client() as client:
+        first = _login(client, "pat@example.com", "secret123")
+        with app.app_context():
+            upgraded = db.session.get(User, user_id).password_hash
+        second = _login(client, "pat@example.com", "secret123")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert hash_cost(upgraded) == 5
+    # Only the first login rehashes, and it writes through the repository
+    assert saved == [user_id]
+
+
+def test_password_diagnostics_is_admin_only():
+    app = create_app("testing")
+    _create_user(app, "admin@example.com", "secret123", is_admin=True)
+    _create_user(app, "pat@example.com", "secret123")
+
+    with app.test_client() as client:
+        user_token = _login(client, "pat@example.com", "secret123").get_json()["access_token"]
+        regular = client.get(
+            "/api/v1/diagnostics/passwords",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        admin_token = _login(client, "admin@example.com", "secret123").get_json()["access_token"]
+        response = client.get(
+            "/api/v1/diagnostics/passwords",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+
+    assert regular.status_code == 403
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["rounds"] == 4
+    assert body["capacity"] == 32
+    assert body["latency"]["verify"]["count"] >= 2
@@ -0,0 +1,96 @@
+"""Tests for place loading profiles and serialization query counts."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models import Amenity, Place, Review, User
+from app.services import HBnBFacade
+
+
+def _seed(place_count: int) -> None:
+    owner = User(
+        first_name="Owner",
+        last_name="User",
+        email="owner@example.com",
+        password_hash="not-a-real-hash",
+    )
+    reviewer = User(
+        first_name="Reviewer",
+        last_name="User",
+        email="reviewer@example.com",
+        password_hash="not-a-real-hash",
+    )
+    wifi = Amenity(name="WiFi")
+    db.session.add_all([owner, reviewer, wifi])
+    for index in range(place_count):
+        place = Place(
+            name=f"Place {index}",
+            price=60.0,
+            latitude=18.0,
+            longitude=-66.0,
+            owner_id=owner.id,
+            review_count=1,
+            rating_sum=4,
+        )
+        place.amenities = [wifi]
+        db.session.add(place)
+        db.session.add(Review(rating=4, comment="Nice", user_id=reviewer.id, place_id=place.id))
+    db.session.commit()
+    db.session.expunge_all()
+
+
+@contextmanager
+def _count_queries():
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+
+@pytest.mark.parametrize("place_count", [2, 8])
+def test_place_page_serialization_uses_fixed_query_count(place_count):
+    app = create_app("testing")
+
+    with app.app_context():
+        _seed(place_count)
+        facade = HBnBFacade()
+
+        with _count_queries() as statements:
+            page = facade.paginate_places(50, profile="card")
+            payload = [facade.serialize_place(place) for place in page.items]
+
+    assert len(payload) == place_count
+    assert all(place["owner"]["email"] == "owner@example.com" for place in payload)
+    assert all(place["average_rating"] == 4 for place in payload)
+    assert len(statements) == 4
+
+
+def test_place_detail_profile_loads_relationships_up_front():
+    app = create_app("testing")
+
+    with app.app_context():
+        _seed(1)
+        place_id = db.session.query(Place.id).scalar()
+        facade = HBnBFacade()
+
+        with _count_queries() as statements:
+            place = facade.get_place(place_id, profile="detail")
+            payload = facade.serialize_place(place)
+
+        with pytest.raises(ValueError):
+            facade.get_place(place_id, profile="unknown")
+
+    assert payload["amenities"][0]["name"] == "WiFi"
+    assert len(payload["reviews"]) == 1
+    assert len(statements) == 3
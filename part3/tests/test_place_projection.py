@@ -0,0 +1,123 @@
+"""Tests for sparse fieldsets and expand= on place responses."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from app import create_app, db
+from app.models import Amenity, Place, Review, User
+from app.persistence import PlaceProjection
+
+
+def _seed(app) -> str:
+    with app.app_context():
+        owner = User(
+            first_name="Owner",
+            last_name="User",
+            email="owner@example.com",
+            password_hash="not-a-real-hash",
+        )
+        wifi = Amenity(name="WiFi")
+        db.session.add_all([owner, wifi])
+        place = Place(
+            name="Beach House",
+            description="A long description nobody asked for",
+            price=120.0,
+            latitude=18.0,
+            longitude=-66.0,
+            owner_id=owner.id,
+            review_count=3,
+            rating_sum=12,
+        )
+        place.amenities = [wifi]
+        db.session.add(place)
+        base = datetime(2024, 1, 1)
+        for index in range(3):
+            reviewer = User(
+                first_name="Reviewer",
+                last_name=str(index),
+                email=f"reviewer{index}@example.com",
+                password_hash="not-a-real-hash",
+            )
+            db.session.add(reviewer)
+            db.session.add(
+                Review(
+                    rating=4,
+                    comment=f"Review {index}",
+                    user_id=reviewer.id,
+                    place_id=place.id,
+                    created_at=base + timedelta(days=index),
+                )
+            )
+        db.session.commit()
+        return place.id
+
+
+def test_fields_limit_list_payload_to_requested_keys():
+    app = create_app("testing")
+    _seed(app)
+
+    with app.test_client() as client:
+        response = client.get("/api/v1/places/?fields=name,price,latitude,longitude,average_rating")
+
+    assert response.status_code == 200
+    place = response.get_json()[0]
+    assert set(place) == {"id", "name", "price", "latitude", "longitude", "average_rating"}
+    assert place["average_rating"] == 4.0
+
+
+def test_expand_embeds_only_newest_reviews_up_to_limit():
+    app = create_app("testing")
+    place_id = _seed(app)
+
+    with app.test_client() as client:
+        response = client.get(
+            f"/api/v1/places/{place_id}?fields=name&expand=reviews&reviews_limit=2"
+        )
+
+    assert response.status_code == 200
+    place = response.get_json()
+    assert set(place) == {"id", "name", "reviews"}
+    assert [review["comment"] for review in place["reviews"]] == ["Review 2", "Review 1"]
+
+
+def test_unprojected_detail_keeps_full_document():
+    app = create_app("testing")
+    place_id = _seed(app)
+
+    with app.test_client() as client:
+        response = client.get(f"/api/v1/places/{place_id}")
+
+    place = response.get_json()
+    assert place["description"] == "A long description nobody asked for"
+    assert place["owner"]["email"] == "owner@example.com"
+    assert [amenity["name"] for amenity in place["amenities"]] == ["WiFi"]
+    assert len(place["reviews"]) == 3
+
+
+def test_projection_rejects_unknown_names():
+    app = create_app("testing")
+    _seed(app)
+
+    with app.test_client() as client:
+        bad_field = client.get("/api/v1/places/?fields=name,secret")
+        bad_expand = client.get("/api/v1/places/?expand=bookings")
+        bad_limit = client.get("/api/v1/places/?expand=reviews&reviews_limit=-1")
+
+    assert bad_field.status_code == 400
+    assert bad_expand.status_code == 400
+    assert bad_limit.status_code == 400
+
+
+def test_projection_defers_unrequested_columns():
+    app = create_app("testing")
+    place_id = _seed(app)
+    projection = PlaceProjection.parse("name", None, None)
+
+    with app.app_context():
+        place = (
+            db.session.query(Place).options(*projection.options()).filter_by(id=place_id).one()
+        )
+        assert "description" not in place.__dict__
+        assert "owner" not in place.__dict__
+        assert place.name == "Beach House"
@@ -0,0 +1,117 @@
+"""Tests for the denormalized place rating totals."""
+
+from __future__ import annotations
+
+from app import create_app, db
+from app.persistence import upgrade_schema
+from app.models import Place, Review, User
+from app.services import HBnBFacade
+
+
+def _user(email: str) -> User:
+    user = User(
+        first_name=email.split("@", 1)[0].title(),
+        last_name="User",
+        email=email,
+        password_hash="not-a-real-hash",
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def _place(facade: HBnBFacade, owner: User, name: str = "Loft") -> Place:
+    return facade.create_place(
+        {
+            "name": name,
+            "price": 80.0,
+            "latitude": 18.0,
+            "longitude": -66.0,
+            "owner_id": owner.id,
+        }
+    )
+
+
+def _totals(place_id: str) -> tuple[int, int]:
+    row = db.session.query(Place.review_count, Place.rating_sum).filter_by(id=place_id).one()
+    return row.review_count, row.rating_sum
+
+
+def test_review_writes_maintain_place_rating_totals():
+    app = create_app("testing")
+
+    with app.app_context():
+        facade = HBnBFacade()
+        owner = _user("owner@example.com")
+        first = _user("first@example.com")
+        second = _user("second@example.com")
+        place = _place(facade, owner)
+        place_id = place.id
+
+        review = facade.create_review(
+            {"rating": 5, "comment": "Great", "user_id": first.id, "place_id": place_id}
+        )
+        facade.create_review(
+            {"rating": 2, "comment": "Meh", "user_id": second.id, "place_id": place_id}
+        )
+        assert _totals(place_id) == (2, 7)
+        assert facade.get_place(place_id).average_rating() == 3.5
+
+        facade.update_review(review.id, {"rating": 3})
+        assert _totals(place_id) == (2, 5)
+
+        facade.delete_review(review.id)
+        assert _totals(place_id) == (1, 2)
+
+        facade.delete_user(second.id)
+        assert _totals(place_id) == (0, 0)
+        assert facade.get_place(place_id).average_rating() is None
+
+
+def test_recompute_ratings_command_rebuilds_totals():
+    app = create_app("testing")
+
+    with app.app_context():
+        facade = HBnBFacade()
+        owner = _user("owner@example.com")
+        guest = _user("guest@example.com")
+        place = _place(facade, owner)
+        place_id = place.id
+        empty_id = _place(facade, owner, name="Empty").id
+        db.session.add(Review(rating=4, comment="Good", user_id=guest.id, place_id=place_id))
+        db.session.query(Place).filter_by(id=empty_id).update({Place.review_count: 9})
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["recompute-ratings"])
+
+    assert result.exit_code == 0
+    assert "2 place(s)" in result.output
+    with app.app_context():
+        assert _totals(place_id) == (1, 4)
+        assert _totals(empty_id) == (0, 0)
+
+
+def test_startup_adds_and_backfills_totals_on_an_older_database(file_config, downgrade_schema):
+    config = file_config()
+    app = create_app(config)
+    with app.app_context():
+        facade = HBnBFacade()
+        owner = _user("owner@example.com")
+        guest = _user("guest@example.com")
+        place_id = _place(facade, owner).id
+        facade.create_review(
+            {"rating": 5, "comment": "Great", "user_id": guest.id, "place_id": place_id}
+        )
+    # Recreate a database from before the totals columns existed
+    downgrade_schema(
+        app,
+        "ALTER TABLE places DROP COLUMN review_count",
+        "ALTER TABLE places DROP COLUMN rating_sum",
+    )
+
+    upgraded = create_app(config)
+
+    with upgraded.app_context():
+        assert _totals(place_id) == (1, 5)
+        with db.engine.begin() as connection:
+            assert upgrade_schema(connection) == []
@@ -0,0 +1,155 @@
+"""Tests for Part 3 read/write routing between the primary and replicas."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+from sqlalchemy import event
+
+from app import create_app, db
+from app.models import Amenity, User
+from app.replication import ReplicaRouter
+from app.services import HBnBFacade
+from app.services.cache import LRUCache
+from config import TestingConfig
+
+
+def _replicated_app(tmp_path, replicas: int = 2, strategy: str = "round_robin"):
+    # Replicas point at the primary's file so every engine sees the same rows
+    url = f"sqlite:///{tmp_path / 'primary.db'}"
+    attributes = {
+        "SQLALCHEMY_DATABASE_URI": url,
+        "DATABASE_REPLICA_URLS": [url] * replicas,
+        "DATABASE_REPLICA_STRATEGY": strategy,
+    }
+    return create_app(type("ReplicatedTestingConfig", (TestingConfig,), attributes))
+
+
+def _record_selects(app) -> Counter:
+    selects: Counter = Counter()
+    with app.app_context():
+        for key, engine in db.engines.items():
+
+            def count(conn, cursor, statement, params, context, executemany, key=key):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    selects[key or "primary"] += 1
+
+            event.listen(engine, "before_cursor_execute", count)
+    return selects
+
+
+def _create_admin(app) -> None:
+    with app.app_context():
+        admin = User(
+            first_name="Admin",
+            last_name="User",
+            email="admin@example.com",
+            password_hash="",
+            is_admin=True,
+        )
+        admin.password = "secret123"
+        db.session.add(admin)
+        db.session.commit()
+
+
+def test_safe_requests_read_from_replicas_round_robin(tmp_path):
+    app = _replicated_app(tmp_path)
+    with app.app_context():
+        db.session.add(Amenity(name="WiFi"))
+        db.session.commit()
+    selects = _record_selects(app)
+
+    with app.test_client() as client:
+        responses = [client.get("/api/v1/amenities/") for _ in range(4)]
+
+    assert all(response.status_code == 200 for response in responses)
+    assert responses[-1].get_json()[0]["name"] == "WiFi"
+    assert selects["primary"] == 0
+    assert selects["replica_0"] > 0 and selects["replica_1"] > 0
+    assert app.extensions["replica_router"].stats()["sessions"] == {
+        "replica_0": 2,
+        "replica_1": 2,
+    }
+
+
+def test_unsafe_requests_and_writes_stay_on_the_primary(tmp_path):
+    app = _replicated_app(tmp_path)
+    _create_admin(app)
+    selects = _record_selects(app)
+
+    with app.test_client() as client:
+        login = client.post(
+            "/api/v1/auth/login",
+            json={"email": "admin@example.com", "password": "secret123"},
+        )
+        created = client.post(
+            "/api/v1/amenities/",
+            json={"name": "Pool"},
+            headers={"Authorization": f"Bearer {login.get_json()['access_token']}"},
+        )
+
+    assert created.status_code == 201
+    assert selects["primary"] > 0
+    assert selects["replica_0"] == selects["replica_1"] == 0
+
+
+def test_session_sticks_to_primary_after_a_write(tmp_path):
+    app = _replicated_app(tmp_path, replicas=1)
+    selects = _record_selects(app)
+
+    with app.test_request_context("/", method="GET"):
+        db.session.query(Amenity).all()
+        assert selects == Counter({"replica_0": 1})
+
+        db.session.add(Amenity(name="Sauna"))
+        db.session.flush()
+        names = [amenity.name for amenity in db.session.query(Amenity).all()]
+        db.session.rollback()
+
+    assert names == ["Sauna"]
+    assert selects["primary"] == 1
+    assert selects["replica_0"] == 1
+
+
+def test_least_busy_strategy_prefers_idle_replicas(tmp_path):
+    app = _replicated_app(tmp_path, strategy="least_busy")
+
+    with app.app_context():
+        router = app.extensions["replica_router"]
+        held = db.engines["replica_0"].connect()
+        try:
+            chosen = {router.choose(db.engines) for _ in range(3)}
+        finally:
+            held.close()
+
+    assert chosen == {"replica_1"}
+
+
+def test_router_is_disabled_without_replicas_and_rejects_unknown_strategies():
+    assert ReplicaRouter.from_config({"DATABASE_REPLICA_URLS": []}) is None
+    with pytest.raises(ValueError):
+        ReplicaRouter(["sqlite://"], strategy="random")
+
+
+def test_cache_is_not_filled_from_replicas_right_after_a_write(tmp_path):
+    app = _replicated_app(tmp_path, replicas=1)
+    now = [100.0]
+    facade = HBnBFacade(cache=LRUCache(), replica_lag=5, clock=lambda: now[0])
+    app.extensions["facade"] = facade
+    with app.app_context():
+        amenity_id = facade.create_amenity({"name": "Sauna"}).id
+        facade.update_amenity(amenity_id, {"name": "Steam Room"})
+
+    with app.test_request_context("/", method="GET"):
+        facade.get_amenity_document(amenity_id)
+        facade.get_amenity_page_document(10)
+    assert facade.cache.stats()["entries"] == 0
+
+    now[0] += 6
+    with app.test_request_context("/", method="GET"):
+        document = facade.get_amenity_document(amenity_id)
+    assert document["name"] == "Steam Room"
+    assert facade.cache.get(f"amenity:{amenity_id}") is not None
+    assert _replicated_app(tmp_path).extensions["facade"].replica_lag == 5
+    assert create_app("testing").extensions["facade"].replica_lag == 0
@@ -4,10 +4,18 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from app import create_app
+import pytest
+from sqlalchemy import event
+
+from app import create_app, db
 from app.persistence import (
     AmenityRepository,
+    Eq,
+    In,
+    Like,
     PlaceRepository,
+    Predicate,
+    Range,
     ReviewRepository,
     SQLAlchemyRepository,
     UserRepository,
@@ -261,3 +269,110 @@ def test_sqlalchemy_relationships_link_users_places_reviews_and_amenities():
         assert refreshed_owner.places[0].id == place.id
         assert len(refreshed_reviewer.reviews) == 1
         assert refreshed_reviewer.reviews[0].id == review.id
+
+
+def test_sqlalchemy_repository_compiles_predicates_to_sql(caplog):
+    app = create_app("testing")
+
+    with app.app_context():
+        repository = AmenityRepository()
+        for name in ["WiFi", "Pool", "Parking", "Air Conditioning"]:
+            repository.save(Amenity(name=name))
+        owner = User(
+            first_name="Pat",
+            last_name="Owner",
+            email="pat@example.com",
+            password_hash="not-a-real-hash",
+        )
+        UserRepository().save(owner)
+        place_repo = PlaceRepository()
+        for price in [40.0, 80.0, 120.0]:
+            place_repo.save(
+                Place(
+                    name=f"Place {price}",
+                    price=price,
+                    latitude=18.0,
+                    longitude=-66.0,
+                    owner_id=owner.id,
+                )
+            )
+
+        pool = repository.find_first(Eq("name", "Pool"))
+        p_names = repository.filter(Like("name", "p%"))
+        either = repository.filter(Eq("name", "WiFi") | In("name", ["Parking"]))
+        none = repository.filter(In("name", []))
+        mid_range = place_repo.filter(Range("price", gte=50, lte=120) & Eq("owner_id", owner.id))
+
+        with caplog.at_level("WARNING"):
+            legacy = repository.find_first(lambda amenity: amenity.name == "WiFi")
+
+        assert pool is not None and pool.name == "Pool"
+        assert {amenity.name for amenity in p_names} == {"Pool", "Parking"}
+        assert {amenity.name for amenity in either} == {"WiFi", "Parking"}
+        assert none == []
+        assert sorted(place.price for place in mid_range) == [80.0, 120.0]
+        assert legacy is not None and legacy.name == "WiFi"
+        assert "Callable predicate" in caplog.text
+
+
+def test_predicates_only_compile_against_mapped_columns():
+    app = create_app("testing")
+
+    with app.app_context():
+        repository = AmenityRepository()
+
+        with pytest.raises(ValueError, match="Unknown field: places"):
+            repository.filter(Eq("places", "x"))
+        with pytest.raises(ValueError, match="Unknown field: to_dict"):
+            repository.filter(Like("to_dict", "%"))
+
+    with pytest.raises(TypeError):
+        Predicate()
+
+
+def test_facade_unit_of_work_commits_once_and_rolls_back_on_error():
+    app = create_app("testing")
+
+    with app.app_context():
+        facade = HBnBFacade()
+        commits: list[int] = []
+
+        @event.listens_for(db.session(), "after_commit")
+        def _count_commit(session):
+            commits.append(1)
+
+        with facade.unit_of_work():
+            for name in ["WiFi", "Pool", "Parking"]:
+                facade.create_amenity({"name": name})
+            with facade.unit_of_work():
+                facade.create_amenity({"name": "Gym"})
+
+        assert len(commits) == 1
+        assert len(facade.list_amenities()) == 4
+
+        with pytest.raises(ValueError):
+            with facade.unit_of_work():
+                facade.create_amenity({"name": "Sauna"})
+                facade.create_amenity({"name": "Sauna"})
+
+        assert facade.amenities.get_by_name("Sauna") is None
+        assert len(commits) == 1
+
+
+def test_sqlalchemy_repository_supports_save_many_and_delete_many():
+    app = create_app("testing")
+
+    with app.app_context():
+        repository = AmenityRepository()
+        saved = repository.save_many(Amenity(name=f"Amenity {index}") for index in range(5))
+
+        deleted = repository.delete_many([saved[0].id, saved[1].id, saved[1].id, "missing"])
+
+        assert deleted == 2
+        assert {amenity.name for amenity in repository.list()} == {
+            "Amenity 2",
+            "Amenity 3",
+            "Amenity 4",
+        }
+        assert repository.save_many([]) == []
+        assert repository.delete_many([]) == 0
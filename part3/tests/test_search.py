@@ -0,0 +1,180 @@
+"""Tests for FTS5 keyword search over places and reviews."""
+
+from __future__ import annotations
+
+from sqlalchemy import text
+
+from app import create_app, db
+from app.models import Place, Review, User
+from app.persistence.search import SEARCH_INDEXES
+from app.services import HBnBFacade
+
+
+def _seed(app) -> dict[str, str]:
+    with app.app_context():
+        owner = User(
+            first_name="Owner",
+            last_name="User",
+            email="owner@example.com",
+            password_hash="not-a-real-hash",
+        )
+        guest = User(
+            first_name="Guest",
+            last_name="User",
+            email="guest@example.com",
+            password_hash="not-a-real-hash",
+        )
+        db.session.add_all([owner, guest])
+        places = {
+            "villa": Place(
+                name="Ocean View Villa",
+                description="Private pool overlooking the ocean",
+                price=300.0,
+                latitude=18.4,
+                longitude=-66.1,
+                owner_id=owner.id,
+            ),
+            "loft": Place(
+                name="City Loft",
+                description="Rooftop pool with a view of the old town",
+                price=120.0,
+                latitude=18.4,
+                longitude=-66.1,
+                owner_id=owner.id,
+            ),
+            "cabin": Place(
+                name="Mountain Cabin",
+                description="Quiet forest retreat",
+                price=80.0,
+                latitude=18.2,
+                longitude=-66.5,
+                owner_id=owner.id,
+            ),
+        }
+        db.session.add_all(places.values())
+        db.session.add(
+            Review(
+                rating=5,
+                comment="Loved swimming in the pool at sunset",
+                user_id=guest.id,
+                place_id=places["villa"].id,
+            )
+        )
+        db.session.commit()
+        return {name: place.id for name, place in places.items()}
+
+
+def test_place_search_ranks_matches_and_highlights_snippets():
+    app = create_app("testing")
+    ids = _seed(app)
+
+    with app.test_client() as client:
+        response = client.get("/api/v1/places/?q=pool ocean view")
+        pool = client.get("/api/v1/places/?q=pool&fields=name")
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [place["id"] for place in body] == [ids["villa"]]
+    assert "<mark>" in body[0]["snippet"]
+    assert body[0]["owner"]["email"] == "owner@example.com"
+
+    pool_body = pool.get_json()
+    assert {place["id"] for place in pool_body} == {ids["villa"], ids["loft"]}
+    assert set(pool_body[0]) == {"id", "name", "score", "snippet"}
+    assert pool_body[0]["score"] <= pool_body[1]["score"]
+
+
+def test_place_search_paginates_and_follows_writes():
+    app = create_app("testing")
+    ids = _seed(app)
+
+    with app.test_client() as client:
+        first = client.get("/api/v1/places/?q=pool&limit=1")
+        second = client.get(f"/api/v1/places/?q=pool&limit=1&cursor={first.headers['X-Next-Cursor']}")
+
+    seen = [first.get_json()[0]["id"], second.get_json()[0]["id"]]
+    assert sorted(seen) == sorted([ids["villa"], ids["loft"]])
+    assert "X-Next-Cursor" not in second.headers
+
+    with app.app_context():
+        facade = HBnBFacade()
+        facade.update_place(ids["cabin"], {"description": "Forest retreat with a heated pool"})
+        facade.delete_place(ids["loft"])
+        hits = facade.search_place_text("pool", 10)
+
+    assert {hit.entity.id for hit in hits.items} == {ids["villa"], ids["cabin"]}
+
+
+def test_review_search_and_invalid_queries():
+    app = create_app("testing")
+    _seed(app)
+
+    with app.test_client() as client:
+        reviews = client.get("/api/v1/reviews/?q=sunset")
+        empty_query = client.get("/api/v1/places/?q=***")
+        operators = client.get('/api/v1/places/?q=pool" OR NEAR(')
+        combined = client.get("/api/v1/places/?q=pool&lat=18&lng=-66")
+
+    assert reviews.status_code == 200
+    assert reviews.get_json()[0]["snippet"] == "Loved swimming in the pool at <mark>sunset</mark>"
+    assert empty_query.status_code == 400
+    assert operators.status_code == 200
+    assert combined.status_code == 400
+
+
+def test_snippets_escape_user_text_around_highlights():
+    app = create_app("testing")
+    ids = _seed(app)
+
+    with app.app_context():
+        HBnBFacade().update_place(
+            ids["cabin"], {"description": "Forest <script>alert(1)</script> & <mark>pool</mark>"}
+        )
+
+    with app.test_client() as client:
+        response = client.get("/api/v1/places/?q=forest&fields=name")
+
+    snippet = response.get_json()[0]["snippet"]
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;" in snippet
+    assert "&amp;" in snippet
+    assert snippet.startswith("<mark>Forest</mark>")
+    assert snippet.count("<mark>") == 1
+
+
+def test_search_keys_survive_renumbered_rowids():
+    app = create_app("testing")
+    ids = _seed(app)
+
+    with app.app_context():
+        # VACUUM or a dump and reload may assign new rowids to TEXT-keyed tables
+        db.session.execute(text("UPDATE places SET rowid = rowid + 100"))
+        db.session.commit()
+        hits = HBnBFacade().search_place_text("quiet forest", 10)
+
+    assert [hit.entity.id for hit in hits.items] == [ids["cabin"]]
+
+
+def test_startup_rekeys_search_indexes_from_older_databases(file_config, downgrade_schema):
+    config = file_config()
+    app = create_app(config)
+    ids = _seed(app)
+    statements = []
+    for index in SEARCH_INDEXES.values():
+        statements.extend(index.drop_ddl())
+        statements.append(f"DROP INDEX ix_{index.source}_search_key")
+        statements.append(f"ALTER TABLE {index.source} DROP COLUMN search_key")
+    # The rowid-keyed table an older release created
+    statements.append(
+        "CREATE VIRTUAL TABLE places_fts USING fts5(name, description, "
+        "content='places', content_rowid='rowid')"
+    )
+    downgrade_schema(app, *statements)
+
+    upgraded = create_app(config)
+
+    with upgraded.app_context():
+        hits = HBnBFacade().search_place_text("quiet forest", 10)
+        reviews = HBnBFacade().search_review_text("sunset", 10)
+    assert [hit.entity.id for hit in hits.items] == [ids["cabin"]]
+    assert len(reviews.items) == 1
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from flask import Flask
@@ -24,17 +26,62 @@ def create_app(config_object: str | type | None = None) -> Flask:
     """Create and configure the Flask application."""
     from app.routes.api import api_bp
     from app.routes.web import web_bp
+    from app.services.async_backend import AsyncBackendClient
     from app.services.backend import BackendClient
+    from app.services.circuit_breaker import CircuitBreaker
+    from app.services.response_cache import ResponseCache
+    from app.services.sessions import SessionVerifier
 
     app = Flask(__name__, instance_relative_config=True)
     Path(app.instance_path).mkdir(parents=True, exist_ok=True)
     app.config.from_object(_resolve_config(config_object))
     app.url_map.strict_slashes = False
 
+    breaker_factory = None
+    if app.config["BACKEND_BREAKER_ENABLED"]:
+        breaker_factory = partial(
+            CircuitBreaker,
+            failure_rate=float(app.config["BACKEND_BREAKER_FAILURE_RATE"]),
+            slow_call_seconds=float(app.config["BACKEND_BREAKER_SLOW_CALL_SECONDS"]),
+            slow_call_rate=float(app.config["BACKEND_BREAKER_SLOW_CALL_RATE"]),
+            window=int(app.config["BACKEND_BREAKER_WINDOW"]),
+            minimum_calls=int(app.config["BACKEND_BREAKER_MINIMUM_CALLS"]),
+            open_seconds=float(app.config["BACKEND_BREAKER_OPEN_SECONDS"]),
+            half_open_probes=int(app.config["BACKEND_BREAKER_HALF_OPEN_PROBES"]),
+        )
     app.extensions["backend_client"] = BackendClient(
         base_url=app.config["BACKEND_API_URL"],
         timeout=float(app.config["BACKEND_TIMEOUT"]),
+        pool_size=int(app.config["BACKEND_POOL_SIZE"]),
+        idle_timeout=float(app.config["BACKEND_POOL_IDLE_TIMEOUT"]),
+        coalesce=bool(app.config["BACKEND_COALESCE_GETS"]),
+        breaker_factory=breaker_factory,
+        retries=int(app.config["BACKEND_RETRIES"]),
+        retry_backoff=float(app.config["BACKEND_RETRY_BACKOFF"]),
+        retry_backoff_max=float(app.config["BACKEND_RETRY_BACKOFF_MAX"]),
     )
+    app.extensions["async_backend_client"] = AsyncBackendClient(
+        base_url=app.config["BACKEND_API_URL"],
+        timeout=float(app.config["BACKEND_TIMEOUT"]),
+        pool_size=int(app.config["BACKEND_POOL_SIZE"]),
+        idle_timeout=float(app.config["BACKEND_POOL_IDLE_TIMEOUT"]),
+        # Both clients trip and recover the same per-endpoint breakers
+        breaker_factory=app.extensions["backend_client"].breaker_for,
+        retries=int(app.config["BACKEND_RETRIES"]),
+        retry_backoff=float(app.config["BACKEND_RETRY_BACKOFF"]),
+        retry_backoff_max=float(app.config["BACKEND_RETRY_BACKOFF_MAX"]),
+    )
+    app.extensions["fanout_executor"] = ThreadPoolExecutor(
+        max_workers=int(app.config["BACKEND_FANOUT_WORKERS"]),
+        thread_name_prefix="backend-fanout",
+    )
+    app.extensions["session_verifier"] = SessionVerifier.from_config(app.config)
+    if app.config["PROXY_CACHE_ENABLED"]:
+        app.extensions["response_cache"] = ResponseCache(
+            max_entries=int(app.config["PROXY_CACHE_MAX_ENTRIES"]),
+            stale_while_revalidate=float(app.config["PROXY_CACHE_STALE_WHILE_REVALIDATE"]),
+            stale_if_error=float(app.config["PROXY_CACHE_STALE_IF_ERROR"]),
+        )
 
     app.register_blueprint(web_bp)
     app.register_blueprint(api_bp)
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from flask import Blueprint, current_app, jsonify, request
-
-from app.services.backend import BackendClient, BackendClientError, BackendResponse
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+from flask import Blueprint, current_app, jsonify, make_response, request
+
+from app.services.async_backend import AsyncBackendClient, BackendCall
+from app.demo_data import get_demo_place, get_demo_user, list_demo_places
+from app.services.backend import (
+    BackendClient,
+    BackendClientError,
+    BackendResponse,
+    BackendUnavailableError,
+)
+from app.services.place_view import author_name, build_place_view, viewer_state
+from app.services.response_cache import BYPASS, MISS, CacheResult, ResponseCache
+from app.services.sessions import SessionVerifier
 
 api_bp = Blueprint("api_proxy", __name__, url_prefix="/api")
 
@@ -29,6 +40,217 @@ def _backend_client() -> BackendClient:
     return client
 
 
+def _async_backend_client() -> AsyncBackendClient:
+    client = current_app.extensions.get("async_backend_client")
+    if client is None:
+        raise RuntimeError("Async backend client not configured")
+    return client
+
+
+def _session_verifier() -> SessionVerifier:
+    verifier = current_app.extensions.get("session_verifier")
+    if verifier is None:
+        raise RuntimeError("Session verifier not configured")
+    return verifier
+
+
+def _cached_get(
+    key: str,
+    path: str,
+    ttl_setting: str,
+    params: dict[str, Any] | None = None,
+    all_pages: bool = False,
+) -> CacheResult:
+    """Fetch a public backend resource through the response cache.
+
+    With `all_pages`, a paginated listing is read to its end and cached as one list.
+    """
+    client = _backend_client()
+
+    def load() -> BackendResponse:
+        if all_pages:
+            return _read_all_pages(client, path)
+        return client.request("GET", path, params=params)
+
+    cache: ResponseCache | None = current_app.extensions.get("response_cache")
+    if cache is None:
+        return CacheResult(load(), BYPASS)
+    return cache.fetch(key, load, float(current_app.config[ttl_setting]))
+
+
+def _read_all_pages(client: BackendClient, path: str) -> BackendResponse:
+    """Follow a listing's `X-Next-Cursor` for up to `PROXY_MAX_LIST_PAGES` pages.
+
+    Pages of `BACKEND_PAGE_SIZE` items, which should match the backend's
+    `API_MAX_PAGE_SIZE`, are merged into one response. A page that does not
+    answer `200` is returned as is.
+    """
+    params: dict[str, Any] = {"limit": max(1, int(current_app.config["BACKEND_PAGE_SIZE"]))}
+    max_pages = max(1, int(current_app.config["PROXY_MAX_LIST_PAGES"]))
+    items: list[Any] = []
+    for _ in range(max_pages):
+        response = client.request("GET", path, params=params)
+        if response.status_code != 200 or not isinstance(response.payload, list):
+            return response
+        items.extend(response.payload)
+        if response.next_cursor is None:
+            return BackendResponse(200, items)
+        params = {**params, "cursor": response.next_cursor}
+    current_app.logger.warning(
+        "%s has more than %d pages; the rest is not listed", path, max_pages
+    )
+    return BackendResponse(200, items, next_cursor=response.next_cursor)
+
+
+def _with_cache_headers(response, result: CacheResult):
+    response = make_response(response)
+    cache: ResponseCache | None = current_app.extensions.get("response_cache")
+    if cache is None or result.state == BYPASS:
+        return response
+    response.headers["Cache-Control"] = (
+        f"public, max-age={int(result.max_age)}, "
+        f"stale-while-revalidate={int(cache.stale_while_revalidate)}, "
+        f"stale-if-error={int(cache.stale_if_error)}"
+    )
+    response.headers["Age"] = str(int(result.age))
+    response.headers["X-Cache"] = result.state
+    return response
+
+
+def _batch_ids() -> list[str] | None:
+    raw = request.args.get("ids")
+    if raw is None:
+        return None
+    return list(dict.fromkeys(part.strip() for part in raw.split(",") if part.strip()))
+
+
+def _fetch_batch(
+    resource: str,
+    ids: list[str],
+    ttl_setting: str | None = None,
+) -> tuple[list[dict[str, Any]], list[CacheResult]]:
+    """Resolve `ids` against a backend list endpoint's `?ids=` lookup.
+
+    The ids are sent in chunks of `BACKEND_BATCH_SIZE`. Chunks are cached
+    when the route has a TTL setting. Several chunks are requested
+    concurrently through the async client. The items come back with one
+    result per chunk, cut off after the first chunk that did not answer
+    `200`.
+    """
+    size = max(1, int(current_app.config["BACKEND_BATCH_SIZE"]))
+    path = f"/{resource}/"
+    chunks = [",".join(ids[start : start + size]) for start in range(0, len(ids), size)]
+    cache: ResponseCache | None = current_app.extensions.get("response_cache")
+    if ttl_setting is None:
+        cache = None
+
+    results: list[CacheResult | None]
+    if len(chunks) == 1:
+        params = {"ids": chunks[0]}
+        if cache is None:
+            result = CacheResult(_backend_client().request("GET", path, params=params), BYPASS)
+        else:
+            result = _cached_get(f"{resource}?ids={chunks[0]}", path, ttl_setting, params)
+        results = [result]
+    else:
+        results = [
+            cache.peek(f"{resource}?ids={chunk}") if cache is not None else None
+            for chunk in chunks
+        ]
+        missing = [index for index, result in enumerate(results) if result is None]
+        responses = _async_backend_client().request_many(
+            *(BackendCall("GET", path, params={"ids": chunks[index]}) for index in missing)
+        )
+        for index, response in zip(missing, responses):
+            if isinstance(response, BackendClientError):
+                raise response
+            state = BYPASS
+            if cache is not None and response.status_code == 200:
+                ttl = float(current_app.config[ttl_setting])
+                cache.store(f"{resource}?ids={chunks[index]}", response, ttl)
+                state = MISS
+            results[index] = CacheResult(response, state)
+
+    items: list[dict[str, Any]] = []
+    fetched: list[CacheResult] = []
+    for result in results:
+        fetched.append(result)
+        if result.response.status_code != 200:
+            break
+        payload = result.response.payload if isinstance(result.response.payload, list) else []
+        items.extend(item for item in payload if isinstance(item, dict))
+    return items, fetched
+
+
+def _batch_get(
+    resource: str,
+    ids: list[str],
+    ttl_setting: str | None = None,
+    transform: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+):
+    """Answer a batch lookup route, so the browser needs one request for any number of ids."""
+    max_ids = int(current_app.config["PROXY_MAX_BATCH_IDS"])
+    if not ids:
+        return _json_error("ids must list at least one id", 400)
+    if len(ids) > max_ids:
+        return _json_error(f"ids accepts at most {max_ids} ids", 400)
+
+    items, results = _fetch_batch(resource, ids, ttl_setting)
+    if results[-1].response.status_code != 200:
+        return _proxy_response(results[-1].response)
+    if transform is not None:
+        items = [transform(item) for item in items]
+    if len(results) == 1:
+        return _with_cache_headers(jsonify(items), results[0])
+    return jsonify(items)
+
+
+def _in_parallel(*calls: Callable[[], Any]) -> list[Any]:
+    """Run independent calls on the fan-out pool and return their results in order.
+
+    Each call runs inside the application context. The first exception is
+    re-raised once every call has finished.
+    """
+    app = current_app._get_current_object()
+    executor: ThreadPoolExecutor = app.extensions["fanout_executor"]
+
+    def run(call: Callable[[], Any]) -> Any:
+        with app.app_context():
+            return call()
+
+    futures = [executor.submit(run, call) for call in calls]
+    wait(futures)
+    return [future.result() for future in futures]
+
+
+def _load_place_view(app, place_id: str) -> BackendResponse:
+    """Build the shared place page model, or return the backend's error for the place."""
+    with app.app_context():
+        result = _cached_get(f"place:{place_id}", f"/places/{place_id}", "PROXY_CACHE_TTL_PLACE")
+        place = result.response
+        if place.status_code != 200 or not isinstance(place.payload, dict):
+            return place
+
+        author_ids = list(
+            dict.fromkeys(
+                review["user_id"]
+                for review in place.payload.get("reviews") or []
+                if isinstance(review, dict) and review.get("user_id")
+            )
+        )
+        authors: dict[str, str] = {}
+        if author_ids:
+            try:
+                users, _ = _fetch_batch("users", author_ids, "PROXY_CACHE_TTL_USER")
+            except BackendClientError:
+                # Reviews still render, attributed by user id
+                users = []
+            authors = {user["id"]: author_name(user) for user in users if user.get("id")}
+
+        view = build_place_view(_attach_backend_place_image(place.payload), authors)
+        return BackendResponse(200, view)
+
+
 def _get_token_from_cookie() -> str | None:
     token = request.cookies.get("token")
     if token is None:
@@ -49,17 +271,7 @@ def _anonymous_session_payload() -> dict[str, Any]:
 def _authenticated_session_payload(token: str | None) -> dict[str, Any] | None:
     if token is None:
         return None
-
-    response = _backend_client().request("GET", "/auth/protected", token=token)
-    if response.status_code != 200:
-        return None
-
-    payload = response.payload or {}
-    return {
-        "logged_in": True,
-        "user_id": payload.get("user_id"),
-        "is_admin": bool(payload.get("is_admin", False)),
-    }
+    return _session_verifier().session_for(token, _backend_client())
 
 
 def _json_error(message: str, status_code: int):
@@ -94,6 +306,56 @@ def handle_backend_error(error: BackendClientError):
     return _json_error(str(error), 502)
 
 
+def _demo_amenities() -> list[dict[str, Any]]:
+    amenities: dict[str, dict[str, Any]] = {}
+    for place in list_demo_places():
+        for amenity in place.get("amenities") or []:
+            amenities.setdefault(amenity["id"], amenity)
+    return sorted(amenities.values(), key=lambda amenity: amenity["name"])
+
+
+def _demo_place_view(place_id: str) -> dict[str, Any] | None:
+    place = get_demo_place(place_id)
+    if place is None:
+        return None
+    users = (get_demo_user(review["user_id"]) for review in place.get("reviews") or [])
+    authors = {user["id"]: author_name(user) for user in users if user is not None}
+    view = build_place_view(place, authors)
+    return {**view, "viewer": viewer_state(view, None)}
+
+
+# Public reads that the bundled demo dataset can answer while the backend is down
+_DEMO_FALLBACKS: dict[str, Callable[[dict[str, Any]], Any | None]] = {
+    "api_proxy.list_places": lambda args: list_demo_places(),
+    "api_proxy.get_place": lambda args: get_demo_place(args["place_id"]),
+    "api_proxy.get_place_view": lambda args: _demo_place_view(args["place_id"]),
+    "api_proxy.list_amenities": lambda args: _demo_amenities(),
+    "api_proxy.get_user": lambda args: get_demo_user(args["user_id"]),
+}
+
+
+@api_bp.errorhandler(BackendUnavailableError)
+def handle_backend_unavailable(error: BackendUnavailableError):
+    """Fail fast while a backend circuit is open, serving demo data for public reads.
+
+    Fresh and stale-if-error cache entries are tried first, so this only
+    runs when no last-known-good copy is left.
+    """
+    fallback = _DEMO_FALLBACKS.get(request.endpoint or "")
+    payload = None
+    if fallback is not None and "ids" not in request.args:
+        payload = fallback(request.view_args or {})
+    if payload is not None:
+        response = jsonify(payload)
+        response.headers["Cache-Control"] = "no-store"
+        response.headers["X-Backend-Fallback"] = "demo"
+        return response
+
+    response, status_code = _json_error(str(error), 503)
+    response.headers["Retry-After"] = str(error.retry_after)
+    return response, status_code
+
+
 @api_bp.get("/session")
 def get_session_state():
     """Return the current web client session state."""
@@ -127,24 +389,17 @@ def login():
     if not access_token:
         return _json_error("Backend login response did not include an access token", 502)
 
-    protected_response = backend.request("GET", "/auth/protected", token=access_token)
-    if protected_response.status_code != 200:
+    session = _session_verifier().session_for(access_token, backend)
+    if session is None:
         return _json_error("Failed to verify the authenticated session", 502)
 
-    protected_payload = protected_response.payload or {}
-    return jsonify(
-        {
-            "access_token": access_token,
-            "logged_in": True,
-            "user_id": protected_payload.get("user_id"),
-            "is_admin": bool(protected_payload.get("is_admin", False)),
-        }
-    )
+    return jsonify({"access_token": access_token, **session})
 
 
 @api_bp.post("/session/logout")
 def logout():
     """Clear the local web client session."""
+    _session_verifier().forget(_get_token_from_cookie())
     response = jsonify({"message": "Logged out"})
     response.delete_cookie("token", path="/")
     return response
@@ -152,8 +407,14 @@ def logout():
 
 @api_bp.get("/places")
 def list_places():
-    """Proxy the public places listing."""
-    response = _backend_client().request("GET", "/places/")
+    """Proxy the public places listing, or a batch lookup with `?ids=`."""
+    ids = _batch_ids()
+    if ids is not None:
+        # Not cached: a new review changes its place and cannot evict every batch key
+        return _batch_get("places", ids, transform=_attach_backend_place_image)
+
+    result = _cached_get("places", "/places/", "PROXY_CACHE_TTL_PLACES", all_pages=True)
+    response = result.response
     if response.status_code != 200:
         return _proxy_response(response)
 
@@ -163,28 +424,91 @@ def list_places():
         for place in places
         if isinstance(place, dict)
     ]
-    return jsonify(places)
+    return _with_cache_headers(jsonify(places), result)
 
 
 @api_bp.get("/places/<string:place_id>")
 def get_place(place_id: str):
     """Proxy a public place detail request."""
-    response = _backend_client().request("GET", f"/places/{place_id}")
+    result = _cached_get(f"place:{place_id}", f"/places/{place_id}", "PROXY_CACHE_TTL_PLACE")
+    response = result.response
     if response.status_code == 200 and isinstance(response.payload, dict):
-        return jsonify(_attach_backend_place_image(response.payload))
+        return _with_cache_headers(jsonify(_attach_backend_place_image(response.payload)), result)
     return _proxy_response(response)
 
 
+@api_bp.get("/views/place/<string:place_id>")
+def get_place_view(place_id: str):
+    """Return everything the place page renders: place, reviews with authors, viewer."""
+    app = current_app._get_current_object()
+    token = _get_token_from_cookie()
+    cache: ResponseCache | None = app.extensions.get("response_cache")
+
+    def load() -> BackendResponse:
+        return _load_place_view(app, place_id)
+
+    def fetch_view() -> CacheResult:
+        if cache is None:
+            return CacheResult(load(), BYPASS)
+        ttl = float(app.config["PROXY_CACHE_TTL_PLACE"])
+        return cache.fetch(f"view:place:{place_id}", load, ttl)
+
+    def fetch_session() -> dict[str, Any] | None:
+        try:
+            return _authenticated_session_payload(token)
+        except BackendClientError:
+            # Like the page shell, an unverifiable session renders the anonymous viewer
+            return None
+
+    result, session = _in_parallel(fetch_view, fetch_session)
+    if result.response.status_code != 200:
+        return _proxy_response(result.response)
+
+    view = {**result.response.payload, "viewer": viewer_state(result.response.payload, session)}
+    response = _with_cache_headers(jsonify(view), result)
+    if session is not None and "Cache-Control" in response.headers:
+        # Only the shared part is cached, the viewer block is personal
+        response.headers["Cache-Control"] = "private, no-cache"
+    response.vary.add("Cookie")
+    return response
+
+
 @api_bp.get("/amenities")
 def list_amenities():
-    """Proxy the public amenities listing."""
-    return _proxy_response(_backend_client().request("GET", "/amenities/"))
+    """Proxy the public amenities listing, or a batch lookup with `?ids=`."""
+    ids = _batch_ids()
+    if ids is not None:
+        return _batch_get("amenities", ids, "PROXY_CACHE_TTL_AMENITIES")
+
+    result = _cached_get(
+        "amenities", "/amenities/", "PROXY_CACHE_TTL_AMENITIES", all_pages=True
+    )
+    return _with_cache_headers(_proxy_response(result.response), result)
+
+
+@api_bp.get("/users")
+def get_users():
+    """Proxy a public batch user lookup, `?ids=a,b,c`."""
+    ids = _batch_ids()
+    if ids is None:
+        return _json_error("ids is required", 400)
+    return _batch_get("users", ids, "PROXY_CACHE_TTL_USER")
 
 
 @api_bp.get("/users/<string:user_id>")
 def get_user(user_id: str):
     """Proxy a public user detail request."""
-    return _proxy_response(_backend_client().request("GET", f"/users/{user_id}"))
+    result = _cached_get(f"user:{user_id}", f"/users/{user_id}", "PROXY_CACHE_TTL_USER")
+    return _with_cache_headers(_proxy_response(result.response), result)
+
+
+@api_bp.get("/reviews")
+def get_reviews():
+    """Proxy a public batch review lookup, `?ids=a,b,c`."""
+    ids = _batch_ids()
+    if ids is None:
+        return _json_error("ids is required", 400)
+    return _batch_get("reviews", ids)
 
 
 @api_bp.post("/reviews")
@@ -195,14 +519,18 @@ def create_review():
         return _json_error("Authentication required", 401)
 
     payload = request.get_json(silent=True) or {}
-    return _proxy_response(
-        _backend_client().request(
-            "POST",
-            "/reviews/",
-            token=str(access_token),
-            json=payload,
-        )
+    response = _backend_client().request(
+        "POST",
+        "/reviews/",
+        token=str(access_token),
+        json=payload,
     )
+    cache: ResponseCache | None = current_app.extensions.get("response_cache")
+    if cache is not None and response.status_code == 201:
+        # The new review changes the place's detail, page view and listing summary
+        place_id = payload.get("place_id")
+        cache.invalidate("places", f"place:{place_id}", f"view:place:{place_id}")
+    return _proxy_response(response)
 
 
 @api_bp.post("/users")
@@ -4,30 +4,24 @@ from __future__ import annotations
 
 from flask import Blueprint, current_app, redirect, render_template, request, url_for
 
-from app.services.backend import BackendResponse
+from app.services.backend import BackendClientError
 
 web_bp = Blueprint("web", __name__)
 
 
 def _session_payload() -> dict[str, object]:
+    anonymous = {"logged_in": False, "is_admin": False, "user_id": None}
     token = request.cookies.get("token", "").strip()
-    if not token:
-        return {"logged_in": False, "is_admin": False, "user_id": None}
-
-    backend_client = current_app.extensions.get("backend_client")
-    if backend_client is None:
-        return {"logged_in": False, "is_admin": False, "user_id": None}
-
-    response = backend_client.request("GET", "/auth/protected", token=token)
-    if not isinstance(response, BackendResponse) or response.status_code != 200:
-        return {"logged_in": False, "is_admin": False, "user_id": None}
-
-    payload = response.payload or {}
-    return {
-        "logged_in": True,
-        "is_admin": bool(payload.get("is_admin", False)),
-        "user_id": payload.get("user_id"),
-    }
+    verifier = current_app.extensions.get("session_verifier")
+    if not token or verifier is None:
+        return anonymous
+
+    try:
+        session = verifier.session_for(token, current_app.extensions.get("backend_client"))
+    except BackendClientError:
+        # An unreachable backend must not take page rendering down with it
+        return anonymous
+    return session or anonymous
 
 
 @web_bp.get("/")
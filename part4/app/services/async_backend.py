@@ -0,0 +1,485 @@
+"""Asyncio client for the Part 3 backend API, for routes that fan out."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import ssl
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+from urllib import parse
+
+from app.services.backend import (
+    IDEMPOTENT_METHODS,
+    RETRY_STATUSES,
+    BackendClient,
+    BackendClientError,
+    BackendResponse,
+    BackendUnavailableError,
+    _endpoint,
+    json_module_dumps,
+)
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+# Errors that mean a pooled stream was closed by the server while idle
+_STALE_ERRORS = (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError)
+
+Stream = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+@dataclass(frozen=True)
+class BackendCall:
+    """One request for `AsyncBackendClient.gather`. `timeout` overrides the client's."""
+
+    method: str
+    path: str
+    token: str | None = None
+    json: dict[str, Any] | None = None
+    params: dict[str, Any] | None = None
+    timeout: float | None = None
+
+
+class _HeaderMap(dict):
+    def get(self, key, default=None):
+        return super().get(key.lower(), default)
+
+
+class AsyncConnectionPool:
+    """Pool of persistent HTTP/1.1 streams to one host, used on a single event loop.
+
+    Mirrors `ConnectionPool`: at most `max_size` streams are open at once,
+    idle ones are reused newest first and closed after `idle_timeout`.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: int | None,
+        max_size: int = 10,
+        idle_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.scheme = scheme
+        self.host = host
+        self.port = port or (443 if scheme == "https" else 80)
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._idle: list[tuple[Stream, float]] = []
+        self._open = 0
+        self._condition: asyncio.Condition | None = None
+        self._stats = dict.fromkeys(
+            ("created", "reused", "reconnects", "idle_evictions", "waits"), 0
+        )
+
+    async def acquire(self) -> tuple[Stream, bool]:
+        """Return a stream and whether it was reused from the idle list."""
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                self._evict_idle()
+                if self._idle:
+                    stream, _ = self._idle.pop()
+                    self._stats["reused"] += 1
+                    return stream, True
+                if self._open < self.max_size:
+                    self._open += 1
+                    self._stats["created"] += 1
+                    break
+                self._stats["waits"] += 1
+                await condition.wait()
+        try:
+            return await self._connect(), False
+        except BaseException:
+            await self._forget()
+            raise
+
+    async def release(self, stream: Stream) -> None:
+        """Return a healthy stream to the idle list."""
+        condition = self._get_condition()
+        async with condition:
+            self._idle.append((stream, self._clock()))
+            condition.notify()
+
+    async def discard(self, stream: Stream, stale: bool = False) -> None:
+        """Close a stream that must not be reused."""
+        stream[1].close()
+        if stale:
+            self._stats["reconnects"] += 1
+        await self._forget()
+
+    def close(self) -> None:
+        idle, self._idle = self._idle, []
+        self._open -= len(idle)
+        for (_, writer), _ in idle:
+            writer.close()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            **self._stats,
+            "open": self._open,
+            "idle": len(self._idle),
+            "in_use": self._open - len(self._idle),
+            "max_size": self.max_size,
+        }
+
+    async def _forget(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self._open -= 1
+            condition.notify()
+
+    async def _connect(self) -> Stream:
+        context = ssl.create_default_context() if self.scheme == "https" else None
+        return await asyncio.open_connection(self.host, self.port, ssl=context)
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created on first use so it belongs to the loop that runs the pool
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _evict_idle(self) -> None:
+        cutoff = self._clock() - self.idle_timeout
+        expired = 0
+        while expired < len(self._idle) and self._idle[expired][1] <= cutoff:
+            self._idle[expired][0][1].close()
+            expired += 1
+        if expired:
+            del self._idle[:expired]
+            self._open -= expired
+            self._stats["idle_evictions"] += expired
+
+
+class AsyncBackendClient:
+    """Asyncio HTTP/1.1 client for the Part 3 REST API.
+
+    Returns the same `BackendResponse` as `BackendClient` and raises the same
+    `BackendClientError`. All requests run on one event loop owned by the
+    client, in a background thread. That lets every Flask worker thread
+    share the client's connection pools. Synchronous code calls
+    `request_many()`, which sends a batch of calls concurrently and waits
+    only as long as the slowest one. Each attempt is limited to the call's
+    timeout, including any wait for a pooled connection.
+
+    Circuit breakers and retries work as in `BackendClient`. Passing that
+    client's `breaker_for` as the `breaker_factory` shares one breaker per
+    endpoint between both clients.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10.0,
+        pool_size: int = 10,
+        idle_timeout: float = 30.0,
+        breaker_factory: Callable[[str], CircuitBreaker | None] | None = None,
+        retries: int = 0,
+        retry_backoff: float = 0.1,
+        retry_backoff_max: float = 1.0,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.breaker_factory = breaker_factory
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self._pools: dict[tuple[str, str], AsyncConnectionPool] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._loop_lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker | None] = {}
+        self._breakers_lock = threading.Lock()
+        self._retry_count = 0
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        token: str | None = None,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> BackendResponse:
+        """Send an HTTP request and normalize the response."""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        if params:
+            url = f"{url}?{parse.urlencode(params, doseq=True)}"
+
+        target = parse.urlsplit(url)
+        headers = {
+            "Host": target.netloc,
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+        }
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        body = b""
+        if json is not None:
+            headers["Content-Type"] = "application/json"
+            body = json_module_dumps(json).encode("utf-8")
+        headers["Content-Length"] = str(len(body))
+
+        limit = self.timeout if timeout is None else timeout
+        return await self._send_with_retries(
+            _endpoint(path), target, method.upper(), headers, body, limit
+        )
+
+    async def gather(self, *calls: BackendCall) -> list[BackendResponse | BackendClientError]:
+        """Send calls concurrently and return their results in order.
+
+        A call that fails yields its `BackendClientError` in place of a
+        response, so one slow or broken call does not discard the others.
+        """
+        results = await asyncio.gather(
+            *(
+                self.request(
+                    call.method,
+                    call.path,
+                    token=call.token,
+                    json=call.json,
+                    params=call.params,
+                    timeout=call.timeout,
+                )
+                for call in calls
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, BackendClientError):
+                raise result
+        return results
+
+    def request_many(self, *calls: BackendCall) -> list[BackendResponse | BackendClientError]:
+        """Run `gather()` on the client's loop from synchronous code."""
+        if not calls:
+            return []
+        future = asyncio.run_coroutine_threadsafe(self.gather(*calls), self._ensure_loop())
+        return future.result()
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Return connection pool metrics keyed by backend host."""
+        return {
+            f"{scheme}://{netloc}": pool.stats() for (scheme, netloc), pool in self._pools.items()
+        }
+
+    def resilience_stats(self) -> dict[str, Any]:
+        """Return retry counts and circuit breaker state per endpoint."""
+        with self._breakers_lock:
+            breakers = {key: breaker for key, breaker in self._breakers.items() if breaker}
+            retries = self._retry_count
+        return {
+            "retries": retries,
+            "breakers": {endpoint: breaker.stats() for endpoint, breaker in breakers.items()},
+        }
+
+    def close(self) -> None:
+        """Close pooled streams and stop the event loop thread."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def shutdown() -> None:
+            for pool in self._pools.values():
+                pool.close()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        self._pools.clear()
+
+    async def _send_with_retries(
+        self,
+        endpoint: str,
+        target: parse.SplitResult,
+        method: str,
+        headers: dict[str, str],
+        body: bytes,
+        limit: float,
+    ) -> BackendResponse:
+        retries = self.retries if method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                response = await self._guarded_send(endpoint, target, method, headers, body, limit)
+            except BackendUnavailableError:
+                raise
+            except BackendClientError:
+                if attempt >= retries:
+                    raise
+            else:
+                if attempt >= retries or response.status_code not in RETRY_STATUSES:
+                    return response
+            attempt += 1
+            with self._breakers_lock:
+                self._retry_count += 1
+            ceiling = min(self.retry_backoff_max, self.retry_backoff * 2 ** (attempt - 1))
+            await asyncio.sleep(random.uniform(0, ceiling))
+
+    async def _guarded_send(
+        self,
+        endpoint: str,
+        target: parse.SplitResult,
+        method: str,
+        headers: dict[str, str],
+        body: bytes,
+        limit: float,
+    ) -> BackendResponse:
+        breaker = self._breaker_for(endpoint)
+        if breaker is not None:
+            try:
+                breaker.before_call()
+            except CircuitOpenError as exc:
+                raise BackendUnavailableError(endpoint, exc.retry_after) from exc
+        started = time.monotonic()
+        succeeded = False
+        try:
+            response = await asyncio.wait_for(self._send(target, method, headers, body), limit)
+            succeeded = response.status_code < 500
+            return response
+        except asyncio.TimeoutError as exc:
+            raise BackendClientError(
+                f"Timed out after {limit:g}s waiting for backend at {self.base_url}"
+            ) from exc
+        finally:
+            if breaker is not None:
+                breaker.record(succeeded, time.monotonic() - started)
+
+    async def _send(
+        self,
+        target: parse.SplitResult,
+        method: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> BackendResponse:
+        pool = self._pool_for(target)
+        request_path = target.path or "/"
+        if target.query:
+            request_path = f"{request_path}?{target.query}"
+        head = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        message = f"{method} {request_path} HTTP/1.1\r\n{head}\r\n".encode("latin-1") + body
+
+        resent = False
+        while True:
+            try:
+                stream, reused = await pool.acquire()
+            except OSError as exc:
+                raise BackendClientError(f"Failed to reach backend at {self.base_url}") from exc
+            reader, writer = stream
+            if reused and (reader.at_eof() or writer.is_closing()):
+                # Closed by the server while idle; nothing was sent on it yet
+                await pool.discard(stream, stale=True)
+                continue
+            try:
+                writer.write(message)
+                await writer.drain()
+                status, response_headers, data, keep_alive = await _read_response(reader, method)
+            except _STALE_ERRORS as exc:
+                await pool.discard(stream, stale=reused)
+                # The server may have acted on the request, so only a safe one is resent
+                if reused and not resent and method in IDEMPOTENT_METHODS:
+                    resent = True
+                    continue
+                raise BackendClientError(f"Failed to reach backend at {self.base_url}") from exc
+            except (OSError, ValueError, asyncio.LimitOverrunError) as exc:
+                await pool.discard(stream)
+                raise BackendClientError(f"Failed to reach backend at {self.base_url}") from exc
+            except BaseException:
+                # Cancelled mid-response, e.g. by a timeout, so the stream is unusable
+                await asyncio.shield(pool.discard(stream))
+                raise
+
+            if keep_alive:
+                await pool.release(stream)
+            else:
+                await pool.discard(stream)
+            return BackendClient._build_response(status, response_headers, data)
+
+    def _breaker_for(self, endpoint: str) -> CircuitBreaker | None:
+        if self.breaker_factory is None:
+            return None
+        with self._breakers_lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = self.breaker_factory(endpoint)
+            return self._breakers[endpoint]
+
+    def _pool_for(self, target: parse.SplitResult) -> AsyncConnectionPool:
+        key = (target.scheme, target.netloc)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = AsyncConnectionPool(
+                target.scheme,
+                target.hostname or "",
+                target.port,
+                max_size=self.pool_size,
+                idle_timeout=self.idle_timeout,
+            )
+        return pool
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="backend-async-loop", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+
+async def _read_response(
+    reader: asyncio.StreamReader,
+    method: str,
+) -> tuple[int, _HeaderMap, bytes, bool]:
+    status_line = (await reader.readuntil(b"\r\n")).decode("latin-1").rstrip("\r\n")
+    version, status, *_ = status_line.split(" ", 2)
+    if not version.startswith("HTTP/"):
+        raise ValueError(f"Malformed status line: {status_line!r}")
+
+    headers = _HeaderMap()
+    while True:
+        line = (await reader.readuntil(b"\r\n")).decode("latin-1").rstrip("\r\n")
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    status_code = int(status)
+    connection = headers.get("Connection", "").lower()
+    keep_alive = connection != "close" and (version != "HTTP/1.0" or connection == "keep-alive")
+    if method == "HEAD" or status_code in (204, 304) or 100 <= status_code < 200:
+        return status_code, headers, b"", keep_alive
+
+    if headers.get("Transfer-Encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+            if size == 0:
+                # Skip trailers up to the blank line closing the message
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        return status_code, headers, b"".join(chunks), keep_alive
+
+    length = headers.get("Content-Length")
+    if length is not None:
+        return status_code, headers, await reader.readexactly(int(length)), keep_alive
+    # Without a length the body runs until the server closes the stream
+    return status_code, headers, await reader.read(), False
+
+
+__all__ = ["AsyncBackendClient", "AsyncConnectionPool", "BackendCall"]
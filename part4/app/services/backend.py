@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
+import http.client
 import json
+import random
+import select
+import threading
+import time
 from dataclasses import dataclass
-from urllib import error, parse, request
-from typing import Any
+from urllib import parse
+from typing import Any, Callable
+
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.singleflight import SingleFlight
+
+# Errors that mean a pooled socket was closed by the server while idle
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+# Only requests without side effects are ever sent twice
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = frozenset({502, 503, 504})
 
 
 @dataclass
@@ -15,18 +30,183 @@ class BackendResponse:
     status_code: int
     payload: Any | None = None
     text: str = ""
+    # `X-Next-Cursor` of a paginated listing, `None` on its last page
+    next_cursor: str | None = None
 
 
 class BackendClientError(RuntimeError):
     """Raised when the backend request cannot be completed."""
 
 
+class BackendUnavailableError(BackendClientError):
+    """Raised without calling the backend while an endpoint's circuit is open."""
+
+    def __init__(self, endpoint: str, retry_after: int) -> None:
+        super().__init__(f"Backend endpoint {endpoint} is unavailable, retry later")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class ConnectionPool:
+    """Thread-safe pool of persistent HTTP/1.1 connections to one host.
+
+    At most `max_size` connections exist at once; callers wait up to
+    `timeout` seconds for one to be released. Idle connections are reused
+    newest first and closed once they have been idle for `idle_timeout`.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: int | None,
+        timeout: float = 10.0,
+        max_size: int = 10,
+        idle_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._idle: list[tuple[http.client.HTTPConnection, float]] = []
+        self._open = 0
+        self._condition = threading.Condition()
+        self._stats = dict.fromkeys(
+            ("created", "reused", "reconnects", "idle_evictions", "waits", "timeouts"), 0
+        )
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection and whether it was reused from the idle list."""
+        deadline = self._clock() + self.timeout
+        with self._condition:
+            while True:
+                self._evict_idle()
+                if self._idle:
+                    connection, _ = self._idle.pop()
+                    self._stats["reused"] += 1
+                    return connection, True
+                if self._open < self.max_size:
+                    self._open += 1
+                    self._stats["created"] += 1
+                    break
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise BackendClientError("Timed out waiting for a backend connection")
+                self._stats["waits"] += 1
+                self._condition.wait(remaining)
+        return self._connect(), False
+
+    def release(self, connection: http.client.HTTPConnection) -> None:
+        """Return a healthy connection to the idle list."""
+        with self._condition:
+            self._idle.append((connection, self._clock()))
+            self._condition.notify()
+
+    def discard(self, connection: http.client.HTTPConnection, stale: bool = False) -> None:
+        """Close a connection that must not be reused."""
+        connection.close()
+        with self._condition:
+            self._open -= 1
+            if stale:
+                self._stats["reconnects"] += 1
+            self._condition.notify()
+
+    def close(self) -> None:
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._condition.notify_all()
+        for connection, _ in idle:
+            connection.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                **self._stats,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": self._open - len(self._idle),
+                "max_size": self.max_size,
+            }
+
+    def _connect(self) -> http.client.HTTPConnection:
+        factory = (
+            http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        )
+        return factory(self.host, self.port, timeout=self.timeout)
+
+    def _evict_idle(self) -> None:
+        cutoff = self._clock() - self.idle_timeout
+        # The idle list is ordered by release time, so expired entries come first
+        expired = 0
+        while expired < len(self._idle) and self._idle[expired][1] <= cutoff:
+            self._idle[expired][0].close()
+            expired += 1
+        if expired:
+            del self._idle[:expired]
+            self._open -= expired
+            self._stats["idle_evictions"] += expired
+
+
 class BackendClient:
-    """Minimal HTTP client for the Part 3 REST API."""
+    """Minimal HTTP client for the Part 3 REST API.
+
+    Requests reuse keep-alive connections from a `ConnectionPool` per
+    backend host. When a reused connection turns out to have been closed
+    by the server before any response, it is replaced and the request is
+    sent again. Redirects are not followed.
+
+    Concurrent identical GETs share one upstream call when `coalesce` is
+    on. Calls match on URL, including the query string, and on the bearer
+    token, so a response is only shared between callers with the same
+    authorization.
+
+    With a `breaker_factory`, each endpoint (the first path segment, such
+    as `/places`) gets its own `CircuitBreaker`. Connection errors and
+    `5xx` answers count as failures. While a breaker is open, calls raise
+    `BackendUnavailableError` at once. Idempotent requests that fail or
+    get `502`/`503`/`504` are retried up to `retries` times, after a
+    full-jitter exponential backoff.
+    """
 
-    def __init__(self, base_url: str, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10.0,
+        pool_size: int = 10,
+        idle_timeout: float = 30.0,
+        coalesce: bool = True,
+        coalesce_timeout: float | None = None,
+        breaker_factory: Callable[[str], CircuitBreaker] | None = None,
+        retries: int = 0,
+        retry_backoff: float = 0.1,
+        retry_backoff_max: float = 1.0,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.flights = SingleFlight() if coalesce else None
+        if coalesce_timeout is None:
+            # Waiters must outlast the leader's whole retry budget, not just one attempt
+            coalesce_timeout = (retries + 1) * timeout + retry_backoff_max * retries
+        self.coalesce_timeout = coalesce_timeout
+        self.breaker_factory = breaker_factory
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self._pools: dict[tuple[str, str], ConnectionPool] = {}
+        self._pools_lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+        self._retry_count = 0
 
     def request(
         self,
@@ -51,20 +231,165 @@ class BackendClient:
             headers["Content-Type"] = "application/json"
             body = json_module_dumps(json).encode("utf-8")
 
-        http_request = request.Request(
-            url=url,
-            data=body,
-            headers=headers,
-            method=method.upper(),
-        )
+        method = method.upper()
+        endpoint = _endpoint(path)
+
+        def call() -> BackendResponse:
+            return self._send_with_retries(endpoint, method, url, headers, body)
+
+        if method != "GET" or self.flights is None:
+            return call()
 
+        key = (url, _token_scope(token))
         try:
-            with request.urlopen(http_request, timeout=self.timeout) as response:
-                return self._build_response(response.status, response.headers, response.read())
-        except error.HTTPError as exc:
-            return self._build_response(exc.code, exc.headers, exc.read())
-        except error.URLError as exc:
-            raise BackendClientError(f"Failed to reach backend at {self.base_url}") from exc
+            return self.flights.do(key, call, timeout=self.coalesce_timeout)
+        except TimeoutError as exc:
+            raise BackendClientError(f"Timed out waiting for backend at {self.base_url}") from exc
+
+    def _send_with_retries(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+    ) -> BackendResponse:
+        retries = self.retries if method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                response = self._guarded_send(endpoint, method, url, headers, body)
+            except BackendUnavailableError:
+                raise
+            except BackendClientError:
+                if attempt >= retries:
+                    raise
+            else:
+                if attempt >= retries or response.status_code not in RETRY_STATUSES:
+                    return response
+            attempt += 1
+            with self._breakers_lock:
+                self._retry_count += 1
+            ceiling = min(self.retry_backoff_max, self.retry_backoff * 2 ** (attempt - 1))
+            time.sleep(random.uniform(0, ceiling))
+
+    def _guarded_send(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+    ) -> BackendResponse:
+        breaker = self.breaker_for(endpoint)
+        if breaker is None:
+            return self._send(method, url, headers, body)
+
+        try:
+            breaker.before_call()
+        except CircuitOpenError as exc:
+            raise BackendUnavailableError(endpoint, exc.retry_after) from exc
+        started = time.monotonic()
+        succeeded = False
+        try:
+            response = self._send(method, url, headers, body)
+            succeeded = response.status_code < 500
+            return response
+        finally:
+            breaker.record(succeeded, time.monotonic() - started)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | None,
+    ) -> BackendResponse:
+        target = parse.urlsplit(url)
+        pool = self._pool_for(target)
+        request_path = target.path or "/"
+        if target.query:
+            request_path = f"{request_path}?{target.query}"
+
+        resent = False
+        while True:
+            connection, reused = pool.acquire()
+            if reused and _dropped(connection.sock):
+                # Closed by the server while idle; nothing was sent on it yet
+                pool.discard(connection, stale=True)
+                continue
+            try:
+                connection.request(method, request_path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except _STALE_ERRORS as exc:
+                pool.discard(connection, stale=reused)
+                # The server may have acted on the request, so only a safe one is resent
+                if reused and not resent and method in IDEMPOTENT_METHODS:
+                    resent = True
+                    continue
+                raise BackendClientError(f"Failed to reach backend at {self.base_url}") from exc
+            except (OSError, http.client.HTTPException) as exc:
+                pool.discard(connection)
+                raise BackendClientError(f"Failed to reach backend at {self.base_url}") from exc
+
+            if response.will_close:
+                pool.discard(connection)
+            else:
+                pool.release(connection)
+            return self._build_response(response.status, response.headers, data)
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Return connection pool metrics keyed by backend host."""
+        with self._pools_lock:
+            pools = dict(self._pools)
+        return {f"{scheme}://{netloc}": pool.stats() for (scheme, netloc), pool in pools.items()}
+
+    def coalescing_stats(self) -> dict[str, int]:
+        """Return single-flight counters for GET requests."""
+        return self.flights.stats() if self.flights is not None else {}
+
+    def resilience_stats(self) -> dict[str, Any]:
+        """Return retry counts and circuit breaker state per endpoint."""
+        with self._breakers_lock:
+            breakers = dict(self._breakers)
+            retries = self._retry_count
+        return {
+            "retries": retries,
+            "breakers": {endpoint: breaker.stats() for endpoint, breaker in breakers.items()},
+        }
+
+    def close(self) -> None:
+        """Close every idle pooled connection."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+
+    def breaker_for(self, endpoint: str) -> CircuitBreaker | None:
+        """Return the endpoint's breaker, created on first use; other clients may share it."""
+        if self.breaker_factory is None:
+            return None
+        with self._breakers_lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = self.breaker_factory(endpoint)
+            return breaker
+
+    def _pool_for(self, target: parse.SplitResult) -> ConnectionPool:
+        key = (target.scheme, target.netloc)
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = ConnectionPool(
+                    target.scheme,
+                    target.hostname or "",
+                    target.port,
+                    timeout=self.timeout,
+                    max_size=self.pool_size,
+                    idle_timeout=self.idle_timeout,
+                )
+            return pool
 
     @staticmethod
     def _build_response(status_code: int, headers, body: bytes) -> BackendResponse:
@@ -77,7 +402,33 @@ class BackendClient:
             except ValueError:
                 payload = None
 
-        return BackendResponse(status_code=status_code, payload=payload, text=text)
+        return BackendResponse(
+            status_code=status_code,
+            payload=payload,
+            text=text,
+            next_cursor=headers.get("X-Next-Cursor") or None,
+        )
+
+
+def _dropped(sock) -> bool:
+    """Return whether an idle socket was closed by the peer, or received stray data."""
+    if sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _endpoint(path: str) -> str:
+    return "/" + path.lstrip("/").split("?", 1)[0].split("/", 1)[0]
+
+
+def _token_scope(token: str | None) -> str | None:
+    if not token:
+        return None
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
 def json_module_dumps(payload: dict[str, Any]) -> str:
@@ -85,4 +436,10 @@ def json_module_dumps(payload: dict[str, Any]) -> str:
     return json.dumps(payload, separators=(",", ":"))
 
 
-__all__ = ["BackendClient", "BackendClientError", "BackendResponse"]
+__all__ = [
+    "BackendClient",
+    "BackendClientError",
+    "BackendResponse",
+    "BackendUnavailableError",
+    "ConnectionPool",
+]
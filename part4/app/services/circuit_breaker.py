@@ -0,0 +1,129 @@
+"""Circuit breaker guarding calls to one backend endpoint."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose breaker is open."""
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        super().__init__(f"Circuit for {endpoint} is open")
+        self.endpoint = endpoint
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class CircuitBreaker:
+    """Track recent call outcomes and stop calling an unhealthy endpoint.
+
+    While closed, the last `window` calls are kept. Once at least
+    `minimum_calls` of them are recorded, the breaker opens if the share
+    of failures reaches `failure_rate`, or if the share of calls slower
+    than `slow_call_seconds` reaches `slow_call_rate`. An open breaker
+    rejects calls for `open_seconds`. After that it lets `half_open_probes`
+    trial calls through: if they all succeed quickly it closes again,
+    and any failure or slow call reopens it.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        failure_rate: float = 0.5,
+        slow_call_seconds: float = 2.0,
+        slow_call_rate: float = 0.5,
+        window: int = 20,
+        minimum_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if window < 1 or minimum_calls < 1 or half_open_probes < 1:
+            raise ValueError("window, minimum_calls and half_open_probes must be at least 1")
+        self.endpoint = endpoint
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("calls", "failures", "slow_calls", "rejected", "opened"), 0)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def before_call(self) -> None:
+        """Admit a call, or raise `CircuitOpenError` while the breaker is open."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                return
+            self._stats["rejected"] += 1
+            retry_after = self._opened_at + self.open_seconds - self._clock()
+        raise CircuitOpenError(self.endpoint, retry_after)
+
+    def record(self, succeeded: bool, duration: float) -> None:
+        """Record the outcome of an admitted call."""
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["failures"] += not succeeded
+            self._stats["slow_calls"] += slow
+            if self._current_state() == HALF_OPEN:
+                if not succeeded or slow:
+                    self._open()
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                return
+
+            self._outcomes.append((succeeded, slow))
+            count = len(self._outcomes)
+            if count < self.minimum_calls:
+                return
+            failures = sum(1 for ok, _ in self._outcomes if not ok)
+            slow_calls = sum(1 for _, is_slow in self._outcomes if is_slow)
+            if failures / count >= self.failure_rate or slow_calls / count >= self.slow_call_rate:
+                self._open()
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {**self._stats, "state": self._current_state()}
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() >= self._opened_at + self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes = 0
+            self._probe_successes = 0
+        return self._state
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self._stats["opened"] += 1
+
+
+__all__ = ["CLOSED", "HALF_OPEN", "OPEN", "CircuitBreaker", "CircuitOpenError"]
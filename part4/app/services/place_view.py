@@ -0,0 +1,58 @@
+"""Page model for the place detail view, assembled from backend documents."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def author_name(user: dict[str, Any]) -> str:
+    """Return the display name shown next to a user's reviews."""
+    name = f"{user.get('first_name') or ''} {user.get('last_name') or ''}".strip()
+    return name or f"User {user.get('id')}"
+
+
+def build_place_view(place: dict[str, Any], authors: dict[str, str]) -> dict[str, Any]:
+    """Combine a place detail document with its review authors' names.
+
+    The result is the same for every viewer, so it can be cached and
+    shared. `viewer_state` adds the per-viewer part on each request.
+    """
+    reviews = [
+        {
+            **review,
+            "author_name": authors.get(review.get("user_id"))
+            or f"User {review.get('user_id')}",
+        }
+        for review in place.get("reviews") or []
+        if isinstance(review, dict)
+    ]
+    details = {key: value for key, value in place.items() if key != "reviews"}
+    return {"place": details, "reviews": reviews}
+
+
+def viewer_state(view: dict[str, Any], session: dict[str, Any] | None) -> dict[str, Any]:
+    """Return who is looking at the page and whether they may review it."""
+    if session is None:
+        return {
+            "logged_in": False,
+            "user_id": None,
+            "is_admin": False,
+            "is_owner": False,
+            "has_reviewed": False,
+            "can_review": False,
+        }
+
+    user_id = session.get("user_id")
+    is_owner = user_id is not None and user_id == view["place"].get("owner_id")
+    has_reviewed = any(review.get("user_id") == user_id for review in view["reviews"])
+    return {
+        "logged_in": True,
+        "user_id": user_id,
+        "is_admin": bool(session.get("is_admin", False)),
+        "is_owner": is_owner,
+        "has_reviewed": has_reviewed,
+        "can_review": not is_owner and not has_reviewed,
+    }
+
+
+__all__ = ["author_name", "build_place_view", "viewer_state"]
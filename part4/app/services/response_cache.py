@@ -0,0 +1,241 @@
+"""In-process cache for public backend responses proxied by Part 4."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable
+
+from app.services.backend import BackendClientError, BackendResponse
+
+Loader = Callable[[], BackendResponse]
+
+HIT = "HIT"
+MISS = "MISS"
+STALE = "STALE"
+STALE_ERROR = "STALE-ERROR"
+BYPASS = "BYPASS"
+
+
+@dataclass
+class CachedResponse:
+    """Backend response plus the times it stops being fresh and usable."""
+
+    response: BackendResponse
+    stored_at: float
+    fresh_until: float
+    stale_until: float
+    error_until: float
+    refreshing: bool = False
+
+
+@dataclass
+class CacheResult:
+    response: BackendResponse
+    state: str
+    age: float = 0.0
+    max_age: float = 0.0
+
+
+class ResponseCache:
+    """Bounded LRU of successful backend responses with stale-while-revalidate.
+
+    An entry is fresh for its route's `ttl`. For `stale_while_revalidate`
+    seconds after that it is still served, while one background refresh
+    per key fetches a new copy. When the backend fails or answers 5xx, an
+    entry up to `stale_if_error` seconds past freshness is served instead
+    of the error. Only `200` responses are stored.
+
+    Each key has a generation that `invalidate()` bumps. A load that began
+    before an invalidation is not stored, so a refresh racing a write
+    cannot put the pre-write response back.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        stale_while_revalidate: float = 60.0,
+        stale_if_error: float = 3600.0,
+        refresh_workers: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=refresh_workers, thread_name_prefix="proxy-cache-refresh"
+        )
+        self._pending: set[Future] = set()
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "stale", "stale_errors", "refreshes", "refresh_failures"), 0
+        )
+
+    def fetch(self, key: str, loader: Loader, ttl: float) -> CacheResult:
+        """Serve `key` from cache when possible, otherwise call `loader`."""
+        now = self._clock()
+        with self._lock:
+            generation = self._generation(key)
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.stale_until:
+                self._entries.move_to_end(key)
+                if now < entry.fresh_until:
+                    self._stats["hits"] += 1
+                    return self._result(entry, HIT, now)
+                self._stats["stale"] += 1
+                refresh, entry.refreshing = not entry.refreshing, True
+                stale = self._result(entry, STALE, now)
+            else:
+                self._stats["misses"] += 1
+                stale = None
+
+        if stale is not None:
+            if refresh:
+                self._schedule_refresh(key, loader, ttl, generation)
+            return stale
+
+        try:
+            response = loader()
+        except BackendClientError:
+            fallback = self._fallback(key, now)
+            if fallback is None:
+                raise
+            return fallback
+
+        if response.status_code >= 500:
+            fallback = self._fallback(key, now)
+            if fallback is not None:
+                return fallback
+        if response.status_code == 200:
+            self.store(key, response, ttl, generation)
+            return CacheResult(response, MISS, 0.0, ttl)
+        return CacheResult(response, BYPASS)
+
+    def peek(self, key: str) -> CacheResult | None:
+        """Return a fresh entry for `key` without loading anything on a miss."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.fresh_until:
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return self._result(entry, HIT, now)
+
+    def store(
+        self,
+        key: str,
+        response: BackendResponse,
+        ttl: float,
+        generation: tuple[int, int] | None = None,
+    ) -> None:
+        """Cache `response`, unless `key` was invalidated since `generation` was read."""
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        now = self._clock()
+        entry = CachedResponse(
+            response=response,
+            stored_at=now,
+            fresh_until=now + ttl,
+            stale_until=now + ttl + self.stale_while_revalidate,
+            error_until=now + ttl + self.stale_if_error,
+        )
+        with self._lock:
+            if generation is not None and generation != self._generation(key):
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def wait_for_refreshes(self, timeout: float | None = None) -> None:
+        """Block until scheduled background refreshes finish."""
+        with self._lock:
+            pending = set(self._pending)
+        wait(pending, timeout=timeout)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def _generation(self, key: str) -> tuple[int, int]:
+        return self._epoch, self._generations.get(key, 0)
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        loader: Loader,
+        ttl: float,
+        generation: tuple[int, int],
+    ) -> None:
+        future = self._executor.submit(self._refresh, key, loader, ttl, generation)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget_future)
+
+    def _forget_future(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def _refresh(
+        self,
+        key: str,
+        loader: Loader,
+        ttl: float,
+        generation: tuple[int, int],
+    ) -> None:
+        try:
+            response = loader()
+        except Exception:
+            # Nothing awaits a background refresh, so any failure just keeps the stale copy
+            response = None
+        if response is not None and response.status_code == 200:
+            self.store(key, response, ttl, generation)
+            with self._lock:
+                self._stats["refreshes"] += 1
+            return
+        with self._lock:
+            self._stats["refresh_failures"] += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                # Let the next stale hit try again
+                entry.refreshing = False
+
+    def _fallback(self, key: str, now: float) -> CacheResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.error_until:
+                return None
+            self._stats["stale_errors"] += 1
+            return self._result(entry, STALE_ERROR, now)
+
+    @staticmethod
+    def _result(entry: CachedResponse, state: str, now: float) -> CacheResult:
+        return CacheResult(
+            response=entry.response,
+            state=state,
+            age=now - entry.stored_at,
+            max_age=max(0.0, entry.fresh_until - now),
+        )
+
+
+__all__ = ["CacheResult", "ResponseCache"]
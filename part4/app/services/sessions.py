@@ -0,0 +1,180 @@
+"""Session resolution for the HBnB Part 4 web client."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+import jwt
+
+from app.services.backend import BackendClient
+
+_INVALID = object()
+# Backend answers that mean the token itself is bad, not that the backend is down
+_REJECTED_STATUSES = frozenset({401, 403, 422})
+
+
+class SessionCache:
+    """Thread-safe LRU of resolved sessions keyed by token digest."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+class SessionVerifier:
+    """Resolve a bearer token to the web client session payload.
+
+    With a verification key configured, the token's signature and expiry are
+    checked locally and `sub`/`is_admin` are read from its claims. Without
+    one, the backend's `/auth/protected` endpoint is asked instead. Either
+    way, results are cached under a SHA-256 digest of the token, never the
+    token itself, for at most `ttl` seconds and never past the token's `exp`.
+    """
+
+    def __init__(
+        self,
+        key: str | None = None,
+        algorithms: tuple[str, ...] = ("HS256",),
+        ttl: float = 60.0,
+        max_entries: int = 1024,
+        leeway: float = 0.0,
+        wall_clock: Callable[[], float] = time.time,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.key = key
+        self.algorithms = list(algorithms)
+        self.ttl = ttl
+        self.leeway = leeway
+        self._wall_clock = wall_clock
+        self.cache = SessionCache(max_entries=max_entries, clock=clock)
+
+    @classmethod
+    def from_config(cls, config) -> "SessionVerifier":
+        algorithms = str(config.get("BACKEND_JWT_ALGORITHMS") or "HS256")
+        return cls(
+            key=config.get("BACKEND_JWT_PUBLIC_KEY") or config.get("BACKEND_JWT_SECRET") or None,
+            algorithms=tuple(name.strip() for name in algorithms.split(",") if name.strip()),
+            ttl=float(config.get("SESSION_CACHE_TTL", 60)),
+            max_entries=int(config.get("SESSION_CACHE_MAX_ENTRIES", 1024)),
+            leeway=float(config.get("BACKEND_JWT_LEEWAY", 0)),
+        )
+
+    @property
+    def verifies_locally(self) -> bool:
+        return self.key is not None
+
+    def session_for(
+        self,
+        token: str | None,
+        client: BackendClient | None,
+    ) -> dict[str, Any] | None:
+        """Return `{"logged_in", "user_id", "is_admin"}` for a valid token, else `None`."""
+        if not token:
+            return None
+
+        digest = _digest(token)
+        cached = self.cache.get(digest)
+        if cached is not None:
+            return None if cached is _INVALID else dict(cached)
+
+        if self.verifies_locally:
+            session, ttl = self._verify_locally(token)
+        else:
+            if client is None:
+                return None
+            session, ttl = self._verify_remotely(token, client)
+
+        self.cache.set(digest, session, ttl)
+        return None if session is _INVALID else dict(session)
+
+    def forget(self, token: str | None) -> None:
+        """Drop a token's cached session, e.g. on logout."""
+        if token:
+            self.cache.discard(_digest(token))
+
+    def stats(self) -> dict[str, Any]:
+        return {"verifies_locally": self.verifies_locally, **self.cache.stats()}
+
+    def _verify_locally(self, token: str) -> tuple[Any, float]:
+        try:
+            claims = jwt.decode(
+                token,
+                self.key,
+                algorithms=self.algorithms,
+                leeway=self.leeway,
+                options={"require": ["sub", "exp"]},
+            )
+        except jwt.InvalidTokenError:
+            return _INVALID, self.ttl
+        if claims.get("type", "access") != "access":
+            return _INVALID, self.ttl
+
+        remaining = float(claims["exp"]) + self.leeway - self._wall_clock()
+        session = {
+            "logged_in": True,
+            "user_id": claims["sub"],
+            "is_admin": bool(claims.get("is_admin", False)),
+        }
+        return session, min(self.ttl, remaining)
+
+    def _verify_remotely(self, token: str, client: BackendClient) -> tuple[Any, float]:
+        response = client.request("GET", "/auth/protected", token=token)
+        if response.status_code != 200:
+            # Only cache definite rejections, a flaky backend should be retried
+            return _INVALID, self.ttl if response.status_code in _REJECTED_STATUSES else 0
+
+        payload = response.payload or {}
+        session = {
+            "logged_in": True,
+            "user_id": payload.get("user_id"),
+            "is_admin": bool(payload.get("is_admin", False)),
+        }
+        return session, self.ttl
+
+
+def _digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+__all__ = ["SessionCache", "SessionVerifier"]
@@ -1,8 +1,7 @@
 import { api } from "./api.js";
-import { flash, getCookie } from "./auth.js";
+import { flash } from "./auth.js";
 
 let currentPlace = null;
-let currentToken = null;
 
 function formatRating(value) {
   if (Number.isInteger(value)) {
@@ -58,7 +57,7 @@ function renderPlace(place) {
   `;
 }
 
-function renderReviews(reviews, usersById = {}) {
+function renderReviews(reviews) {
   const list = document.querySelector("#reviews");
   if (!list) {
     return;
@@ -74,7 +73,7 @@ function renderReviews(reviews, usersById = {}) {
       (review) => `
         <article class="review-card">
           <header>
-            <strong>${usersById[review.user_id] || `User ${review.user_id}`}</strong>
+            <strong>${review.author_name || `User ${review.user_id}`}</strong>
             <span class="rating-badge">${review.rating} / 5</span>
           </header>
           <p>${review.comment}</p>
@@ -84,73 +83,48 @@ function renderReviews(reviews, usersById = {}) {
     .join("");
 }
 
-function updateReviewAccess(place) {
+function updateReviewAccess(viewer) {
   const addReviewSection = document.querySelector("#add-review");
   const note = document.querySelector("#review-form-note");
   if (!addReviewSection || !note) {
     return;
   }
 
-  if (!currentToken) {
+  if (!viewer.logged_in) {
     addReviewSection.hidden = true;
     note.textContent = "Sign in to leave a review.";
     return;
   }
 
-  if (place.owner_id === place.current_user_id) {
+  if (viewer.is_owner) {
     addReviewSection.hidden = true;
     note.textContent = "Owners cannot review their own places.";
     return;
   }
 
+  if (viewer.has_reviewed) {
+    addReviewSection.hidden = true;
+    note.textContent = "You have already reviewed this place.";
+    return;
+  }
+
   addReviewSection.hidden = false;
   note.textContent = "Submit your review below.";
 }
 
-async function resolveReviewUsers(reviews) {
-  const uniqueUserIds = [...new Set(reviews.map((review) => review.user_id))];
-  const usersById = {};
-
-  await Promise.all(
-    uniqueUserIds.map(async (userId) => {
-      try {
-        const user = await api.get(`/api/users/${userId}`);
-        usersById[userId] = `${user.first_name} ${user.last_name}`.trim();
-      } catch (_error) {
-        usersById[userId] = `User ${userId}`;
-      }
-    }),
-  );
-
-  return usersById;
-}
-
 async function fetchPlaceDetails() {
   const placeId = getPlaceIdFromURL();
   if (!placeId) {
     throw new Error("Missing place id in URL");
   }
 
-  currentToken = getCookie("token");
-  const place = await api.get(`/api/places/${placeId}`);
-  const reviews = place.reviews || [];
-  const usersById = await resolveReviewUsers(reviews);
-
-  if (currentToken) {
-    try {
-      const session = await api.get("/api/session");
-      place.current_user_id = session.user_id;
-    } catch (_error) {
-      place.current_user_id = null;
-    }
-  } else {
-    place.current_user_id = null;
-  }
+  // One request returns the place, its reviews with author names and the session state
+  const view = await api.get(`/api/views/place/${encodeURIComponent(placeId)}`);
 
-  currentPlace = place;
-  renderPlace(place);
-  renderReviews(reviews, usersById);
-  updateReviewAccess(place);
+  currentPlace = view.place;
+  renderPlace(view.place);
+  renderReviews(view.reviews);
+  updateReviewAccess(view.viewer);
 }
 
 async function handleReviewSubmit(event) {
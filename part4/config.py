@@ -9,6 +9,43 @@ class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
     BACKEND_API_URL = os.getenv("BACKEND_API_URL", "http://127.0.0.1:8000/api/v1")
     BACKEND_TIMEOUT = float(os.getenv("BACKEND_TIMEOUT", "10"))
+    BACKEND_POOL_SIZE = int(os.getenv("BACKEND_POOL_SIZE", "10"))
+    BACKEND_POOL_IDLE_TIMEOUT = float(os.getenv("BACKEND_POOL_IDLE_TIMEOUT", "30"))
+    BACKEND_COALESCE_GETS = os.getenv("BACKEND_COALESCE_GETS", "true").lower() == "true"
+    BACKEND_BATCH_SIZE = int(os.getenv("BACKEND_BATCH_SIZE", "100"))
+    BACKEND_PAGE_SIZE = int(os.getenv("BACKEND_PAGE_SIZE", "500"))
+    BACKEND_RETRIES = int(os.getenv("BACKEND_RETRIES", "2"))
+    BACKEND_RETRY_BACKOFF = float(os.getenv("BACKEND_RETRY_BACKOFF", "0.1"))
+    BACKEND_RETRY_BACKOFF_MAX = float(os.getenv("BACKEND_RETRY_BACKOFF_MAX", "1"))
+    BACKEND_BREAKER_ENABLED = os.getenv("BACKEND_BREAKER_ENABLED", "true").lower() == "true"
+    BACKEND_BREAKER_FAILURE_RATE = float(os.getenv("BACKEND_BREAKER_FAILURE_RATE", "0.5"))
+    BACKEND_BREAKER_SLOW_CALL_SECONDS = float(
+        os.getenv("BACKEND_BREAKER_SLOW_CALL_SECONDS", "2")
+    )
+    BACKEND_BREAKER_SLOW_CALL_RATE = float(os.getenv("BACKEND_BREAKER_SLOW_CALL_RATE", "0.5"))
+    BACKEND_BREAKER_WINDOW = int(os.getenv("BACKEND_BREAKER_WINDOW", "20"))
+    BACKEND_BREAKER_MINIMUM_CALLS = int(os.getenv("BACKEND_BREAKER_MINIMUM_CALLS", "5"))
+    BACKEND_BREAKER_OPEN_SECONDS = float(os.getenv("BACKEND_BREAKER_OPEN_SECONDS", "30"))
+    BACKEND_BREAKER_HALF_OPEN_PROBES = int(os.getenv("BACKEND_BREAKER_HALF_OPEN_PROBES", "1"))
+    BACKEND_FANOUT_WORKERS = int(os.getenv("BACKEND_FANOUT_WORKERS", "8"))
+    BACKEND_JWT_SECRET = os.getenv("BACKEND_JWT_SECRET")
+    BACKEND_JWT_PUBLIC_KEY = os.getenv("BACKEND_JWT_PUBLIC_KEY")
+    BACKEND_JWT_ALGORITHMS = os.getenv("BACKEND_JWT_ALGORITHMS", "HS256")
+    BACKEND_JWT_LEEWAY = float(os.getenv("BACKEND_JWT_LEEWAY", "0"))
+    SESSION_CACHE_TTL = float(os.getenv("SESSION_CACHE_TTL", "60"))
+    SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "1024"))
+    PROXY_CACHE_ENABLED = os.getenv("PROXY_CACHE_ENABLED", "true").lower() == "true"
+    PROXY_CACHE_MAX_ENTRIES = int(os.getenv("PROXY_CACHE_MAX_ENTRIES", "512"))
+    PROXY_CACHE_STALE_WHILE_REVALIDATE = float(
+        os.getenv("PROXY_CACHE_STALE_WHILE_REVALIDATE", "60")
+    )
+    PROXY_CACHE_STALE_IF_ERROR = float(os.getenv("PROXY_CACHE_STALE_IF_ERROR", "3600"))
+    PROXY_CACHE_TTL_PLACES = float(os.getenv("PROXY_CACHE_TTL_PLACES", "30"))
+    PROXY_CACHE_TTL_PLACE = float(os.getenv("PROXY_CACHE_TTL_PLACE", "30"))
+    PROXY_CACHE_TTL_AMENITIES = float(os.getenv("PROXY_CACHE_TTL_AMENITIES", "300"))
+    PROXY_CACHE_TTL_USER = float(os.getenv("PROXY_CACHE_TTL_USER", "120"))
+    PROXY_MAX_BATCH_IDS = int(os.getenv("PROXY_MAX_BATCH_IDS", "500"))
+    PROXY_MAX_LIST_PAGES = int(os.getenv("PROXY_MAX_LIST_PAGES", "20"))
     TESTING = False
     DEBUG = False
 
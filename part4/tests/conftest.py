@@ -11,6 +11,46 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from app import create_app
 from app.services.backend import BackendResponse
+from config import TestingConfig
+
+JWT_SECRET = "part4-test-secret"
+
+# Records served by the backend's `?ids=` batch lookups, keyed by list path
+BATCH_RECORDS = {
+    "/users/": {
+        user["id"]: user
+        for user in (
+            {
+                "id": "user-2",
+                "first_name": "Casey",
+                "last_name": "Ray",
+                "email": "casey@example.com",
+                "is_admin": False,
+            },
+            {
+                "id": "user-3",
+                "first_name": "Noor",
+                "last_name": "Vidal",
+                "email": "noor@example.com",
+                "is_admin": False,
+            },
+        )
+    },
+    "/places/": {
+        "place-1": {"id": "place-1", "name": "Coastal Loft", "price": 120.0},
+        "place-2": {"id": "place-2", "name": "Sunset Pool House", "price": 210.0},
+    },
+    "/amenities/": {"a1": {"id": "a1", "name": "WiFi"}, "a2": {"id": "a2", "name": "Pool"}},
+    "/reviews/": {
+        "review-1": {
+            "id": "review-1",
+            "rating": 5,
+            "comment": "Excellent stay",
+            "user_id": "user-2",
+            "place_id": "place-1",
+        }
+    },
+}
 
 
 class FakeBackendClient:
@@ -57,6 +97,13 @@ class FakeBackendClient:
                 },
             )
 
+        if method == "GET" and path in BATCH_RECORDS and params and "ids" in params:
+            records = BATCH_RECORDS[path]
+            return BackendResponse(
+                200,
+                [records[item] for item in params["ids"].split(",") if item in records],
+            )
+
         if method == "GET" and path == "/places/":
             return BackendResponse(
                 200,
@@ -116,10 +163,14 @@ class FakeBackendClient:
             )
 
         if method == "GET" and path == "/amenities/":
-            return BackendResponse(
-                200,
-                [{"id": "a1", "name": "WiFi"}, {"id": "a2", "name": "Pool"}],
-            )
+            amenities = [{"id": "a1", "name": "WiFi"}, {"id": "a2", "name": "Pool"}]
+            if not params or "limit" not in params:
+                return BackendResponse(200, amenities)
+            # Cursor pagination like Part 3, with the offset as the cursor
+            start = int(params.get("cursor", 0))
+            end = start + int(params["limit"])
+            next_cursor = str(end) if end < len(amenities) else None
+            return BackendResponse(200, amenities[start:end], next_cursor=next_cursor)
 
         if method == "GET" and path == "/users/user-2":
             return BackendResponse(
@@ -163,13 +214,45 @@ class FakeBackendClient:
         return BackendResponse(404, {"message": "Not found"})
 
 
-@pytest.fixture
-def app():
-    app = create_app("testing")
+class FakeAsyncBackendClient:
+    """Answers `request_many` batches from the app's fake backend client."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self.batches: list[list[object]] = []
+
+    def request_many(self, *calls):
+        self.batches.append(list(calls))
+        backend = self.app.extensions["backend_client"]
+        return [
+            backend.request(
+                call.method,
+                call.path,
+                token=call.token,
+                json=call.json,
+                params=call.params,
+            )
+            for call in calls
+        ]
+
+
+def _install_fakes(app):
     app.extensions["backend_client"] = FakeBackendClient()
+    app.extensions["async_backend_client"] = FakeAsyncBackendClient(app)
     return app
 
 
+@pytest.fixture
+def app():
+    return _install_fakes(create_app("testing"))
+
+
 @pytest.fixture
 def client(app):
     return app.test_client()
+
+
+@pytest.fixture
+def jwt_app():
+    config = type("LocalJWTTestingConfig", (TestingConfig,), {"BACKEND_JWT_SECRET": JWT_SECRET})
+    return _install_fakes(create_app(config))
@@ -63,6 +63,28 @@ def test_public_places_are_proxied(client):
     ]
 
 
+def test_public_listings_follow_the_backend_cursor(app, client):
+    app.config["BACKEND_PAGE_SIZE"] = 1
+
+    response = client.get("/api/amenities")
+
+    assert response.get_json() == [{"id": "a1", "name": "WiFi"}, {"id": "a2", "name": "Pool"}]
+    assert [
+        call["params"]
+        for call in app.extensions["backend_client"].calls
+        if call["path"] == "/amenities/"
+    ] == [{"limit": 1}, {"limit": 1, "cursor": "1"}]
+
+
+def test_public_listings_stop_after_the_page_bound(app, client):
+    app.config["BACKEND_PAGE_SIZE"] = 1
+    app.config["PROXY_MAX_LIST_PAGES"] = 1
+
+    response = client.get("/api/amenities")
+
+    assert response.get_json() == [{"id": "a1", "name": "WiFi"}]
+
+
 def test_public_user_detail_is_proxied(client):
     response = client.get("/api/users/user-2")
 
@@ -0,0 +1,219 @@
+"""Tests for the asyncio backend client and its concurrent fan-out."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app import create_app
+from app.services.async_backend import AsyncBackendClient, BackendCall
+from app.services.backend import BackendClientError, BackendUnavailableError
+from app.services.circuit_breaker import CircuitBreaker
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.peers.add(self.client_address)
+        self.server.hits.append(self.path)
+        if self.path.startswith("/api/v1/hangup"):
+            self.close_connection = True
+            return
+        if self.path.startswith("/api/v1/slow"):
+            time.sleep(0.3)
+        if self.path.startswith("/api/v1/flaky") and self.server.failures > 0:
+            self.server.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(
+            {"path": self.path, "authorization": self.headers.get("Authorization")}
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if self.path.startswith("/api/v1/chunked"):
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for part in (body[:10], body[10:]):
+                self.wfile.write(f"{len(part):x}\r\n".encode("ascii") + part + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.server.hits.append(self.path)
+        payload = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path.startswith("/api/v1/hangup"):
+            # Take the request, then hang up before answering
+            self.close_connection = True
+            return
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        return None
+
+
+@pytest.fixture
+def backend_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.peers = set()
+    server.hits = []
+    server.failures = 0
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def async_client(backend_server):
+    host, port = backend_server.server_address
+    client = AsyncBackendClient(f"http://{host}:{port}/api/v1", timeout=2.0)
+    yield client
+    client.close()
+
+
+def test_responses_match_the_blocking_client_contract(async_client):
+    listing, created, chunked = async_client.request_many(
+        BackendCall("GET", "/places/", token="abc", params={"limit": 2}),
+        BackendCall("POST", "/reviews/", json={"rating": 5}),
+        BackendCall("GET", "/chunked"),
+    )
+
+    assert listing.status_code == 200
+    assert listing.payload == {"path": "/api/v1/places/?limit=2", "authorization": "Bearer abc"}
+    assert created.status_code == 201
+    assert created.payload == {"rating": 5}
+    assert chunked.payload == {"path": "/api/v1/chunked", "authorization": None}
+
+
+def test_calls_run_concurrently_and_reuse_pooled_connections(async_client, backend_server):
+    started = time.perf_counter()
+    results = async_client.request_many(*(BackendCall("GET", f"/slow/{n}") for n in range(3)))
+    elapsed = time.perf_counter() - started
+    async_client.request_many(*(BackendCall("GET", f"/fast/{n}") for n in range(3)))
+
+    # Three 0.3s calls take about as long as one
+    assert elapsed < 0.6
+    assert [result.payload["path"] for result in results] == [
+        "/api/v1/slow/0",
+        "/api/v1/slow/1",
+        "/api/v1/slow/2",
+    ]
+    stats = next(iter(async_client.pool_stats().values()))
+    assert stats["created"] == 3
+    assert stats["reused"] == 3
+    assert len(backend_server.peers) == 3
+
+
+def test_per_call_timeouts_fail_only_the_slow_call(async_client):
+    slow, fast = async_client.request_many(
+        BackendCall("GET", "/slow/1", timeout=0.05),
+        BackendCall("GET", "/fast/1"),
+    )
+    # The timed out stream was dropped, the pool still serves new calls
+    (after,) = async_client.request_many(BackendCall("GET", "/fast/2"))
+
+    assert isinstance(slow, BackendClientError)
+    assert "Timed out" in str(slow)
+    assert fast.status_code == 200
+    assert after.status_code == 200
+    stats = next(iter(async_client.pool_stats().values()))
+    assert stats["open"] == stats["idle"]
+
+
+def test_unreachable_backend_yields_client_errors():
+    client = AsyncBackendClient("http://127.0.0.1:9/api/v1", timeout=1.0)
+    try:
+        (result,) = client.request_many(BackendCall("GET", "/places/"))
+    finally:
+        client.close()
+
+    assert isinstance(result, BackendClientError)
+
+
+def test_idempotent_calls_retry_transient_failures(backend_server):
+    host, port = backend_server.server_address
+    client = AsyncBackendClient(
+        f"http://{host}:{port}/api/v1", timeout=2.0, retries=2, retry_backoff=0.01
+    )
+    backend_server.failures = 2
+    try:
+        (result,) = client.request_many(BackendCall("GET", "/flaky/1"))
+    finally:
+        client.close()
+
+    assert result.status_code == 200
+    assert client.resilience_stats()["retries"] == 2
+
+
+def test_reused_stream_failures_resend_only_safe_calls_once(async_client, backend_server):
+    results = [
+        async_client.request_many(call)[0]
+        for call in (
+            BackendCall("GET", "/places/"),
+            BackendCall("POST", "/hangup", json={"comment": "Great"}),
+            BackendCall("GET", "/places/"),
+            BackendCall("GET", "/hangup"),
+        )
+    ]
+
+    assert [isinstance(result, BackendClientError) for result in results] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert backend_server.hits == [
+        "/api/v1/places/",
+        "/api/v1/hangup",
+        "/api/v1/places/",
+        "/api/v1/hangup",
+        "/api/v1/hangup",
+    ]
+
+
+def test_open_breaker_fails_calls_fast(backend_server):
+    host, port = backend_server.server_address
+    client = AsyncBackendClient(
+        f"http://{host}:{port}/api/v1",
+        timeout=2.0,
+        breaker_factory=lambda endpoint: CircuitBreaker(endpoint, window=2, minimum_calls=2),
+    )
+    backend_server.failures = 2
+    try:
+        failures = client.request_many(*(BackendCall("GET", f"/flaky/{n}") for n in range(2)))
+        (rejected,) = client.request_many(BackendCall("GET", "/flaky/3"))
+    finally:
+        client.close()
+
+    assert [response.status_code for response in failures] == [503, 503]
+    assert isinstance(rejected, BackendUnavailableError)
+    assert rejected.retry_after == 30
+    assert client.resilience_stats()["breakers"]["/flaky"]["state"] == "open"
+
+
+def test_app_clients_share_one_breaker_per_endpoint():
+    app = create_app("testing")
+    try:
+        sync_client = app.extensions["backend_client"]
+        async_client = app.extensions["async_backend_client"]
+
+        assert async_client._breaker_for("/users") is sync_client.breaker_for("/users")
+        assert async_client.retries == sync_client.retries
+    finally:
+        app.extensions["async_backend_client"].close()
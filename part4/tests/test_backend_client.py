@@ -0,0 +1,268 @@
+"""Connection pooling tests for the Part 4 backend client."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.backend import (
+    BackendClient,
+    BackendClientError,
+    BackendUnavailableError,
+    ConnectionPool,
+)
+from app.services.circuit_breaker import CircuitBreaker
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.peers.add(self.client_address)
+        self.server.hits.append(self.path)
+        if self.path.startswith("/api/v1/hangup"):
+            self.close_connection = True
+            return
+        if self.path.startswith("/api/v1/flaky") and self.server.failures:
+            self.server.failures -= 1
+            self._unavailable()
+            return
+        if self.path.startswith("/api/v1/slow"):
+            time.sleep(0.3)
+        body = json.dumps(
+            {"path": self.path, "authorization": self.headers.get("Authorization")}
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path.startswith("/api/v1/drop"):
+            # Advertise keep-alive but hang up, like a server closing an idle socket
+            self.close_connection = True
+
+    def do_POST(self):
+        self.server.peers.add(self.client_address)
+        self.server.hits.append(self.path)
+        if self.path.startswith("/api/v1/hangup"):
+            # Take the request, then hang up before answering
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.close_connection = True
+            return
+        if self.path.startswith("/api/v1/flaky"):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self._unavailable()
+            return
+        payload = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _unavailable(self):
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        return None
+
+
+@pytest.fixture
+def backend_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.peers = set()
+    server.hits = []
+    server.failures = 0
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, **kwargs) -> BackendClient:
+    host, port = server.server_address
+    return BackendClient(f"http://{host}:{port}/api/v1", timeout=2.0, **kwargs)
+
+
+def test_requests_reuse_one_keep_alive_connection(backend_server):
+    client = _client(backend_server)
+
+    first = client.request("GET", "/places/", params={"limit": 2}, token="abc")
+    second = client.request("POST", "/reviews/", json={"rating": 5})
+
+    assert first.status_code == 200
+    assert first.payload == {"path": "/api/v1/places/?limit=2", "authorization": "Bearer abc"}
+    assert second.status_code == 201
+    assert second.payload == {"rating": 5}
+    assert len(backend_server.peers) == 1
+    stats = next(iter(client.pool_stats().values()))
+    assert stats["created"] == 1
+    assert stats["reused"] == 1
+    assert stats["idle"] == 1
+
+
+def test_stale_connection_is_replaced_transparently(backend_server):
+    client = _client(backend_server)
+
+    client.request("GET", "/drop")
+    response = client.request("GET", "/places/")
+
+    assert response.status_code == 200
+    assert len(backend_server.peers) == 2
+    assert next(iter(client.pool_stats().values()))["reconnects"] == 1
+
+
+def test_reused_connection_failures_resend_only_safe_requests_once(backend_server):
+    client = _client(backend_server, retries=0)
+
+    client.request("GET", "/places/")
+    with pytest.raises(BackendClientError):
+        client.request("POST", "/hangup", json={"comment": "Great"})
+    client.request("GET", "/places/")
+    with pytest.raises(BackendClientError):
+        client.request("GET", "/hangup")
+
+    assert backend_server.hits == [
+        "/api/v1/places/",
+        "/api/v1/hangup",
+        "/api/v1/places/",
+        "/api/v1/hangup",
+        "/api/v1/hangup",
+    ]
+
+
+def test_concurrent_requests_never_exceed_the_pool_size(backend_server):
+    client = _client(backend_server, pool_size=2)
+    results = []
+
+    def work():
+        for _ in range(10):
+            results.append(client.request("GET", "/places/").status_code)
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [200] * 60
+    assert len(backend_server.peers) <= 2
+    stats = next(iter(client.pool_stats().values()))
+    assert stats["open"] <= 2
+    assert stats["in_use"] == 0
+
+
+def test_idle_connections_are_evicted_and_waiters_time_out():
+    now = [0.0]
+    pool = ConnectionPool("http", "127.0.0.1", 9, timeout=0, max_size=1, clock=lambda: now[0])
+    pool.idle_timeout = 5
+
+    connection, reused = pool.acquire()
+    assert reused is False
+    with pytest.raises(BackendClientError):
+        pool.acquire()
+
+    pool.release(connection)
+    now[0] += 6
+    _, reused = pool.acquire()
+
+    assert reused is False
+    assert pool.stats()["idle_evictions"] == 1
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_unreachable_backend_raises_client_error(backend_server):
+    client = _client(backend_server)
+    backend_server.shutdown()
+    backend_server.server_close()
+
+    with pytest.raises(BackendClientError):
+        client.request("GET", "/places/")
+    assert next(iter(client.pool_stats().values()))["open"] == 0
+
+
+def test_concurrent_identical_gets_share_one_upstream_call(backend_server):
+    client = _client(backend_server)
+    start = threading.Barrier(8)
+    results = []
+
+    def fetch(token):
+        start.wait()
+        results.append(client.request("GET", "/slow", params={"page": 1}, token=token))
+
+    tokens = [None] * 6 + ["abc", "abc"]
+    threads = [threading.Thread(target=fetch, args=(token,)) for token in tokens]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert {response.status_code for response in results} == {200}
+    # One call per authorization scope
+    assert backend_server.hits == ["/api/v1/slow?page=1"] * 2
+    stats = client.coalescing_stats()
+    assert stats["calls"] == 2
+    assert stats["coalesced"] == 6
+    assert stats["in_flight"] == 0
+
+
+def test_writes_are_never_coalesced(backend_server):
+    client = _client(backend_server)
+
+    client.request("POST", "/reviews/", json={"rating": 5})
+    client.request("POST", "/reviews/", json={"rating": 5})
+
+    assert client.coalescing_stats()["calls"] == 0
+
+
+def test_idempotent_gets_are_retried_but_writes_are_not(backend_server):
+    client = _client(backend_server, retries=2, retry_backoff=0.001)
+    backend_server.failures = 2
+
+    recovered = client.request("GET", "/flaky/places")
+    rejected = client.request("POST", "/flaky/reviews", json={"rating": 5})
+
+    assert recovered.status_code == 200
+    assert rejected.status_code == 503
+    assert backend_server.hits == ["/api/v1/flaky/places"] * 3 + ["/api/v1/flaky/reviews"]
+    assert client.resilience_stats()["retries"] == 2
+
+
+def test_coalesced_waiters_outlast_the_retry_budget():
+    client = BackendClient(
+        "http://backend.test/api/v1", timeout=2.0, retries=2, retry_backoff_max=0.5
+    )
+    explicit = BackendClient("http://backend.test/api/v1", timeout=2.0, coalesce_timeout=1.0)
+
+    assert client.coalesce_timeout == 3 * 2.0 + 2 * 0.5
+    assert explicit.coalesce_timeout == 1.0
+
+
+def test_open_breaker_fails_fast_per_endpoint(backend_server):
+    def breaker(endpoint):
+        return CircuitBreaker(endpoint, window=2, minimum_calls=2, open_seconds=60)
+
+    client = _client(backend_server, breaker_factory=breaker)
+    backend_server.failures = 2
+    client.request("GET", "/flaky")
+    client.request("GET", "/flaky")
+
+    with pytest.raises(BackendUnavailableError) as excinfo:
+        client.request("GET", "/flaky")
+    other = client.request("GET", "/places/")
+
+    assert excinfo.value.retry_after == 60
+    assert backend_server.hits == ["/api/v1/flaky", "/api/v1/flaky", "/api/v1/places/"]
+    assert other.status_code == 200
+    breakers = client.resilience_stats()["breakers"]
+    assert breakers["/flaky"]["state"] == "open"
+    assert breakers["/places"]["state"] == "closed"
@@ -0,0 +1,76 @@
+"""Tests for the Part 4 `?ids=` batch proxy routes."""
+
+from __future__ import annotations
+
+
+def _batch_calls(app, path):
+    return [
+        call
+        for call in app.extensions["backend_client"].calls
+        if call["path"] == path and call["params"]
+    ]
+
+
+def test_user_batch_resolves_all_ids_with_one_backend_call(app, client):
+    response = client.get("/api/users?ids=user-3,user-2,missing,user-3")
+
+    assert response.status_code == 200
+    assert [user["first_name"] for user in response.get_json()] == ["Noor", "Casey"]
+    assert _batch_calls(app, "/users/") == [
+        {
+            "method": "GET",
+            "path": "/users/",
+            "token": None,
+            "json": None,
+            "params": {"ids": "user-3,user-2,missing"},
+        }
+    ]
+    assert response.headers["X-Cache"] == "MISS"
+    assert client.get("/api/users?ids=user-3,user-2,missing").headers["X-Cache"] == "HIT"
+    assert len(_batch_calls(app, "/users/")) == 1
+
+
+def test_batches_are_split_into_backend_sized_chunks(app, client):
+    app.config["BACKEND_BATCH_SIZE"] = 1
+
+    response = client.get("/api/users?ids=user-2,user-3")
+
+    assert [user["id"] for user in response.get_json()] == ["user-2", "user-3"]
+    assert [call["params"] for call in _batch_calls(app, "/users/")] == [
+        {"ids": "user-2"},
+        {"ids": "user-3"},
+    ]
+    # Both chunks went out together as one concurrent batch
+    assert len(app.extensions["async_backend_client"].batches) == 1
+
+    cached = client.get("/api/users?ids=user-2")
+    again = client.get("/api/users?ids=user-2,user-3")
+
+    assert cached.headers["X-Cache"] == "HIT"
+    assert [user["id"] for user in again.get_json()] == ["user-2", "user-3"]
+    assert len(_batch_calls(app, "/users/")) == 2
+
+
+def test_place_amenity_and_review_batches_are_proxied(app, client):
+    places = client.get("/api/places?ids=place-2,place-1")
+    amenities = client.get("/api/amenities?ids=a2")
+    reviews = client.get("/api/reviews?ids=review-1")
+
+    assert [place["id"] for place in places.get_json()] == ["place-2", "place-1"]
+    assert places.get_json()[0]["image_url"] == "/static/images/sunset_pool_house.jpg"
+    assert "X-Cache" not in places.headers
+    assert amenities.get_json() == [{"id": "a2", "name": "Pool"}]
+    assert reviews.get_json()[0]["user_id"] == "user-2"
+    # The plain listings still work without ids
+    assert client.get("/api/amenities").get_json()[1]["name"] == "Pool"
+
+
+def test_batch_routes_validate_ids(app, client):
+    app.config["PROXY_MAX_BATCH_IDS"] = 2
+
+    assert client.get("/api/users").status_code == 400
+    assert client.get("/api/reviews?ids=,").status_code == 400
+    too_many = client.get("/api/users?ids=a,b,c")
+    assert too_many.status_code == 400
+    assert too_many.get_json() == {"message": "ids accepts at most 2 ids"}
+    assert _batch_calls(app, "/users/") == []
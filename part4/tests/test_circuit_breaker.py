@@ -0,0 +1,99 @@
+"""Circuit breaker state machine tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock, **kwargs) -> CircuitBreaker:
+    options = {
+        "failure_rate": 0.5,
+        "slow_call_seconds": 1.0,
+        "slow_call_rate": 0.5,
+        "window": 4,
+        "minimum_calls": 4,
+        "open_seconds": 10.0,
+        "clock": clock,
+    }
+    return CircuitBreaker("/places", **{**options, **kwargs})
+
+
+def test_opens_once_the_failure_rate_is_reached_over_enough_calls():
+    breaker = _breaker(_Clock())
+
+    for succeeded in (False, False, True):
+        breaker.before_call()
+        breaker.record(succeeded, 0.01)
+    assert breaker.state == CLOSED
+
+    breaker.before_call()
+    breaker.record(True, 0.01)
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_call()
+    assert excinfo.value.retry_after == 10
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_slow_successes_also_open_the_breaker():
+    breaker = _breaker(_Clock())
+
+    for duration in (1.5, 0.1, 2.0, 0.1):
+        breaker.before_call()
+        breaker.record(True, duration)
+
+    assert breaker.state == OPEN
+
+
+def test_half_open_admits_limited_probes_and_closes_on_success():
+    clock = _Clock()
+    breaker = _breaker(clock, half_open_probes=2)
+    for _ in range(4):
+        breaker.record(False, 0.01)
+    clock.now += 10
+
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(True, 0.01)
+    assert breaker.state == HALF_OPEN
+    breaker.record(True, 0.01)
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_failed_or_slow_probe_reopens_for_a_full_period():
+    clock = _Clock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record(False, 0.01)
+    clock.now += 10
+    breaker.before_call()
+
+    breaker.record(True, 5.0)
+
+    assert breaker.state == OPEN
+    clock.now += 9
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.stats()["opened"] == 2
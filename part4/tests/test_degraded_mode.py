@@ -0,0 +1,77 @@
+"""Degraded-mode tests for Part 4 routes while the backend circuit is open."""
+
+from __future__ import annotations
+
+from app.services.backend import BackendUnavailableError
+from app.services.response_cache import ResponseCache
+from conftest import FakeBackendClient
+
+
+class _OpenCircuitBackendClient(FakeBackendClient):
+    def request(self, method, path, **kwargs):
+        self.calls.append({"method": method, "path": path, **kwargs})
+        raise BackendUnavailableError("/" + path.strip("/").split("/")[0], 30)
+
+
+def _open_circuit(app) -> None:
+    app.extensions["backend_client"] = _OpenCircuitBackendClient()
+
+
+def test_public_listings_fall_back_to_demo_data(app, client):
+    _open_circuit(app)
+
+    places = client.get("/api/places")
+    amenities = client.get("/api/amenities")
+
+    assert places.status_code == 200
+    assert places.headers["X-Backend-Fallback"] == "demo"
+    assert places.headers["Cache-Control"] == "no-store"
+    assert places.get_json()[0]["id"] == "demo-place-1"
+    assert all(place["is_demo"] for place in places.get_json())
+    names = [amenity["name"] for amenity in amenities.get_json()]
+    assert names == sorted(names)
+    assert "WiFi" in names
+
+
+def test_demo_place_page_view_resolves_demo_authors(app, client):
+    _open_circuit(app)
+    client.set_cookie("token", "token-123")
+
+    response = client.get("/api/views/place/demo-place-1")
+
+    assert response.status_code == 200
+    view = response.get_json()
+    assert view["place"]["name"] == "Canopy Loft Retreat"
+    assert view["reviews"][0]["author_name"] == "Nina Hart"
+    assert view["viewer"]["can_review"] is False
+
+
+def test_last_known_good_cache_is_preferred_over_demo_data(app, client):
+    now = [1000.0]
+    app.extensions["response_cache"] = ResponseCache(stale_if_error=600, clock=lambda: now[0])
+    client.get("/api/places")
+    _open_circuit(app)
+    now[0] += 120
+
+    response = client.get("/api/places")
+
+    assert response.headers["X-Cache"] == "STALE-ERROR"
+    assert response.get_json()[0]["id"] == "place-1"
+    assert "X-Backend-Fallback" not in response.headers
+
+
+def test_routes_without_fallback_fail_fast_with_retry_after(app, client):
+    _open_circuit(app)
+
+    unknown = client.get("/api/places/not-a-demo-place")
+    batch = client.get("/api/places?ids=place-1")
+    home = client.get("/")
+    client.set_cookie("token", "token-admin")
+    admin_page = client.get("/admin/users")
+
+    assert unknown.status_code == 503
+    assert unknown.headers["Retry-After"] == "30"
+    assert batch.status_code == 503
+    assert home.status_code == 200
+    # The session cannot be checked, so the guarded page redirects instead of erroring
+    assert admin_page.status_code == 302
@@ -0,0 +1,109 @@
+"""Tests for the aggregated place page view route."""
+
+from __future__ import annotations
+
+import threading
+
+from app.services.backend import BackendClientError
+from conftest import FakeBackendClient
+
+
+def _backend_calls(app, path: str) -> int:
+    return sum(1 for call in app.extensions["backend_client"].calls if call["path"] == path)
+
+
+class _RendezvousBackendClient(FakeBackendClient):
+    """Blocks the place and session calls until both are in flight at once."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.barrier = threading.Barrier(2, timeout=2)
+
+    def request(self, method, path, **kwargs):
+        if path in {"/places/place-1", "/auth/protected"}:
+            self.barrier.wait()
+        return super().request(method, path, **kwargs)
+
+
+def test_anonymous_view_combines_place_reviews_and_authors(app, client):
+    first = client.get("/api/views/place/place-1")
+    second = client.get("/api/views/place/place-1")
+
+    assert first.status_code == 200
+    view = first.get_json()
+    assert view["place"]["name"] == "Coastal Loft"
+    assert view["place"]["amenities"] == [{"id": "a1", "name": "WiFi"}]
+    assert "reviews" not in view["place"]
+    assert view["reviews"][0]["author_name"] == "Casey Ray"
+    assert view["viewer"]["logged_in"] is False
+    assert view["viewer"]["can_review"] is False
+    assert first.headers["X-Cache"] == "MISS"
+    assert first.headers["Cache-Control"].startswith("public")
+    assert "Cookie" in first.headers["Vary"]
+    assert second.headers["X-Cache"] == "HIT"
+    assert _backend_calls(app, "/places/place-1") == 1
+    assert _backend_calls(app, "/users/") == 1
+
+
+def test_authenticated_view_shares_the_cache_but_stays_private(app, client):
+    client.get("/api/views/place/place-1")
+    client.set_cookie("token", "token-123")
+
+    response = client.get("/api/views/place/place-1")
+
+    assert response.headers["X-Cache"] == "HIT"
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert response.get_json()["viewer"] == {
+        "logged_in": True,
+        "user_id": "user-1",
+        "is_admin": False,
+        "is_owner": False,
+        "has_reviewed": False,
+        "can_review": True,
+    }
+
+
+def test_place_and_session_are_fetched_concurrently(app):
+    app.extensions["backend_client"] = _RendezvousBackendClient()
+    client = app.test_client()
+    client.set_cookie("token", "token-123")
+
+    # Each call waits for the other, so running them back to back would time out
+    response = client.get("/api/views/place/place-1")
+
+    assert response.status_code == 200
+    assert response.get_json()["viewer"]["user_id"] == "user-1"
+
+
+def test_missing_places_are_not_cached_and_reviews_evict_the_view(app, client):
+    missing = client.get("/api/views/place/unknown")
+    client.get("/api/views/place/unknown")
+    client.get("/api/views/place/place-1")
+    client.set_cookie("token", "token-123")
+    client.post("/api/reviews", json={"place_id": "place-1", "rating": 4, "comment": "Nice"})
+    after = client.get("/api/views/place/place-1")
+
+    assert missing.status_code == 404
+    assert _backend_calls(app, "/places/unknown") == 2
+    assert after.headers["X-Cache"] == "MISS"
+    assert _backend_calls(app, "/places/place-1") == 2
+
+
+class _SessionFailingBackendClient(FakeBackendClient):
+    def request(self, method, path, **kwargs):
+        if path == "/auth/protected":
+            self.calls.append({"method": method, "path": path, **kwargs})
+            raise BackendClientError("Failed to reach backend")
+        return super().request(method, path, **kwargs)
+
+
+def test_unverifiable_session_falls_back_to_the_anonymous_viewer(app, client):
+    app.extensions["backend_client"] = _SessionFailingBackendClient()
+    client.set_cookie("token", "token-123")
+
+    response = client.get("/api/views/place/place-1")
+
+    assert response.status_code == 200
+    assert response.get_json()["place"]["name"] == "Coastal Loft"
+    assert response.get_json()["viewer"]["logged_in"] is False
+    assert response.get_json()["viewer"]["can_review"] is False
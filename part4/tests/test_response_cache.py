@@ -0,0 +1,148 @@
+"""Response cache tests for the Part 4 public proxy routes."""
+
+from __future__ import annotations
+
+import threading
+
+from app.services.backend import BackendClientError, BackendResponse
+from app.services.response_cache import ResponseCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _backend_calls(app, path: str) -> int:
+    return sum(1 for call in app.extensions["backend_client"].calls if call["path"] == path)
+
+
+def _install_cache(app, clock: _Clock) -> ResponseCache:
+    cache = ResponseCache(stale_while_revalidate=60, stale_if_error=600, clock=clock)
+    app.extensions["response_cache"] = cache
+    return cache
+
+
+def test_public_routes_are_served_from_cache_with_cache_control(app, client):
+    first = client.get("/api/places")
+    second = client.get("/api/places")
+    client.get("/api/amenities")
+    client.get("/api/amenities")
+    client.get("/api/users/user-2")
+    client.get("/api/users/user-2")
+
+    assert first.get_json() == second.get_json()
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.headers["Cache-Control"] == (
+        "public, max-age=29, stale-while-revalidate=60, stale-if-error=3600"
+    )
+    assert _backend_calls(app, "/places/") == 1
+    assert _backend_calls(app, "/amenities/") == 1
+    assert _backend_calls(app, "/users/user-2") == 1
+
+
+def test_expired_entries_are_served_stale_while_one_refresh_runs(app, client):
+    clock = _Clock()
+    cache = _install_cache(app, clock)
+    backend = app.extensions["backend_client"]
+    client.get("/api/places/place-1")
+
+    release = threading.Event()
+    fetch = backend.request
+
+    def slow_request(method, path, **kwargs):
+        release.wait(timeout=2)
+        return fetch(method, path, **kwargs)
+
+    backend.request = slow_request
+    clock.now += 31
+    stale = [client.get("/api/places/place-1") for _ in range(3)]
+    release.set()
+    cache.wait_for_refreshes(timeout=2)
+    fresh = client.get("/api/places/place-1")
+
+    assert [response.headers["X-Cache"] for response in stale] == ["STALE"] * 3
+    assert all(
+        response.headers["Cache-Control"].startswith("public, max-age=0,") for response in stale
+    )
+    assert stale[0].get_json()["name"] == "Coastal Loft"
+    assert fresh.headers["X-Cache"] == "HIT"
+    assert _backend_calls(app, "/places/place-1") == 2
+    assert cache.stats()["refreshes"] == 1
+
+
+def test_backend_failures_fall_back_to_stale_entries(app, client):
+    clock = _Clock()
+    _install_cache(app, clock)
+    backend = app.extensions["backend_client"]
+    client.get("/api/amenities")
+
+    def unavailable(*args, **kwargs):
+        raise BackendClientError("Failed to reach backend")
+
+    backend.request = unavailable
+    clock.now += 400
+    fallback = client.get("/api/amenities")
+    missing = client.get("/api/users/user-2")
+    clock.now += 600
+    expired = client.get("/api/amenities")
+
+    assert fallback.status_code == 200
+    assert fallback.headers["X-Cache"] == "STALE-ERROR"
+    assert fallback.get_json() == [{"id": "a1", "name": "WiFi"}, {"id": "a2", "name": "Pool"}]
+    assert missing.status_code == 502
+    assert expired.status_code == 502
+
+
+def test_errors_are_not_cached_and_reviews_invalidate_their_place(app, client):
+    client.get("/api/places/unknown")
+    client.get("/api/places/unknown")
+    client.get("/api/places/place-1")
+    client.set_cookie("token", "token-123")
+    client.post("/api/reviews", json={"place_id": "place-1", "rating": 4, "comment": "Nice"})
+    after = client.get("/api/places/place-1")
+
+    assert _backend_calls(app, "/places/unknown") == 2
+    assert after.headers["X-Cache"] == "MISS"
+    assert _backend_calls(app, "/places/place-1") == 2
+
+
+def test_cache_is_bounded_and_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.store(key, BackendResponse(200, key), ttl=60)
+    cache.fetch("a", lambda: BackendResponse(200, "reloaded"), ttl=60)
+    cache.store("c", BackendResponse(200, "c"), ttl=60)
+
+    assert cache.fetch("a", lambda: BackendResponse(200, "reloaded"), ttl=60).state == "HIT"
+    assert cache.fetch("b", lambda: BackendResponse(200, "reloaded"), ttl=60).state == "MISS"
+    assert cache.stats()["entries"] == 2
+
+
+def test_refresh_started_before_an_invalidation_is_not_stored():
+    clock = _Clock()
+    cache = ResponseCache(stale_while_revalidate=60, clock=clock)
+    cache.store("places", BackendResponse(200, ["old"]), ttl=30)
+    clock.now += 31
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_loader():
+        loading.set()
+        release.wait(5)
+        return BackendResponse(200, ["before the write"])
+
+    assert cache.fetch("places", slow_loader, ttl=30).state == "STALE"
+    assert loading.wait(5)
+    # A write lands while the refresh is still loading the pre-write listing
+    cache.invalidate("places")
+    release.set()
+    cache.wait_for_refreshes(timeout=5)
+
+    assert cache.peek("places") is None
+    fresh = cache.fetch("places", lambda: BackendResponse(200, ["after the write"]), ttl=30)
+    assert (fresh.state, fresh.response.payload) == ("MISS", ["after the write"])
@@ -0,0 +1,120 @@
+"""Session verification and caching tests for Part 4."""
+
+from __future__ import annotations
+
+import time
+
+import jwt
+
+from app.services.backend import BackendResponse
+from app.services.sessions import SessionVerifier
+from conftest import JWT_SECRET, FakeBackendClient
+
+
+def _token(sub: str = "user-9", is_admin: bool = False, expires_in: int = 900, **claims) -> str:
+    payload = {
+        "sub": sub,
+        "is_admin": is_admin,
+        "type": "access",
+        "exp": int(time.time()) + expires_in,
+        **claims,
+    }
+    return jwt.encode(payload, JWT_SECRET, algorithm="HS256")
+
+
+def _protected_calls(app) -> int:
+    return sum(
+        1 for call in app.extensions["backend_client"].calls if call["path"] == "/auth/protected"
+    )
+
+
+def test_session_is_read_from_locally_verified_claims(jwt_app):
+    client = jwt_app.test_client()
+    client.set_cookie("token", _token(is_admin=True))
+
+    session = client.get("/api/session")
+    admin_page = client.get("/admin/users")
+
+    assert session.get_json() == {"logged_in": True, "user_id": "user-9", "is_admin": True}
+    assert admin_page.status_code == 200
+    assert _protected_calls(jwt_app) == 0
+
+
+def test_forged_expired_and_refresh_tokens_are_anonymous(jwt_app):
+    forged = jwt.encode(
+        {"sub": "user-9", "is_admin": True, "exp": int(time.time()) + 900},
+        "wrong-secret",
+        algorithm="HS256",
+    )
+    for token in (forged, _token(expires_in=-10), _token(type="refresh"), "token-123"):
+        client = jwt_app.test_client()
+        client.set_cookie("token", token)
+        assert client.get("/api/session").get_json()["logged_in"] is False
+        assert client.get("/admin/users").status_code == 302
+
+    assert _protected_calls(jwt_app) == 0
+
+
+def test_login_verifies_the_issued_token_without_a_second_backend_call(jwt_app):
+    token = _token(sub="user-1")
+
+    class LocalLoginBackend(FakeBackendClient):
+        def request(self, method, path, **kwargs):
+            if method == "POST" and path == "/auth/login":
+                self.calls.append({"method": method, "path": path})
+                return BackendResponse(200, {"access_token": token})
+            return super().request(method, path, **kwargs)
+
+    backend = LocalLoginBackend()
+    jwt_app.extensions["backend_client"] = backend
+
+    response = jwt_app.test_client().post(
+        "/api/session/login",
+        json={"email": "user@example.com", "password": "secret123"},
+    )
+
+    assert response.get_json() == {
+        "access_token": token,
+        "logged_in": True,
+        "user_id": "user-1",
+        "is_admin": False,
+    }
+    assert [call["path"] for call in backend.calls] == ["/auth/login"]
+
+
+def test_remote_sessions_are_cached_by_token_and_forgotten_on_logout(app):
+    client = app.test_client()
+    client.set_cookie("token", "token-123")
+
+    first = client.get("/api/session").get_json()
+    second = client.get("/api/session").get_json()
+    client.post("/api/session/logout")
+    client.set_cookie("token", "token-123")
+    client.get("/api/session")
+
+    assert first == second == {"logged_in": True, "user_id": "user-1", "is_admin": False}
+    assert _protected_calls(app) == 2
+    assert app.extensions["session_verifier"].stats()["hits"] == 1
+
+
+def test_cached_sessions_expire_with_the_token_and_respect_the_size_bound():
+    now = [1000.0]
+    verifier = SessionVerifier(
+        key=JWT_SECRET,
+        ttl=60,
+        max_entries=2,
+        wall_clock=time.time,
+        clock=lambda: now[0],
+    )
+    short_lived = _token(expires_in=5)
+
+    assert verifier.session_for(short_lived, None)["user_id"] == "user-9"
+    assert verifier.session_for(short_lived, None)["user_id"] == "user-9"
+    now[0] += 6
+    verifier.session_for(short_lived, None)
+    assert verifier.stats()["hits"] == 1
+    assert verifier.stats()["misses"] == 2
+
+    for index in range(3):
+        verifier.session_for(_token(sub=f"user-{index}"), None)
+    assert verifier.stats()["entries"] == 2
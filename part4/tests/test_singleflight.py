@@ -0,0 +1,105 @@
+"""Single-flight coalescing tests for Part 4."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.services.singleflight import SingleFlight
+
+
+def _run_follower(flight, key, results, timeout=2.0):
+    def follow():
+        try:
+            results.append(flight.do(key, lambda: "follower ran", timeout=timeout))
+        except Exception as exc:
+            results.append(exc)
+
+    thread = threading.Thread(target=follow)
+    thread.start()
+    return thread
+
+
+def _wait_for_waiter(flight, count=1):
+    while flight.stats()["coalesced"] < count:
+        threading.Event().wait(0.001)
+
+
+def test_followers_receive_the_leader_result():
+    flight = SingleFlight()
+    release = threading.Event()
+    results = []
+
+    def leader():
+        results.append(flight.do("key", lambda: release.wait(2) and "shared"))
+
+    leader_thread = threading.Thread(target=leader)
+    leader_thread.start()
+    while flight.stats()["in_flight"] == 0:
+        threading.Event().wait(0.001)
+    followers = [_run_follower(flight, "key", results) for _ in range(3)]
+    _wait_for_waiter(flight, 3)
+    release.set()
+    for thread in [leader_thread, *followers]:
+        thread.join()
+
+    assert results == ["shared"] * 4
+    assert flight.stats() == {
+        "calls": 1,
+        "coalesced": 3,
+        "errors": 0,
+        "timeouts": 0,
+        "in_flight": 0,
+    }
+
+
+def test_leader_errors_propagate_to_followers_and_the_key_is_released():
+    flight = SingleFlight()
+    release = threading.Event()
+    results = []
+
+    def failing():
+        release.wait(2)
+        raise ValueError("backend exploded")
+
+    leader_thread = threading.Thread(target=lambda: results.append(_capture(flight, failing)))
+    leader_thread.start()
+    while flight.stats()["in_flight"] == 0:
+        threading.Event().wait(0.001)
+    follower = _run_follower(flight, "key", results)
+    _wait_for_waiter(flight)
+    release.set()
+    leader_thread.join()
+    follower.join()
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert flight.do("key", lambda: "recovered") == "recovered"
+    assert flight.stats()["errors"] == 1
+
+
+def test_followers_time_out_without_cancelling_the_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    results = []
+
+    leader_thread = threading.Thread(
+        target=lambda: results.append(flight.do("key", lambda: release.wait(2) and "late"))
+    )
+    leader_thread.start()
+    while flight.stats()["in_flight"] == 0:
+        threading.Event().wait(0.001)
+    with pytest.raises(TimeoutError):
+        flight.do("key", lambda: "unused", timeout=0.01)
+    release.set()
+    leader_thread.join()
+
+    assert results == ["late"]
+    assert flight.stats()["timeouts"] == 1
+
+
+def _capture(flight, function):
+    try:
+        return flight.do("key", function)
+    except Exception as exc:
+        return exc